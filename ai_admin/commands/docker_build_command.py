@@ -4,7 +4,7 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker build command for building images from Dockerfiles.
 
@@ -12,10 +12,11 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -42,6 +43,7 @@ class DockerBuildCommand(BaseUnifiedCommand):
         no_cache: bool = False,
         pull: bool = False,
         quiet: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -55,6 +57,7 @@ class DockerBuildCommand(BaseUnifiedCommand):
             no_cache: Don't use cache
             pull: Pull base images
             quiet: Suppress build output
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -75,6 +78,7 @@ class DockerBuildCommand(BaseUnifiedCommand):
             no_cache=no_cache,
             pull=pull,
             quiet=quiet,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -96,12 +100,13 @@ class DockerBuildCommand(BaseUnifiedCommand):
         no_cache: bool = False,
         pull: bool = False,
         quiet: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Build Docker image."""
         try:
             # Build Docker command
-            cmd = ["docker", "build"]
+            cmd = [DOCKER_BIN, "build"]
 
             # Add options
             if tag:
@@ -128,12 +133,12 @@ class DockerBuildCommand(BaseUnifiedCommand):
             cmd.append(context_path)
 
             # Execute build command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=600)
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to build Docker image: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to build Docker image: {stderr}")
 
-            return {
+            response = {
                 "message": "Docker image built successfully",
                 "dockerfile_path": dockerfile_path,
                 "tag": tag,
@@ -142,11 +147,13 @@ class DockerBuildCommand(BaseUnifiedCommand):
                 "no_cache": no_cache,
                 "pull": pull,
                 "quiet": quiet,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker build command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker build failed: {str(e)}")
@@ -191,6 +198,11 @@ class DockerBuildCommand(BaseUnifiedCommand):
                     "description": "Suppress build output",
                     "default": False,
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -1,6 +1,6 @@
 """Docker containers list and management command."""
 
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker containers listing command.
 
@@ -8,11 +8,12 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
 import json
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -42,6 +43,7 @@ class DockerContainersCommand(BaseUnifiedCommand):
         filter_before: Optional[str] = None,
         filter_since: Optional[str] = None,
         filter_label: Optional[Dict[str, str]] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -58,6 +60,7 @@ class DockerContainersCommand(BaseUnifiedCommand):
             filter_before: Filter containers created before this container
             filter_since: Filter containers created since this container
             filter_label: Filter by label
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -75,6 +78,7 @@ class DockerContainersCommand(BaseUnifiedCommand):
             filter_before=filter_before,
             filter_since=filter_since,
             filter_label=filter_label,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -99,12 +103,13 @@ class DockerContainersCommand(BaseUnifiedCommand):
         filter_before: Optional[str] = None,
         filter_since: Optional[str] = None,
         filter_label: Optional[Dict[str, str]] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """List Docker containers."""
         try:
             # Build Docker command
-            cmd = ["docker", "ps"]
+            cmd = [DOCKER_BIN, "ps"]
 
             # Add options
             if all_containers:
@@ -141,27 +146,27 @@ class DockerContainersCommand(BaseUnifiedCommand):
                     cmd.extend(["--filter", f"label={key}={value}"])
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=30)
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to list Docker containers: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to list Docker containers: {stderr}")
 
             # Parse output
             containers = []
             if format_output == "json" or quiet:
                 try:
                     containers = (
-                        json.loads(result.stdout) if result.stdout.strip() else []
+                        json.loads(stdout) if stdout.strip() else []
                     )
                 except json.JSONDecodeError:
                     containers = [
                         {"id": line.strip()}
-                        for line in result.stdout.strip().split("\n")
+                        for line in stdout.strip().split("\n")
                         if line.strip()
                     ]
             else:
                 # Parse table format
-                lines = result.stdout.strip().split("\n")
+                lines = stdout.strip().split("\n")
                 if len(lines) > 1:
                     headers = lines[0].split()
                     for line in lines[1:]:
@@ -171,7 +176,7 @@ class DockerContainersCommand(BaseUnifiedCommand):
                                 container = dict(zip(headers, parts))
                                 containers.append(container)
 
-            return {
+            response = {
                 "message": f"Found {len(containers)} Docker containers",
                 "containers": containers,
                 "count": len(containers),
@@ -186,11 +191,13 @@ class DockerContainersCommand(BaseUnifiedCommand):
                     "since": filter_since,
                     "label": filter_label,
                 },
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker containers command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker containers listing failed: {str(e)}")
@@ -247,6 +254,11 @@ class DockerContainersCommand(BaseUnifiedCommand):
                     "additionalProperties": {"type": "string"},
                     "description": "Filter by label",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -1,6 +1,6 @@
 """Docker cp (copy) command for container files."""
 
-from ai_admin.core.custom_exceptions import CustomError, FileNotFoundError
+from ai_admin.core.custom_exceptions import CustomError, FileNotFoundError, DockerError
 
 """Docker copy command for copying files between host and container.
 
@@ -8,10 +8,11 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -29,6 +30,7 @@ class DockerCpCommand(BaseUnifiedCommand):
         self,
         source: str,
         destination: str,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -37,6 +39,7 @@ class DockerCpCommand(BaseUnifiedCommand):
         Args:
             source: Source path (host path or container:path)
             destination: Destination path (host path or container:path)
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -52,6 +55,7 @@ class DockerCpCommand(BaseUnifiedCommand):
         return await super().execute(
             source=source,
             destination=destination,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -68,28 +72,31 @@ class DockerCpCommand(BaseUnifiedCommand):
         self,
         source: str,
         destination: str,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Copy files between host and container."""
         try:
             # Build Docker command
-            cmd = ["docker", "cp", source, destination]
+            cmd = [DOCKER_BIN, "cp", source, destination]
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=60)
 
-            if result.returncode != 0:
-                raise FileNotFoundError(f"Failed to copy files: {result.stderr}")
+            if returncode != 0:
+                raise FileNotFoundError(f"Failed to copy files: {stderr}")
 
-            return {
+            response = {
                 "message": f"Files copied from '{source}' to '{destination}'",
                 "source": source,
                 "destination": destination,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker cp command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker cp failed: {str(e)}")
@@ -108,6 +115,11 @@ class DockerCpCommand(BaseUnifiedCommand):
                     "type": "string",
                     "description": "Destination path (host path or container:path)",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
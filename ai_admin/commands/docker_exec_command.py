@@ -1,6 +1,6 @@
 """Docker exec command for running commands in containers."""
 
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker exec command for executing commands in containers.
 
@@ -8,10 +8,11 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -38,6 +39,7 @@ class DockerExecCommand(BaseUnifiedCommand):
         detach: bool = False,
         interactive: bool = False,
         tty: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -52,6 +54,7 @@ class DockerExecCommand(BaseUnifiedCommand):
             detach: Run in background
             interactive: Keep STDIN open
             tty: Allocate a pseudo-TTY
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -73,6 +76,7 @@ class DockerExecCommand(BaseUnifiedCommand):
             detach=detach,
             interactive=interactive,
             tty=tty,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -95,12 +99,13 @@ class DockerExecCommand(BaseUnifiedCommand):
         detach: bool = False,
         interactive: bool = False,
         tty: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Execute command in container."""
         try:
             # Build Docker command
-            cmd = ["docker", "exec"]
+            cmd = [DOCKER_BIN, "exec"]
 
             # Add options
             if user:
@@ -127,14 +132,14 @@ class DockerExecCommand(BaseUnifiedCommand):
             cmd.extend(command.split())
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=60)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 raise CustomError(
-                    f"Failed to execute command in container: {result.stderr}"
+                    f"Failed to execute command in container: {stderr}"
                 )
 
-            return {
+            response = {
                 "message": f"Command executed in container '{container}'",
                 "container": container,
                 "command": command,
@@ -144,11 +149,14 @@ class DockerExecCommand(BaseUnifiedCommand):
                 "detach": detach,
                 "interactive": interactive,
                 "tty": tty,
-                "raw_output": result.stdout,
-                "command_executed": " ".join(cmd),
+                "output": stdout,
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command_executed"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker exec command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker exec failed: {str(e)}")
@@ -195,6 +203,11 @@ class DockerExecCommand(BaseUnifiedCommand):
                     "description": "Allocate a pseudo-TTY",
                     "default": False,
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -12,6 +12,7 @@ import requests
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import json_loads
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -94,7 +95,7 @@ class DockerHubImageInfoCommand(BaseUnifiedCommand):
             response = requests.get(api_url, timeout=30)
             response.raise_for_status()
 
-            repo_data = response.json()
+            repo_data = json_loads(response.content)
 
             # Get tag information
             tags_url = f"{api_url}/tags/{tag}"
@@ -102,7 +103,7 @@ class DockerHubImageInfoCommand(BaseUnifiedCommand):
 
             tag_data = None
             if tag_response.status_code == 200:
-                tag_data = tag_response.json()
+                tag_data = json_loads(tag_response.content)
 
             # Build result
             result = {
@@ -8,12 +8,23 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import requests
+import asyncio
+import math
 from typing import Dict, Any, Optional, List
-from mcp_proxy_adapter.commands.result import SuccessResult
+
+import aiohttp
+from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_HUB_API, json_loads
+from ai_admin.commands.http_utils import get_http_session, read_body
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+# Docker Hub returns at most this many repositories per page
+HUB_MAX_PAGE_SIZE = 100
+
+# Upper bound on pages fetched for a single listing
+HUB_MAX_PAGES = 3
+
 
 class DockerHubImagesCommand(BaseUnifiedCommand):
     """View and search Docker images in Docker Hub.
@@ -52,6 +63,12 @@ class DockerHubImagesCommand(BaseUnifiedCommand):
         Returns:
             Success result with images information
         """
+        # Validate inputs
+        if limit < 1:
+            return ErrorResult(
+                message="Limit must be at least 1", code="VALIDATION_ERROR"
+            )
+
         # Use unified security approach
         return await super().execute(
             query=query,
@@ -83,27 +100,41 @@ class DockerHubImagesCommand(BaseUnifiedCommand):
         """List Docker Hub images."""
         try:
             # Docker Hub API endpoint
+            page_size = min(limit, HUB_MAX_PAGE_SIZE)
+            params: Dict[str, Any] = {"page_size": page_size}
             if query:
-                api_url = f"https://hub.docker.com/v2/search/repositories/?q={query}&page_size={limit}"
+                api_url = f"{DOCKER_HUB_API}/search/repositories/"
+                params["q"] = query
             elif username:
-                api_url = f"https://hub.docker.com/v2/repositories/{username}/?page_size={limit}"
+                api_url = f"{DOCKER_HUB_API}/repositories/{username}/"
             else:
-                api_url = f"https://hub.docker.com/v2/repositories/?page_size={limit}"
+                api_url = f"{DOCKER_HUB_API}/repositories/"
 
             # Add filters
             if official_only:
-                api_url += "&is_official=true"
-
-            # Make request
-            response = requests.get(api_url, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
+                params["is_official"] = "true"
+
+            data = await self._fetch_page(api_url, params, 1)
+            repos = list(data.get("results", []))
+
+            # Limits above one page need further pages; they are independent,
+            # so fetch them together rather than one after another
+            wanted = min(limit, data.get("count", 0))
+            pages = min(math.ceil(wanted / page_size), HUB_MAX_PAGES)
+            if data.get("next") and pages > 1:
+                more = await asyncio.gather(
+                    *(
+                        self._fetch_page(api_url, params, page)
+                        for page in range(2, pages + 1)
+                    )
+                )
+                for page_data in more:
+                    repos.extend(page_data.get("results", []))
 
             # Process results
             images = []
-            if "results" in data:
-                for repo in data["results"]:
+            if repos:
+                for repo in repos[:limit]:
                     image_info = {
                         "name": repo.get("name"),
                         "namespace": repo.get("namespace"),
@@ -128,11 +159,21 @@ class DockerHubImagesCommand(BaseUnifiedCommand):
                 "total_count": data.get("count", 0),
             }
 
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise CustomError(f"Failed to retrieve Docker Hub images: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker Hub images listing failed: {str(e)}")
 
+    async def _fetch_page(
+        self, api_url: str, params: Dict[str, Any], page: int
+    ) -> Dict[str, Any]:
+        """Fetch one page of a Docker Hub listing over the shared session."""
+        async with get_http_session().get(
+            api_url, params={**params, "page": page}
+        ) as response:
+            response.raise_for_status()
+            return json_loads(await read_body(response))
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker Hub images command parameters."""
@@ -155,6 +196,7 @@ class DockerHubImagesCommand(BaseUnifiedCommand):
                     "type": "integer",
                     "description": "Maximum number of results",
                     "default": 25,
+                    "minimum": 1,
                 },
                 "official_only": {
                     "type": "boolean",
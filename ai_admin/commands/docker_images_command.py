@@ -1,6 +1,6 @@
 """Docker images list command."""
 
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker images listing command.
 
@@ -8,11 +8,12 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
 import json
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -38,6 +39,7 @@ class DockerImagesCommand(BaseUnifiedCommand):
         no_trunc: bool = False,
         format_output: str = "table",
         filter_dangling: Optional[bool] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -50,6 +52,7 @@ class DockerImagesCommand(BaseUnifiedCommand):
             no_trunc: Don't truncate output
             format_output: Output format (table, json, etc.)
             filter_dangling: Filter dangling images
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -63,6 +66,7 @@ class DockerImagesCommand(BaseUnifiedCommand):
             no_trunc=no_trunc,
             format_output=format_output,
             filter_dangling=filter_dangling,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -83,12 +87,13 @@ class DockerImagesCommand(BaseUnifiedCommand):
         no_trunc: bool = False,
         format_output: str = "table",
         filter_dangling: Optional[bool] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """List Docker images."""
         try:
             # Build Docker command
-            cmd = ["docker", "images"]
+            cmd = [DOCKER_BIN, "images"]
 
             # Add options
             if all_images:
@@ -118,25 +123,25 @@ class DockerImagesCommand(BaseUnifiedCommand):
                 cmd.append(repository)
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=30)
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to list Docker images: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to list Docker images: {stderr}")
 
             # Parse output
             images = []
             if format_output == "json" or quiet:
                 try:
-                    images = json.loads(result.stdout) if result.stdout.strip() else []
+                    images = json.loads(stdout) if stdout.strip() else []
                 except json.JSONDecodeError:
                     images = [
                         {"id": line.strip()}
-                        for line in result.stdout.strip().split("\n")
+                        for line in stdout.strip().split("\n")
                         if line.strip()
                     ]
             else:
                 # Parse table format
-                lines = result.stdout.strip().split("\n")
+                lines = stdout.strip().split("\n")
                 if len(lines) > 1:
                     headers = lines[0].split()
                     for line in lines[1:]:
@@ -146,7 +151,7 @@ class DockerImagesCommand(BaseUnifiedCommand):
                                 image = dict(zip(headers, parts))
                                 images.append(image)
 
-            return {
+            response = {
                 "message": f"Found {len(images)} Docker images",
                 "images": images,
                 "count": len(images),
@@ -155,11 +160,13 @@ class DockerImagesCommand(BaseUnifiedCommand):
                 "quiet": quiet,
                 "format_output": format_output,
                 "filter_dangling": filter_dangling,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker images command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker images listing failed: {str(e)}")
@@ -198,6 +205,11 @@ class DockerImagesCommand(BaseUnifiedCommand):
                     "type": "boolean",
                     "description": "Filter dangling images",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
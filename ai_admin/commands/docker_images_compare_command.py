@@ -1,7 +1,7 @@
 """Docker images compare command."""
 
 from mcp_proxy_adapter.commands.result import SuccessResult
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker images comparison command.
 
@@ -9,11 +9,11 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
 import requests
 import json
 from typing import Dict, Any, Optional, List
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -81,23 +81,21 @@ class DockerImagesCompareCommand(BaseUnifiedCommand):
         """Compare local and remote Docker images."""
         try:
             # Get local images
-            local_cmd = ["docker", "images", "--format", "json"]
+            local_cmd = [DOCKER_BIN, "images", "--format", "json"]
             if include_dangling:
                 local_cmd.append("-a")
 
             if image_name:
                 local_cmd.append(image_name)
 
-            local_result = subprocess.run(
-                local_cmd, capture_output=True, text=True, timeout=30
-            )
+            returncode, stdout, stderr = await run_docker(local_cmd, timeout=30)
 
-            if local_result.returncode != 0:
-                raise CustomError(f"Failed to get local images: {local_result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to get local images: {stderr}")
 
             # Parse local images
             local_images = []
-            for line in local_result.stdout.strip().split("\n"):
+            for line in stdout.strip().split("\n"):
                 if line.strip():
                     try:
                         local_images.append(json.loads(line))
@@ -158,7 +156,7 @@ class DockerImagesCompareCommand(BaseUnifiedCommand):
                 "include_dangling": include_dangling,
             }
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker images comparison timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker images comparison failed: {str(e)}")
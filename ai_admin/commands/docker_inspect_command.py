@@ -1,6 +1,6 @@
 """Docker inspect command for container/image details."""
 
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker inspect command for getting detailed object information.
 
@@ -8,11 +8,12 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
 import json
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -36,6 +37,7 @@ class DockerInspectCommand(BaseUnifiedCommand):
         type_filter: Optional[str] = None,
         format_output: Optional[str] = None,
         size: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -46,6 +48,7 @@ class DockerInspectCommand(BaseUnifiedCommand):
             type_filter: Type of object (container, image, network, volume)
             format_output: Output format (json, go template)
             size: Include size information
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -61,6 +64,7 @@ class DockerInspectCommand(BaseUnifiedCommand):
             type_filter=type_filter,
             format_output=format_output,
             size=size,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -79,12 +83,13 @@ class DockerInspectCommand(BaseUnifiedCommand):
         type_filter: Optional[str] = None,
         format_output: Optional[str] = None,
         size: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Inspect Docker object."""
         try:
             # Build Docker command
-            cmd = ["docker", "inspect"]
+            cmd = [DOCKER_BIN, "inspect"]
 
             # Add options
             if type_filter:
@@ -100,34 +105,36 @@ class DockerInspectCommand(BaseUnifiedCommand):
             cmd.append(name)
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=30)
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to inspect Docker object: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to inspect Docker object: {stderr}")
 
             # Parse output
             try:
                 if format_output:
                     # Custom format output
-                    parsed_output = result.stdout.strip()
+                    parsed_output = stdout.strip()
                 else:
                     # JSON output
-                    parsed_output = json.loads(result.stdout)
+                    parsed_output = json.loads(stdout)
             except json.JSONDecodeError:
-                parsed_output = result.stdout.strip()
+                parsed_output = stdout.strip()
 
-            return {
+            response = {
                 "message": f"Inspected Docker object '{name}'",
                 "name": name,
                 "type_filter": type_filter,
                 "format_output": format_output,
                 "size": size,
                 "inspection_data": parsed_output,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker inspect command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker inspect failed: {str(e)}")
@@ -156,6 +163,11 @@ class DockerInspectCommand(BaseUnifiedCommand):
                     "description": "Include size information",
                     "default": False,
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -1,7 +1,7 @@
 """Docker login command for registry authentication."""
 
 from mcp_proxy_adapter.commands.result import SuccessResult
-from ai_admin.core.custom_exceptions import AuthenticationError
+from ai_admin.core.custom_exceptions import AuthenticationError, DockerError
 
 """Docker login command for registry authentication.
 
@@ -9,9 +9,10 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
+import shlex
 from typing import Dict, Any, Optional, List
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -37,6 +38,7 @@ class DockerLoginCommand(BaseUnifiedCommand):
         token: Optional[str] = None,
         registry: str = "https://index.docker.io/v1/",
         email: Optional[str] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -48,6 +50,7 @@ class DockerLoginCommand(BaseUnifiedCommand):
             token: Access token for authentication
             registry: Registry URL
             email: Email address (for some registries)
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -60,6 +63,7 @@ class DockerLoginCommand(BaseUnifiedCommand):
             token=token,
             registry=registry,
             email=email,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -79,12 +83,13 @@ class DockerLoginCommand(BaseUnifiedCommand):
         token: Optional[str] = None,
         registry: str = "https://index.docker.io/v1/",
         email: Optional[str] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Login to Docker registry."""
         try:
             # Build Docker command
-            cmd = ["docker", "login"]
+            cmd = [DOCKER_BIN, "login"]
 
             # Add registry
             if registry != "https://index.docker.io/v1/":
@@ -105,24 +110,31 @@ class DockerLoginCommand(BaseUnifiedCommand):
                 cmd.extend(["-p", token])
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=30)
 
-            if result.returncode != 0:
+            if returncode != 0:
                 raise AuthenticationError(
-                    f"Failed to login to Docker registry: {result.stderr}"
+                    f"Failed to login to Docker registry: {stderr}"
                 )
 
-            return {
+            response = {
                 "message": f"Successfully logged into Docker registry '{registry}'",
                 "registry": registry,
                 "username": username,
                 "email": email,
                 "has_token": bool(token),
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
-
-        except subprocess.TimeoutExpired as e:
+            if debug:
+                # Never echo the secret that follows -p
+                shown = [
+                    "****" if i and cmd[i - 1] == "-p" else arg
+                    for i, arg in enumerate(cmd)
+                ]
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(shown)
+            return response
+
+        except DockerError as e:
             raise AuthenticationError(f"Docker login command timed out: {str(e)}")
         except AuthenticationError as e:
             raise AuthenticationError(f"Docker login failed: {str(e)}")
@@ -154,6 +166,11 @@ class DockerLoginCommand(BaseUnifiedCommand):
                     "type": "string",
                     "description": "Email address (for some registries)",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
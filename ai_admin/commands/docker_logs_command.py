@@ -1,16 +1,18 @@
 """Docker logs command for container output."""
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 """Docker logs command for viewing container logs.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
+
 class DockerLogsCommand(BaseUnifiedCommand):
     """View Docker container logs."""
 
@@ -28,6 +30,7 @@ class DockerLogsCommand(BaseUnifiedCommand):
         since: Optional[str] = None,
         until: Optional[str] = None,
         timestamps: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -40,6 +43,7 @@ class DockerLogsCommand(BaseUnifiedCommand):
             since: Show logs since timestamp
             until: Show logs until timestamp
             timestamps: Show timestamps
+            debug: Include the docker command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -57,6 +61,7 @@ class DockerLogsCommand(BaseUnifiedCommand):
             since=since,
             until=until,
             timestamps=timestamps,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -77,12 +82,13 @@ class DockerLogsCommand(BaseUnifiedCommand):
         since: Optional[str] = None,
         until: Optional[str] = None,
         timestamps: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Get Docker container logs."""
         try:
             # Build Docker command
-            cmd = ["docker", "logs"]
+            cmd = [DOCKER_BIN, "logs"]
 
             # Add options
             if follow:
@@ -104,12 +110,12 @@ class DockerLogsCommand(BaseUnifiedCommand):
             cmd.append(container_name)
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=60)
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to get Docker logs: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to get Docker logs: {stderr}")
 
-            return {
+            response = {
                 "message": f"Retrieved logs for container '{container_name}'",
                 "container_name": container_name,
                 "follow": follow,
@@ -117,11 +123,13 @@ class DockerLogsCommand(BaseUnifiedCommand):
                 "since": since,
                 "until": until,
                 "timestamps": timestamps,
-                "logs": result.stdout,
-                "command": " ".join(cmd),
+                "logs": stdout,
             }
+            if debug:
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker logs command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker logs failed: {str(e)}")
@@ -158,6 +166,11 @@ class DockerLogsCommand(BaseUnifiedCommand):
                     "description": "Show timestamps",
                     "default": False,
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include the docker command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
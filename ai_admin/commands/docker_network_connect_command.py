@@ -1,15 +1,17 @@
 """Docker network connect command."""
-from ai_admin.core.custom_exceptions import NetworkError
+from ai_admin.core.custom_exceptions import DockerError, NetworkError
 """Docker network connect command.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, invalidate, run_docker
+from ai_admin.docker import get_engine_client
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 class DockerNetworkConnectCommand(BaseUnifiedCommand):
@@ -28,6 +30,7 @@ class DockerNetworkConnectCommand(BaseUnifiedCommand):
         container_name: str,
         ip_address: Optional[str] = None,
         alias: Optional[str] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -38,6 +41,7 @@ class DockerNetworkConnectCommand(BaseUnifiedCommand):
             container_name: Name of the container to connect
             ip_address: IP address for the container in the network
             alias: Network alias for the container
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -53,6 +57,7 @@ class DockerNetworkConnectCommand(BaseUnifiedCommand):
             container_name=container_name,
             ip_address=ip_address,
             alias=alias,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -71,73 +76,111 @@ class DockerNetworkConnectCommand(BaseUnifiedCommand):
         container_name: str,
         ip_address: Optional[str] = None,
         alias: Optional[str] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Connect container to Docker network."""
         try:
-            # Build Docker command
-            cmd = ["docker", "network", "connect"]
-
-            # Add options
-            if ip_address:
-                cmd.extend(["--ip", ip_address])
-
-            if alias:
-                cmd.extend(["--alias", alias])
-
-            # Add network and container names
-            cmd.append(network_name)
-            cmd.append(container_name)
-
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise NetworkError(f"Failed to connect container to network: {result.stderr}")
-
-            return {
+            engine = get_engine_client()
+            if engine.available:
+                # Talk to the daemon socket directly, no docker CLI fork
+                endpoint_config = {}
+                if ip_address:
+                    endpoint_config["IPAMConfig"] = {"IPv4Address": ip_address}
+                if alias:
+                    endpoint_config["Aliases"] = [alias]
+
+                await engine.request(
+                    "POST",
+                    "/networks/{}/connect",
+                    segments=(network_name,),
+                    body={
+                        "Container": container_name,
+                        "EndpointConfig": endpoint_config,
+                    },
+                )
+                raw_output = ""
+                command = f"POST /networks/{network_name}/connect"
+            else:
+                # Build Docker command
+                cmd = [DOCKER_BIN, "network", "connect"]
+
+                # Add options
+                if ip_address:
+                    cmd.extend(["--ip", ip_address])
+
+                if alias:
+                    cmd.extend(["--alias", alias])
+
+                # Add network and container names
+                cmd.append(network_name)
+                cmd.append(container_name)
+
+                # Execute command
+                returncode, raw_output, stderr = await run_docker(cmd, timeout=30)
+
+                if returncode != 0:
+                    raise NetworkError(
+                        f"Failed to connect container to network: {stderr}"
+                    )
+
+                command = shlex.join(cmd) if debug else None
+
+            # Network topology changed, drop cached ls/inspect results
+            invalidate()
+
+            response = {
                 "message": f"Connected container '{container_name}' to network '{network_name}'",
                 "network_name": network_name,
                 "container_name": container_name,
                 "ip_address": ip_address,
                 "alias": alias,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = raw_output
+                response["command"] = command
+            return response
 
-        except subprocess.TimeoutExpired as e:
-            raise NetworkError(f"Docker network connect command timed out: {str(e)}")
+        except DockerError as e:
+            raise NetworkError(f"Docker network connect failed: {str(e)}")
         except NetworkError as e:
             raise NetworkError(f"Docker network connect failed: {str(e)}")
 
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "network_name": {
+                "type": "string",
+                "description": "Name of the Docker network",
+            },
+            "container_name": {
+                "type": "string",
+                "description": "Name of the container to connect",
+            },
+            "ip_address": {
+                "type": "string",
+                "description": "IP address for the container in the network",
+            },
+            "alias": {
+                "type": "string",
+                "description": "Network alias for the container",
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw docker output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["network_name", "container_name"],
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker network connect command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "network_name": {
-                    "type": "string",
-                    "description": "Name of the Docker network",
-                },
-                "container_name": {
-                    "type": "string",
-                    "description": "Name of the container to connect",
-                },
-                "ip_address": {
-                    "type": "string",
-                    "description": "IP address for the container in the network",
-                },
-                "alias": {
-                    "type": "string",
-                    "description": "Network alias for the container",
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["network_name", "container_name"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
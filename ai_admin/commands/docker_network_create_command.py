@@ -1,15 +1,17 @@
 """Docker network create command."""
-from ai_admin.core.custom_exceptions import NetworkError
+from ai_admin.core.custom_exceptions import DockerError, NetworkError
 """Docker network create command.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
-from typing import Dict, Any, Optional, List
+import shlex
+from typing import Dict, Any, Optional, List, Tuple
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.docker_utils import DOCKER_BIN, invalidate, run_docker
+from ai_admin.docker import get_engine_client
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 class DockerNetworkCreateCommand(BaseUnifiedCommand):
@@ -31,6 +33,7 @@ class DockerNetworkCreateCommand(BaseUnifiedCommand):
         internal: bool = False,
         ipv6: bool = False,
         labels: Optional[Dict[str, str]] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -44,6 +47,7 @@ class DockerNetworkCreateCommand(BaseUnifiedCommand):
             internal: Create internal network
             ipv6: Enable IPv6
             labels: Network labels
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -62,6 +66,7 @@ class DockerNetworkCreateCommand(BaseUnifiedCommand):
             internal=internal,
             ipv6=ipv6,
             labels=labels,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -83,45 +88,42 @@ class DockerNetworkCreateCommand(BaseUnifiedCommand):
         internal: bool = False,
         ipv6: bool = False,
         labels: Optional[Dict[str, str]] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Create Docker network."""
         try:
-            # Build Docker command
-            cmd = ["docker", "network", "create"]
-
-            # Add options
-            if driver != "bridge":
-                cmd.extend(["--driver", driver])
-
-            if subnet:
-                cmd.extend(["--subnet", subnet])
-
-            if gateway:
-                cmd.extend(["--gateway", gateway])
-
-            if internal:
-                cmd.append("--internal")
-
-            if ipv6:
-                cmd.append("--ipv6")
-
-            if labels:
-                for key, value in labels.items():
-                    cmd.extend(["--label", f"{key}={value}"])
-
-            # Add network name
-            cmd.append(network_name)
-
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise NetworkError(f"Failed to create Docker network: {result.stderr}")
-
-            network_id = result.stdout.strip()
-
-            return {
+            engine = get_engine_client()
+            if engine.available:
+                # Talk to the daemon socket directly, no docker CLI fork
+                body = {
+                    "Name": network_name,
+                    "Driver": driver,
+                    "Internal": internal,
+                    "EnableIPv6": ipv6,
+                    "Labels": labels or {},
+                }
+                if subnet or gateway:
+                    ipam_config = {}
+                    if subnet:
+                        ipam_config["Subnet"] = subnet
+                    if gateway:
+                        ipam_config["Gateway"] = gateway
+                    body["IPAM"] = {"Config": [ipam_config]}
+
+                created = await engine.request("POST", "/networks/create", body=body)
+                network_id = created["Id"]
+                raw_output = network_id
+                command = "POST /networks/create"
+            else:
+                network_id, raw_output, command = await self._create_network_cli(
+                    network_name, driver, subnet, gateway, internal, ipv6, labels
+                )
+
+            # Network topology changed, drop cached ls/inspect results
+            invalidate()
+
+            response = {
                 "message": f"Created Docker network '{network_name}'",
                 "network_name": network_name,
                 "network_id": network_id,
@@ -131,59 +133,113 @@ class DockerNetworkCreateCommand(BaseUnifiedCommand):
                 "internal": internal,
                 "ipv6": ipv6,
                 "labels": labels,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = raw_output
+                response["command"] = command
+            return response
 
-        except subprocess.TimeoutExpired as e:
-            raise NetworkError(f"Docker network create command timed out: {str(e)}")
+        except DockerError as e:
+            raise NetworkError(f"Docker network create failed: {str(e)}")
         except NetworkError as e:
             raise NetworkError(f"Docker network create failed: {str(e)}")
 
+    async def _create_network_cli(
+        self,
+        network_name: str,
+        driver: str,
+        subnet: Optional[str],
+        gateway: Optional[str],
+        internal: bool,
+        ipv6: bool,
+        labels: Optional[Dict[str, str]],
+    ) -> Tuple[str, str, str]:
+        """Create Docker network through the docker CLI."""
+        # Build Docker command
+        cmd = [DOCKER_BIN, "network", "create"]
+
+        # Add options
+        if driver != "bridge":
+            cmd.extend(["--driver", driver])
+
+        if subnet:
+            cmd.extend(["--subnet", subnet])
+
+        if gateway:
+            cmd.extend(["--gateway", gateway])
+
+        if internal:
+            cmd.append("--internal")
+
+        if ipv6:
+            cmd.append("--ipv6")
+
+        if labels:
+            for key, value in labels.items():
+                cmd.extend(["--label", f"{key}={value}"])
+
+        # Add network name
+        cmd.append(network_name)
+
+        # Execute command
+        returncode, stdout, stderr = await run_docker(cmd, timeout=30)
+
+        if returncode != 0:
+            raise NetworkError(f"Failed to create Docker network: {stderr}")
+
+        return stdout.strip(), stdout, shlex.join(cmd)
+
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "network_name": {
+                "type": "string",
+                "description": "Name of the network to create",
+            },
+            "driver": {
+                "type": "string",
+                "description": "Network driver",
+                "default": "bridge",
+            },
+            "subnet": {
+                "type": "string",
+                "description": "Subnet in CIDR format",
+            },
+            "gateway": {
+                "type": "string",
+                "description": "Gateway IP address",
+            },
+            "internal": {
+                "type": "boolean",
+                "description": "Create internal network",
+                "default": False,
+            },
+            "ipv6": {
+                "type": "boolean",
+                "description": "Enable IPv6",
+                "default": False,
+            },
+            "labels": {
+                "type": "object",
+                "additionalProperties": {"type": "string"},
+                "description": "Network labels",
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw docker output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["network_name"],
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker network create command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "network_name": {
-                    "type": "string",
-                    "description": "Name of the network to create",
-                },
-                "driver": {
-                    "type": "string",
-                    "description": "Network driver",
-                    "default": "bridge",
-                },
-                "subnet": {
-                    "type": "string",
-                    "description": "Subnet in CIDR format",
-                },
-                "gateway": {
-                    "type": "string",
-                    "description": "Gateway IP address",
-                },
-                "internal": {
-                    "type": "boolean",
-                    "description": "Create internal network",
-                    "default": False,
-                },
-                "ipv6": {
-                    "type": "boolean",
-                    "description": "Enable IPv6",
-                    "default": False,
-                },
-                "labels": {
-                    "type": "object",
-                    "additionalProperties": {"type": "string"},
-                    "description": "Network labels",
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["network_name"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
@@ -1,6 +1,6 @@
 """Docker network disconnect command."""
 
-from ai_admin.core.custom_exceptions import NetworkError
+from ai_admin.core.custom_exceptions import DockerError, NetworkError
 
 """Docker network disconnect command.
 
@@ -9,7 +9,7 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import shlex
 
 from typing import Dict, Any, Optional, List
 
@@ -17,6 +17,10 @@ from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import DOCKER_BIN, invalidate, run_docker
+
+from ai_admin.docker import get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -35,6 +39,7 @@ class DockerNetworkDisconnectCommand:
         network_name: str,
         container_name: str,
         force: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -44,6 +49,7 @@ class DockerNetworkDisconnectCommand:
             network_name: Name of the Docker network
             container_name: Name of the container to disconnect
             force: Force disconnection
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -61,6 +67,7 @@ class DockerNetworkDisconnectCommand:
             network_name=network_name,
             container_name=container_name,
             force=force,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -78,68 +85,97 @@ class DockerNetworkDisconnectCommand:
         network_name: str,
         container_name: str,
         force: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Disconnect container from Docker network."""
         try:
-            # Build Docker command
-            cmd = ["docker", "network", "disconnect"]
-
-            # Add options
-            if force:
-                cmd.append("--force")
+            engine = get_engine_client()
+            if engine.available:
+                # Talk to the daemon socket directly, no docker CLI fork
+                await engine.request(
+                    "POST",
+                    "/networks/{}/disconnect",
+                    segments=(network_name,),
+                    body={"Container": container_name, "Force": force},
+                )
+                stdout = ""
+                command = f"POST /networks/{network_name}/disconnect"
+            else:
+                # Build Docker command
+                cmd = [DOCKER_BIN, "network", "disconnect"]
+
+                # Add options
+                if force:
+                    cmd.append("--force")
+
+                # Add network and container names
+                cmd.append(network_name)
+                cmd.append(container_name)
+
+                # Output is only shown in debug mode
+                returncode, stdout, stderr = await run_docker(
+                    cmd, timeout=30, capture_stdout=debug
+                )
 
-            # Add network and container names
-            cmd.append(network_name)
-            cmd.append(container_name)
+                if returncode != 0:
+                    raise NetworkError(
+                        f"Failed to disconnect container from network: {stderr}"
+                    )
 
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                command = shlex.join(cmd) if debug else None
 
-            if result.returncode != 0:
-                raise NetworkError(
-                    f"Failed to disconnect container from network: {result.stderr}"
-                )
+            # Network topology changed, drop cached ls/inspect results
+            invalidate()
 
-            return {
+            response = {
                 "message": f"Disconnected container '{container_name}' from network '{network_name}'",
                 "network_name": network_name,
                 "container_name": container_name,
                 "force": force,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = command
+            return response
 
-        except subprocess.TimeoutExpired as e:
-            raise NetworkError(f"Docker network disconnect command timed out: {str(e)}")
+        except DockerError as e:
+            raise NetworkError(f"Docker network disconnect failed: {str(e)}")
         except NetworkError as e:
             raise NetworkError(f"Docker network disconnect failed: {str(e)}")
 
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "network_name": {
+                "type": "string",
+                "description": "Name of the Docker network",
+            },
+            "container_name": {
+                "type": "string",
+                "description": "Name of the container to disconnect",
+            },
+            "force": {
+                "type": "boolean",
+                "description": "Force disconnection",
+                "default": False,
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw docker output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["network_name", "container_name"],
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker network disconnect command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "network_name": {
-                    "type": "string",
-                    "description": "Name of the Docker network",
-                },
-                "container_name": {
-                    "type": "string",
-                    "description": "Name of the container to disconnect",
-                },
-                "force": {
-                    "type": "boolean",
-                    "description": "Force disconnection",
-                    "default": False,
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["network_name", "container_name"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
@@ -1,6 +1,6 @@
 """Docker network inspect command."""
 
-from ai_admin.core.custom_exceptions import NetworkError
+from ai_admin.core.custom_exceptions import DockerError, NetworkError
 
 """Docker network inspect command.
 
@@ -9,16 +9,24 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import shlex
 
-import json
-
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    cache_get,
+    cache_set,
+    json_loads,
+    run_docker,
+)
+
+from ai_admin.docker import get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -36,6 +44,7 @@ class DockerNetworkInspectCommand:
         self,
         network_name: str,
         format_output: Optional[str] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -44,6 +53,7 @@ class DockerNetworkInspectCommand:
         Args:
             network_name: Name of the network to inspect
             format_output: Output format (json, go template)
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -59,6 +69,7 @@ class DockerNetworkInspectCommand:
         return await super().execute(
             network_name=network_name,
             format_output=format_output,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -75,71 +86,111 @@ class DockerNetworkInspectCommand:
         self,
         network_name: str,
         format_output: Optional[str] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Inspect Docker network."""
         try:
-            # Build Docker command
-            cmd = ["docker", "network", "inspect"]
-
-            # Add format if specified
-            if format_output:
-                cmd.extend(["--format", format_output])
-
-            # Add network name
-            cmd.append(network_name)
-
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise NetworkError(f"Failed to inspect Docker network: {result.stderr}")
-
-            # Parse output
-            try:
-                if format_output:
-                    # Custom format output
-                    parsed_output = result.stdout.strip()
-                else:
-                    # JSON output
-                    parsed_output = json.loads(result.stdout)
-            except json.JSONDecodeError:
-                parsed_output = result.stdout.strip()
-
-            return {
+            engine = get_engine_client()
+            if engine.available and not format_output:
+                # Talk to the daemon socket directly, no docker CLI fork
+                cache_key = ("GET", "/networks", network_name)
+                network = cache_get(cache_key)
+                if network is None:
+                    network = await engine.request(
+                        "GET", "/networks/{}", segments=(network_name,)
+                    )
+                    cache_set(cache_key, network)
+                # Same shape as 'docker network inspect' output
+                parsed_output = [network]
+                stdout = None
+                command = f"GET /networks/{network_name}"
+            else:
+                parsed_output, stdout, cmd = await self._inspect_network_cli(
+                    network_name, format_output
+                )
+                command = shlex.join(cmd) if debug else None
+
+            response = {
                 "message": f"Inspected Docker network '{network_name}'",
                 "network_name": network_name,
                 "format_output": format_output,
                 "inspection_data": parsed_output,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = command
+            return response
 
-        except subprocess.TimeoutExpired as e:
-            raise NetworkError(f"Docker network inspect command timed out: {str(e)}")
+        except DockerError as e:
+            raise NetworkError(f"Docker network inspect failed: {str(e)}")
         except NetworkError as e:
             raise NetworkError(f"Docker network inspect failed: {str(e)}")
 
+    async def _inspect_network_cli(
+        self, network_name: str, format_output: Optional[str]
+    ) -> Tuple[Any, str, List[str]]:
+        """Inspect Docker network through the docker CLI."""
+        # Build Docker command
+        cmd = [DOCKER_BIN, "network", "inspect"]
+
+        # Add format if specified
+        if format_output:
+            cmd.extend(["--format", format_output])
+
+        # Add network name
+        cmd.append(network_name)
+
+        # Execute command, reusing a recent result for bursty polling
+        cache_key = tuple(cmd)
+        stdout = cache_get(cache_key)
+        if stdout is None:
+            returncode, stdout, stderr = await run_docker(cmd, timeout=30)
+
+            if returncode != 0:
+                raise NetworkError(f"Failed to inspect Docker network: {stderr}")
+
+            cache_set(cache_key, stdout)
+
+        # Parse output
+        try:
+            if format_output:
+                # Custom format output
+                parsed_output = stdout.strip()
+            else:
+                # JSON output
+                parsed_output = json_loads(stdout)
+        except ValueError:
+            parsed_output = stdout.strip()
+        return parsed_output, stdout, cmd
+
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "network_name": {
+                "type": "string",
+                "description": "Name of the network to inspect",
+            },
+            "format_output": {
+                "type": "string",
+                "description": "Output format (json, go template)",
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw docker output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["network_name"],
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker network inspect command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "network_name": {
-                    "type": "string",
-                    "description": "Name of the network to inspect",
-                },
-                "format_output": {
-                    "type": "string",
-                    "description": "Output format (json, go template)",
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["network_name"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
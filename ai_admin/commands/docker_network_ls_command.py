@@ -2,7 +2,7 @@
 
 from mcp_proxy_adapter.commands.result import SuccessResult
 
-from ai_admin.core.custom_exceptions import NetworkError
+from ai_admin.core.custom_exceptions import DockerError, NetworkError
 
 """Docker network list command.
 
@@ -11,14 +11,26 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import asyncio
 
 import json
 
-from typing import Dict, Any, Optional, List
+import shlex
+
+from typing import Dict, Any, Optional, List, Tuple
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    cache_get,
+    cache_set,
+    json_loads,
+    run_docker,
+)
+
+from ai_admin.docker import DockerEngineClient, get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -38,6 +50,8 @@ class DockerNetworkLsCommand:
         filter_network: Optional[str] = None,
         quiet: bool = False,
         no_trunc: bool = False,
+        detail: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -48,6 +62,8 @@ class DockerNetworkLsCommand:
             filter_network: Filter by network name
             quiet: Only display network IDs
             no_trunc: Don't truncate output
+            detail: Include full inspect data for every network
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -59,6 +75,8 @@ class DockerNetworkLsCommand:
             filter_network=filter_network,
             quiet=quiet,
             no_trunc=no_trunc,
+            detail=detail,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -77,60 +95,31 @@ class DockerNetworkLsCommand:
         filter_network: Optional[str] = None,
         quiet: bool = False,
         no_trunc: bool = False,
+        detail: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """List Docker networks."""
         try:
-            # Build Docker command
-            cmd = ["docker", "network", "ls"]
+            # Custom Go templates can only be rendered by the docker CLI
+            custom_template = format_output not in (None, "json", "table")
 
-            # Add options
-            if quiet:
-                cmd.append("-q")
-
-            if no_trunc:
-                cmd.append("--no-trunc")
-
-            # Add format
-            if format_output:
-                cmd.extend(["--format", format_output])
-
-            # Add filter
-            if filter_network:
-                cmd.extend(["--filter", f"name={filter_network}"])
-
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise NetworkError(f"Failed to list Docker networks: {result.stderr}")
-
-            # Parse output
-            networks = []
-            if format_output == "json" or quiet:
-                try:
-                    networks = (
-                        json.loads(result.stdout) if result.stdout.strip() else []
-                    )
-                except json.JSONDecodeError:
-                    networks = [
-                        {"id": line.strip()}
-                        for line in result.stdout.strip().split("\n")
-                        if line.strip()
-                    ]
+            engine = get_engine_client()
+            if engine.available and not custom_template:
+                # Talk to the daemon socket directly, no docker CLI fork
+                networks = await self._list_networks_api(
+                    engine, filter_network, quiet, no_trunc, detail
+                )
+                raw_output = None
+                command = "GET /networks"
             else:
-                # Parse table format
-                lines = result.stdout.strip().split("\n")
-                if len(lines) > 1:
-                    headers = lines[0].split()
-                    for line in lines[1:]:
-                        if line.strip():
-                            parts = line.split()
-                            if len(parts) >= len(headers):
-                                network = dict(zip(headers, parts))
-                                networks.append(network)
-
-            return {
+                networks, raw_output, cmd = await self._list_networks_cli(
+                    format_output, filter_network, quiet, no_trunc, detail
+                )
+                raw_output = raw_output if debug else None
+                command = shlex.join(cmd) if debug else None
+
+            response = {
                 "message": f"Found {len(networks)} Docker networks",
                 "networks": networks,
                 "count": len(networks),
@@ -138,44 +127,220 @@ class DockerNetworkLsCommand:
                 "filter_network": filter_network,
                 "quiet": quiet,
                 "no_trunc": no_trunc,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
+                "detail": detail,
             }
+            if debug:
+                response["raw_output"] = raw_output
+                response["command"] = command
+            if format_output == "table" and not quiet:
+                response["table"] = self._format_table(networks)
+            return response
 
-        except subprocess.TimeoutExpired as e:
-            raise NetworkError(f"Docker network ls command timed out: {str(e)}")
+        except DockerError as e:
+            raise NetworkError(f"Docker network ls failed: {str(e)}")
         except NetworkError as e:
             raise NetworkError(f"Docker network ls failed: {str(e)}")
 
+    async def _list_networks_api(
+        self,
+        engine: DockerEngineClient,
+        filter_network: Optional[str],
+        quiet: bool,
+        no_trunc: bool,
+        detail: bool,
+    ) -> List[Dict[str, Any]]:
+        """List Docker networks through the Docker Engine API."""
+        params = {}
+        if filter_network:
+            params["filters"] = json.dumps({"name": [filter_network]})
+
+        cache_key = ("GET", "/networks", params.get("filters"))
+        raw_networks = cache_get(cache_key)
+        if raw_networks is None:
+            raw_networks = await engine.request("GET", "/networks", params=params)
+            cache_set(cache_key, raw_networks)
+
+        networks = []
+        for net in raw_networks:
+            network_id = net["Id"] if no_trunc else net["Id"][:12]
+            if quiet:
+                networks.append({"id": network_id})
+                continue
+            # Same keys as 'docker network ls --format {{json .}}'
+            labels = net.get("Labels") or {}
+            networks.append(
+                {
+                    "ID": network_id,
+                    "Name": net.get("Name"),
+                    "Driver": net.get("Driver"),
+                    "Scope": net.get("Scope"),
+                    "IPv6": str(net.get("EnableIPv6", False)).lower(),
+                    "Internal": str(net.get("Internal", False)).lower(),
+                    "Labels": ",".join(f"{k}={v}" for k, v in labels.items()),
+                    "CreatedAt": net.get("Created"),
+                }
+            )
+
+        if detail and not quiet:
+            # The list endpoint omits attached containers, inspect each one
+            semaphore = asyncio.Semaphore(8)
+
+            async def inspect(network: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    try:
+                        data = await engine.request(
+                            "GET", "/networks/{}", segments=(network["ID"],)
+                        )
+                    except DockerError as e:
+                        # Removed since it was listed; leave it out
+                        if e.details.get("status") == 404:
+                            return None
+                        raise
+                return {**network, "detail": data}
+
+            inspected = await asyncio.gather(*(inspect(n) for n in networks))
+            networks = [network for network in inspected if network is not None]
+        return networks
+
+    async def _list_networks_cli(
+        self,
+        format_output: Optional[str],
+        filter_network: Optional[str],
+        quiet: bool,
+        no_trunc: bool,
+        detail: bool,
+    ) -> Tuple[List[Dict[str, Any]], str, List[str]]:
+        """List Docker networks through the docker CLI."""
+        # Build Docker command
+        cmd = [DOCKER_BIN, "network", "ls"]
+
+        # Add options
+        if quiet:
+            cmd.append("-q")
+
+        if no_trunc:
+            cmd.append("--no-trunc")
+
+        # Always request machine-readable output unless a custom Go
+        # template was given; table/json views are rendered from it
+        custom_template = format_output not in (None, "json", "table")
+        if custom_template:
+            cmd.extend(["--format", format_output])
+        elif not quiet:
+            cmd.extend(["--format", "{{json .}}"])
+
+        # Add filter
+        if filter_network:
+            cmd.extend(["--filter", f"name={filter_network}"])
+
+        # Execute command, reusing a recent result for bursty polling
+        cache_key = tuple(cmd)
+        stdout = cache_get(cache_key)
+        if stdout is None:
+            returncode, stdout, stderr = await run_docker(cmd, timeout=30)
+
+            if returncode != 0:
+                raise NetworkError(f"Failed to list Docker networks: {stderr}")
+
+            cache_set(cache_key, stdout)
+
+        # Parse output
+        lines = [line for line in stdout.splitlines() if line.strip()]
+        if quiet:
+            networks = [{"id": line.strip()} for line in lines]
+        elif custom_template:
+            networks = [{"output": line} for line in lines]
+        else:
+            # NDJSON: join into one array and parse it in a single call
+            networks = json_loads("[" + ",".join(lines) + "]")
+            if detail:
+                networks = await self._inspect_networks(networks)
+        return networks, stdout, cmd
+
+    @staticmethod
+    async def _inspect_networks(
+        networks: List[Dict[str, Any]], max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Attach inspect data to networks, fetching it concurrently."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def inspect(network: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    DOCKER_BIN,
+                    "network",
+                    "inspect",
+                    "--format",
+                    "{{json .}}",
+                    network["ID"],
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                stdout, _ = await process.communicate()
+
+            # Network may have been removed between ls and inspect
+            if process.returncode != 0:
+                return network
+            return {**network, "detail": json_loads(stdout)}
+
+        return list(await asyncio.gather(*(inspect(net) for net in networks)))
+
+    @staticmethod
+    def _format_table(networks: List[Dict[str, Any]]) -> str:
+        """Render parsed networks as a docker-style table."""
+        columns = ["ID", "Name", "Driver", "Scope"]
+        rows = [[str(net.get(col, "")) for col in columns] for net in networks]
+        widths = [
+            max([len(col)] + [len(row[i]) for row in rows])
+            for i, col in enumerate(columns)
+        ]
+        header = "   ".join(col.upper().ljust(w) for col, w in zip(columns, widths))
+        body = [
+            "   ".join(value.ljust(w) for value, w in zip(row, widths)) for row in rows
+        ]
+        return "\n".join(line.rstrip() for line in [header] + body)
+
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "format_output": {
+                "type": "string",
+                "description": "Output format (table, json or Go template)",
+            },
+            "filter_network": {
+                "type": "string",
+                "description": "Filter by network name",
+            },
+            "quiet": {
+                "type": "boolean",
+                "description": "Only display network IDs",
+                "default": False,
+            },
+            "no_trunc": {
+                "type": "boolean",
+                "description": "Don't truncate output",
+                "default": False,
+            },
+            "detail": {
+                "type": "boolean",
+                "description": "Include full inspect data for every network",
+                "default": False,
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw docker output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker network ls command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "format_output": {
-                    "type": "string",
-                    "description": "Output format",
-                },
-                "filter_network": {
-                    "type": "string",
-                    "description": "Filter by network name",
-                },
-                "quiet": {
-                    "type": "boolean",
-                    "description": "Only display network IDs",
-                    "default": False,
-                },
-                "no_trunc": {
-                    "type": "boolean",
-                    "description": "Don't truncate output",
-                    "default": False,
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
@@ -1,6 +1,6 @@
 """Docker network remove command."""
 
-from ai_admin.core.custom_exceptions import NetworkError
+from ai_admin.core.custom_exceptions import DockerError, NetworkError
 
 """Docker network remove command.
 
@@ -9,7 +9,7 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import shlex
 
 from typing import Dict, Any, Optional, List
 
@@ -17,6 +17,10 @@ from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import DOCKER_BIN, invalidate, run_docker
+
+from ai_admin.docker import get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -33,6 +37,7 @@ class DockerNetworkRmCommand:
     async def execute(
         self,
         network_name: str,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -40,6 +45,7 @@ class DockerNetworkRmCommand:
 
         Args:
             network_name: Name or ID of the network to remove
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -54,6 +60,7 @@ class DockerNetworkRmCommand:
         # Use unified security approach
         return await super().execute(
             network_name=network_name,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -69,47 +76,73 @@ class DockerNetworkRmCommand:
     async def _remove_network(
         self,
         network_name: str,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Remove Docker network."""
         try:
-            # Build Docker command
-            cmd = ["docker", "network", "rm", network_name]
-
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise NetworkError(f"Failed to remove Docker network: {result.stderr}")
-
-            return {
+            engine = get_engine_client()
+            if engine.available:
+                # Talk to the daemon socket directly, no docker CLI fork
+                await engine.request(
+                    "DELETE", "/networks/{}", segments=(network_name,)
+                )
+                stdout = ""
+                command = f"DELETE /networks/{network_name}"
+            else:
+                # Build Docker command
+                cmd = [DOCKER_BIN, "network", "rm", network_name]
+
+                # Output is only shown in debug mode
+                returncode, stdout, stderr = await run_docker(
+                    cmd, timeout=30, capture_stdout=debug
+                )
+
+                if returncode != 0:
+                    raise NetworkError(f"Failed to remove Docker network: {stderr}")
+
+                command = shlex.join(cmd) if debug else None
+
+            # Network topology changed, drop cached ls/inspect results
+            invalidate()
+
+            response = {
                 "message": f"Removed Docker network '{network_name}'",
                 "network_name": network_name,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = command
+            return response
 
-        except subprocess.TimeoutExpired as e:
-            raise NetworkError(f"Docker network rm command timed out: {str(e)}")
+        except DockerError as e:
+            raise NetworkError(f"Docker network rm failed: {str(e)}")
         except NetworkError as e:
             raise NetworkError(f"Docker network rm failed: {str(e)}")
 
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "network_name": {
+                "type": "string",
+                "description": "Name or ID of the network to remove",
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw docker output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["network_name"],
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker network rm command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "network_name": {
-                    "type": "string",
-                    "description": "Name or ID of the network to remove",
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["network_name"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
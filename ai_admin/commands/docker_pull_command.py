@@ -9,7 +9,8 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import shlex
+import time
 
 from typing import Dict, Any, Optional, List
 
@@ -19,8 +20,14 @@ from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import DOCKER_BIN, image_exists_cached, run_docker
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+from ai_admin.task_queue.queue_manager import QueueManager
+
+from ai_admin.task_queue.task_queue import Task, TaskType
+
 class DockerPullCommand:
     
     
@@ -51,9 +58,11 @@ class DockerPullCommand:
         tag: str = "latest",
         all_tags: bool = False,
         disable_content_trust: bool = False,
-        quiet: bool = False,
+        quiet: Optional[bool] = None,
         platform: Optional[str] = None,
         use_queue: bool = True,
+        skip_if_present: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -64,9 +73,11 @@ class DockerPullCommand:
                 tag: Tag to pull (default: 'latest')
                 all_tags: Pull all tags of the image
                 disable_content_trust: Skip image signature verification (default: False)
-                quiet: Suppress verbose output
+                quiet: Suppress verbose output (queued pulls default to quiet)
                 platform: Target platform (e.g., 'linux/amd64', 'linux/arm64')
                 use_queue: Use background queue for long-running operations
+                skip_if_present: Do not pull when the image is already present
+                debug: Include the docker command line in the result
                 user_roles: List of user roles for security validation
     
             Returns:
@@ -85,6 +96,8 @@ class DockerPullCommand:
             quiet=quiet,
             platform=platform,
             use_queue=use_queue,
+            skip_if_present=skip_if_present,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -101,19 +114,33 @@ class DockerPullCommand:
         tag: str = "latest",
         all_tags: bool = False,
         disable_content_trust: bool = False,
-        quiet: bool = False,
+        quiet: Optional[bool] = None,
         platform: Optional[str] = None,
         use_queue: bool = True,
+        skip_if_present: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Pull Docker image."""
         try:
+            # Image already present locally and the caller does not want a
+            # newer one: nothing to pull. Tags such as 'latest' move, so
+            # this is opt-in. Content trust and platform selection can
+            # change what gets pulled, so they always go through a real pull.
+            if skip_if_present and not (
+                all_tags or disable_content_trust or platform
+            ):
+                full_image_name = f"{image_name}:{tag}"
+                if await image_exists_cached(full_image_name):
+                    return {
+                        "status": "cached",
+                        "message": f"Image '{full_image_name}' is already present",
+                        "image_name": full_image_name,
+                        "tag": tag,
+                    }
+
             # Use queue for long-running operations if requested
             if use_queue:
-                from ai_admin.task_queue.task_queue import TaskQueueManager, Task, TaskType
-    
-                queue_manager = TaskQueueManager()
-    
                 # Create task
                 task = Task(
                     task_type=TaskType.DOCKER_PULL,
@@ -128,6 +155,7 @@ class DockerPullCommand:
                 )
     
                 # Add to global queue
+                queue_manager = QueueManager()
                 task_id = await queue_manager.add_task(task)
     
                 return {
@@ -145,7 +173,7 @@ class DockerPullCommand:
                 full_image_name = f"{image_name}:{tag}"
     
             # Build Docker pull command
-            cmd = ["docker", "pull"]
+            cmd = [DOCKER_BIN, "pull"]
     
             # Add options
             if all_tags:
@@ -164,20 +192,19 @@ class DockerPullCommand:
             cmd.append(full_image_name)
     
             # Execute pull command
-            start_time = datetime.utcnow()
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            end_time = datetime.utcnow()
-            pull_duration = (end_time - start_time).total_seconds()
+            start_time = time.monotonic()
+            returncode, stdout, stderr = await run_docker(cmd, timeout=300)
+            pull_duration = time.monotonic() - start_time
     
-            if result.returncode != 0:
-                raise CustomError(f"Failed to pull Docker image: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to pull Docker image: {stderr}")
     
             # Parse output for size information
             size_info = {}
             layers_info = []
     
-            if result.stdout:
-                lines = result.stdout.strip().split("\n")
+            if stdout:
+                lines = stdout.strip().split("\n")
                 for line in lines:
                     if "Pulling from" in line:
                         size_info["registry"] = line.split("Pulling from ")[1].split()[0]
@@ -194,7 +221,7 @@ class DockerPullCommand:
                     elif "Status:" in line and "Extracting" in line:
                         layers_info.append("extracting")
     
-            return {
+            response = {
                 "message": f"Successfully pulled image '{full_image_name}'",
                 "image_name": full_image_name,
                 "registry": size_info.get("registry", "unknown"),
@@ -208,57 +235,74 @@ class DockerPullCommand:
                     "quiet": quiet,
                     "platform": platform,
                 },
-                "command": " ".join(cmd),
-                "timestamp": end_time.isoformat(),
+                "timestamp": datetime.utcnow().isoformat(),
             }
+            if debug:
+                response["command"] = shlex.join(cmd)
+            return response
     
         except CustomError as e:
             raise CustomError(f"Docker pull failed: {str(e)}")
     
     
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "image_name": {
+                "type": "string",
+                "description": "Name of the image to pull (e.g., 'nginx', 'username/myapp')",
+                "pattern": "^[a-z0-9]+(?:[._-][a-z0-9]+)*(?:/[a-z0-9]+(?:[._-][a-z0-9]+)*)*$",
+                "examples": ["nginx", "myusername/myapp", "registry.com/namespace/app"],
+            },
+            "tag": {
+                "type": "string",
+                "description": "Tag to pull",
+                "default": "latest",
+                "examples": ["latest", "v1.0.0", "dev", "prod"],
+            },
+            "all_tags": {"type": "boolean", "description": "Pull all tags of the image", "default": False},
+            "disable_content_trust": {
+                "type": "boolean",
+                "description": "Skip image signature verification",
+                "default": False,
+            },
+            "quiet": {
+                "type": "boolean",
+                "description": "Suppress verbose output (queued pulls default to quiet)",
+            },
+            "platform": {
+                "type": "string",
+                "description": "Target platform (e.g., 'linux/amd64', 'linux/arm64')",
+                "examples": ["linux/amd64", "linux/arm64", "linux/arm/v7"],
+            },
+            "use_queue": {
+                "type": "boolean",
+                "description": "Use background queue for long-running operations",
+                "default": True,
+            },
+            "skip_if_present": {
+                "type": "boolean",
+                "description": "Do not pull when the image is already present locally",
+                "default": False,
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include the docker command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+                "examples": [["admin"], ["developer", "docker:pull"]],
+            },
+        },
+        "required": ["image_name"],
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker pull command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "image_name": {
-                    "type": "string",
-                    "description": "Name of the image to pull (e.g., 'nginx', 'username/myapp')",
-                    "pattern": "^[a-z0-9]+(?:[._-][a-z0-9]+)*(?:/[a-z0-9]+(?:[._-][a-z0-9]+)*)*$",
-                    "examples": ["nginx", "myusername/myapp", "registry.com/namespace/app"],
-                },
-                "tag": {
-                    "type": "string",
-                    "description": "Tag to pull",
-                    "default": "latest",
-                    "examples": ["latest", "v1.0.0", "dev", "prod"],
-                },
-                "all_tags": {"type": "boolean", "description": "Pull all tags of the image", "default": False},
-                "disable_content_trust": {
-                    "type": "boolean",
-                    "description": "Skip image signature verification",
-                    "default": False,
-                },
-                "quiet": {"type": "boolean", "description": "Suppress verbose output", "default": False},
-                "platform": {
-                    "type": "string",
-                    "description": "Target platform (e.g., 'linux/amd64', 'linux/arm64')",
-                    "examples": ["linux/amd64", "linux/arm64", "linux/arm/v7"],
-                },
-                "use_queue": {
-                    "type": "boolean",
-                    "description": "Use background queue for long-running operations",
-                    "default": True,
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                    "examples": [["admin"], ["developer", "docker:pull"]],
-                },
-            },
-            "required": ["image_name"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
     
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Docker push image command."""
 
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker push command for uploading images to registries.
 
@@ -9,14 +9,15 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
-
+import shlex
 from typing import Dict, Any, Optional, List
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -40,6 +41,7 @@ class DockerPushCommand:
         tag: str = "latest",
         all_tags: bool = False,
         disable_content_trust: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -50,6 +52,7 @@ class DockerPushCommand:
             tag: Tag to push (default: latest)
             all_tags: Push all tags of the image
             disable_content_trust: Disable content trust
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -67,6 +70,7 @@ class DockerPushCommand:
             tag=tag,
             all_tags=all_tags,
             disable_content_trust=disable_content_trust,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -85,12 +89,13 @@ class DockerPushCommand:
         tag: str = "latest",
         all_tags: bool = False,
         disable_content_trust: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Push Docker image to registry."""
         try:
             # Build Docker command
-            cmd = ["docker", "push"]
+            cmd = [DOCKER_BIN, "push"]
 
             # Add options
             if all_tags:
@@ -104,23 +109,25 @@ class DockerPushCommand:
             cmd.append(full_image_name)
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=300)
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to push Docker image: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to push Docker image: {stderr}")
 
-            return {
+            response = {
                 "message": f"Successfully pushed image '{full_image_name}'",
                 "image_name": image_name,
                 "tag": tag,
                 "full_image_name": full_image_name,
                 "all_tags": all_tags,
                 "disable_content_trust": disable_content_trust,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker push command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker push failed: {str(e)}")
@@ -150,6 +157,11 @@ class DockerPushCommand:
                     "description": "Disable content trust",
                     "default": False,
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
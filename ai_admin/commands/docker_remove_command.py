@@ -1,6 +1,6 @@
 """Docker remove images command."""
 
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker remove command for removing images.
 
@@ -9,14 +9,15 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
-
+import shlex
 from typing import Dict, Any, List, Optional
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import DOCKER_BIN, invalidate, run_docker
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -35,6 +36,7 @@ class DockerRemoveCommand:
         images: List[str],
         force: bool = False,
         no_prune: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -44,6 +46,7 @@ class DockerRemoveCommand:
             images: List of image names or IDs to remove
             force: Force removal
             no_prune: Do not delete untagged parents
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -60,6 +63,7 @@ class DockerRemoveCommand:
             images=images,
             force=force,
             no_prune=no_prune,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -77,12 +81,13 @@ class DockerRemoveCommand:
         images: List[str],
         force: bool = False,
         no_prune: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Remove Docker images."""
         try:
             # Build Docker command
-            cmd = ["docker", "rmi"]
+            cmd = [DOCKER_BIN, "rmi"]
 
             # Add options
             if force:
@@ -95,21 +100,26 @@ class DockerRemoveCommand:
             cmd.extend(images)
 
             # Execute remove command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=120)
+
+            if returncode != 0:
+                raise CustomError(f"Failed to remove Docker images: {stderr}")
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to remove Docker images: {result.stderr}")
+            # Removed images must not be reported as present by docker_pull
+            invalidate()
 
-            return {
+            response = {
                 "message": f"Successfully removed {len(images)} Docker images",
                 "images": images,
                 "force": force,
                 "no_prune": no_prune,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker remove command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker remove failed: {str(e)}")
@@ -135,6 +145,11 @@ class DockerRemoveCommand:
                     "description": "Do not delete untagged parents",
                     "default": False,
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -1,6 +1,6 @@
 """Docker restart container command."""
 
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker restart command for restarting containers.
 
@@ -9,16 +9,32 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import asyncio
+import shlex
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Union
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    FlagSpec,
+    build_flags,
+    docker_errors,
+    run_docker,
+    stop_timeout,
+)
+
+from ai_admin.docker import DockerEngineClient, get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+_RESTART_PREFIX = (DOCKER_BIN, "restart")
+
+RESTART_FLAGS: FlagSpec = (("timeout", "-t", "value"),)
+
 
 class DockerRestartCommand:
     """Restart Docker containers."""
@@ -32,16 +48,18 @@ class DockerRestartCommand:
 
     async def execute(
         self,
-        container_name: str,
+        container_name: Union[str, List[str]],
         timeout: Optional[int] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
         """Execute Docker restart command with unified security.
 
         Args:
-            container_name: Name or ID of the container to restart
+            container_name: Name or ID of the container(s) to restart
             timeout: Timeout in seconds before killing the container
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -57,6 +75,7 @@ class DockerRestartCommand:
         return await super().execute(
             container_name=container_name,
             timeout=timeout,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -69,62 +88,122 @@ class DockerRestartCommand:
         """Execute Docker restart command logic."""
         return await self._restart_container(**kwargs)
 
+    @docker_errors("restart")
     async def _restart_container(
         self,
-        container_name: str,
+        container_name: Union[str, List[str]],
         timeout: Optional[int] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Restart Docker container."""
-        try:
-            # Build Docker command
-            cmd = ["docker", "restart"]
-
-            if timeout:
-                cmd.extend(["-t", str(timeout)])
+        """Restart Docker container(s), all of them concurrently."""
+        names = [container_name] if isinstance(container_name, str) else container_name
 
-            cmd.append(container_name)
+        engine = get_engine_client()
+        outcomes = await asyncio.gather(
+            *(self._restart_one(engine, name, timeout) for name in names),
+            return_exceptions=True,
+        )
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        restarted = []
+        failed = {}
+        raw_output = []
+        commands = []
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, (CustomError, DockerError)):
+                failed[name] = str(outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                restarted.append(name)
+                raw_output.append(outcome[0])
+                commands.append(outcome[1])
+
+        if not restarted:
+            raise CustomError(
+                "; ".join(f"{name}: {error}" for name, error in failed.items())
+            )
 
-            if result.returncode != 0:
-                raise CustomError(
-                    f"Failed to restart Docker container: {result.stderr}"
-                )
+        response = {
+            "message": (
+                f"Successfully restarted {len(restarted)} of {len(names)} container(s)"
+            ),
+            "status": "partial" if failed else "success",
+            "container_name": container_name,
+            "restarted": restarted,
+            "failed": failed,
+            "timeout": timeout,
+        }
+        if debug:
+            response["raw_output"] = "".join(raw_output)
+            response["command"] = "\n".join(
+                shlex.join(cmd) if isinstance(cmd, list) else cmd for cmd in commands
+            )
+        return response
 
-            return {
-                "message": f"Successfully restarted container '{container_name}'",
-                "container_name": container_name,
-                "timeout": timeout,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
-            }
+    async def _restart_one(
+        self,
+        engine: DockerEngineClient,
+        name: str,
+        timeout: Optional[int],
+    ) -> Tuple[str, Union[str, List[str]]]:
+        """Restart a single container.
 
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Docker restart command timed out: {str(e)}")
-        except CustomError as e:
-            raise CustomError(f"Docker restart failed: {str(e)}")
+        Returns:
+            Tuple of (docker stdout, API request or CLI arguments)
+        """
+        if engine.available:
+            # Talk to the daemon socket directly, no docker CLI fork
+            params = {"t": str(timeout)} if timeout is not None else None
+            await engine.request(
+                "POST",
+                "/containers/{}/restart",
+                params,
+                segments=(name,),
+                timeout=stop_timeout(timeout),
+            )
+            return "", f"POST /containers/{name}/restart"
+
+        # -t 0 (kill at once) is a valid grace period, unlike a falsy flag
+        grace = {"timeout": None if timeout is None else str(timeout)}
+        cmd = [*_RESTART_PREFIX, *build_flags(grace, RESTART_FLAGS), name]
+        returncode, stdout, stderr = await run_docker(cmd, stop_timeout(timeout))
+
+        if returncode != 0:
+            raise CustomError(f"Failed to restart Docker container: {stderr}")
+
+        return stdout, cmd
+
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "container_name": {
+                "oneOf": [
+                    {"type": "string"},
+                    {"type": "array", "items": {"type": "string"}},
+                ],
+                "description": "Name or ID of the container(s) to restart",
+            },
+            "timeout": {
+                "type": "integer",
+                "description": "Timeout in seconds before killing the container",
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw docker output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["container_name"],
+        "additionalProperties": False,
+    }
 
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker restart command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "container_name": {
-                    "type": "string",
-                    "description": "Name or ID of the container to restart",
-                },
-                "timeout": {
-                    "type": "integer",
-                    "description": "Timeout in seconds before killing the container",
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["container_name"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
@@ -1,4 +1,4 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker rm command for removing containers.
 
@@ -7,16 +7,34 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import asyncio
+import shlex
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    FlagSpec,
+    build_flags,
+    docker_errors,
+    run_docker,
+)
+
+from ai_admin.docker import get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+_RM_PREFIX = (DOCKER_BIN, "rm")
+
+RM_FLAGS: FlagSpec = (
+    ("force", "--force", "bool"),
+    ("volumes", "-v", "bool"),
+)
+
 
 class DockerRmCommand:
     """Remove Docker containers."""
@@ -30,18 +48,20 @@ class DockerRmCommand:
 
     async def execute(
         self,
-        container_name: str,
+        container_name: Union[str, List[str]],
         force: bool = False,
         volumes: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
         """Execute Docker rm command with unified security.
 
         Args:
-            container_name: Name or ID of the container to remove
+            container_name: Name or ID of the container(s) to remove
             force: Force removal of running container
             volumes: Remove associated volumes
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -58,6 +78,7 @@ class DockerRmCommand:
             container_name=container_name,
             force=force,
             volumes=volumes,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -70,77 +91,118 @@ class DockerRmCommand:
         """Execute Docker rm command logic."""
         return await self._remove_container(**kwargs)
 
+    @docker_errors("rm")
     async def _remove_container(
         self,
-        container_name: str,
+        container_name: Union[str, List[str]],
         force: bool = False,
         volumes: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Remove Docker container."""
-        try:
-            # Build Docker command
-            cmd = ["docker", "rm"]
-
-            # Add options
-            if force:
-                cmd.append("--force")
-
-            if volumes:
-                cmd.append("-v")
-
-            # Add container name
-            cmd.append(container_name)
-
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode != 0:
-                raise CustomError(f"Failed to remove Docker container: {result.stderr}")
+        names = (
+            [container_name] if isinstance(container_name, str) else container_name
+        )
 
-            return {
-                "message": f"Successfully removed container '{container_name}'",
-                "container_name": container_name,
-                "force": force,
-                "volumes": volumes,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
-            }
+        engine = get_engine_client()
+        failed: Dict[str, str] = {}
+        if engine.available:
+            # Talk to the daemon socket directly, no docker CLI fork
+            params = {"force": str(force).lower(), "v": str(volumes).lower()}
+            outcomes = await asyncio.gather(
+                *(
+                    engine.request(
+                        "DELETE", "/containers/{}", params, segments=(name,)
+                    )
+                    for name in names
+                ),
+                return_exceptions=True,
+            )
+            removed = []
+            for name, outcome in zip(names, outcomes):
+                if isinstance(outcome, (CustomError, DockerError)):
+                    failed[name] = str(outcome)
+                elif isinstance(outcome, BaseException):
+                    raise outcome
+                else:
+                    removed.append(name)
+            stdout = ""
+            command = "\n".join(f"DELETE /containers/{name}" for name in names)
+        else:
+            # All containers are removed by a single docker rm call
+            cmd = [*_RM_PREFIX, *build_flags(locals(), RM_FLAGS), *names]
+
+            returncode, stdout, stderr = await run_docker(cmd)
+
+            # docker rm keeps going after a failure and prints every
+            # container it did remove
+            removed = [line for line in stdout.splitlines() if line.strip()]
+            if returncode != 0:
+                failed = {name: stderr for name in names if name not in removed}
+            command = shlex.join(cmd) if debug else None
+
+        if not removed:
+            raise CustomError(
+                "Failed to remove Docker container: "
+                + "; ".join(f"{name}: {error}" for name, error in failed.items())
+            )
 
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Docker rm command timed out: {str(e)}")
-        except CustomError as e:
-            raise CustomError(f"Docker rm failed: {str(e)}")
+        response = {
+            "message": (
+                f"Successfully removed {len(removed)} of {len(names)} container(s)"
+            ),
+            "status": "partial" if failed else "success",
+            "container_name": container_name,
+            "removed": removed,
+            "failed": failed,
+            "force": force,
+            "volumes": volumes,
+        }
+        if debug:
+            response["raw_output"] = stdout
+            response["command"] = command
+        return response
+
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "container_name": {
+                "oneOf": [
+                    {"type": "string"},
+                    {"type": "array", "items": {"type": "string"}},
+                ],
+                "description": "Name or ID of the container(s) to remove",
+            },
+            "force": {
+                "type": "boolean",
+                "description": "Force removal of running container",
+                "default": False,
+            },
+            "volumes": {
+                "type": "boolean",
+                "description": "Remove associated volumes",
+                "default": False,
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw docker output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["container_name"],
+        "additionalProperties": False,
+    }
 
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker rm command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "container_name": {
-                    "type": "string",
-                    "description": "Name or ID of the container to remove",
-                },
-                "force": {
-                    "type": "boolean",
-                    "description": "Force removal of running container",
-                    "default": False,
-                },
-                "volumes": {
-                    "type": "boolean",
-                    "description": "Remove associated volumes",
-                    "default": False,
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["container_name"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
 
 
 """Docker rm command implementation."""
@@ -1,4 +1,4 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker run command for running containers.
 
@@ -7,16 +7,127 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
-
-from typing import Dict, Any, Optional, List
+import re
+import shlex
+from typing import Dict, Any, Optional, List, Tuple
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    FlagSpec,
+    build_flags,
+    docker_errors,
+    run_docker,
+)
+
+from ai_admin.docker import DockerEngineClient, get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+# Host side of a -p mapping: [ip:]port[-port]
+_HOST_PORT_RE = re.compile(r"^(?:[0-9a-fA-F.:\[\]]+:)?\d{1,5}(?:-\d{1,5})?$")
+
+# Container side of a -p mapping: port[-port][/protocol]
+_CONTAINER_PORT_RE = re.compile(r"^\d{1,5}(?:-\d{1,5})?(?:/(?:tcp|udp|sctp))?$")
+
+# Environment variable names accepted by -e
+_ENV_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+
+
+def _split_port_range(spec: str) -> Tuple[int, int]:
+    """Split 'port' or 'start-end' into the first and last port."""
+    start, _, end = spec.partition("-")
+    return int(start), int(end or start)
+
+
+def _port_bindings(ports: Dict[str, str]) -> Dict[str, List[Dict[str, str]]]:
+    """Translate validated -p mappings into Engine API PortBindings.
+
+    The host IP goes to HostIp and port ranges are expanded to one binding
+    per port, as the docker CLI does. A host range published for a single
+    container port is passed through, letting the daemon pick a free port.
+    """
+    bindings: Dict[str, List[Dict[str, str]]] = {}
+    for host_spec, container_spec in ports.items():
+        host_ip, _, host_port = str(host_spec).rpartition(":")
+        container_port, _, protocol = str(container_spec).partition("/")
+        host_start, _ = _split_port_range(host_port)
+        start, end = _split_port_range(container_port)
+        for offset in range(end - start + 1):
+            binding = {
+                "HostIp": host_ip.strip("[]"),
+                "HostPort": str(host_start + offset) if end > start else host_port,
+            }
+            key = f"{start + offset}/{protocol or 'tcp'}"
+            bindings.setdefault(key, []).append(binding)
+    return bindings
+
+
+def _validate_run_params(
+    ports: Optional[Dict[str, str]],
+    volumes: Optional[Dict[str, str]],
+    environment: Optional[Dict[str, str]],
+) -> Optional[str]:
+    """Check port, volume and environment mappings before building argv.
+
+    Returns:
+        Error message, or None if all mappings are valid
+    """
+    for label, mapping in (
+        ("ports", ports),
+        ("volumes", volumes),
+        ("environment", environment),
+    ):
+        if mapping is None:
+            continue
+        if not isinstance(mapping, dict):
+            return f"{label} must be an object"
+        for key, value in mapping.items():
+            if not isinstance(value, (str, int)) or isinstance(value, bool):
+                return f"{label} value for '{key}' must be a string or integer"
+
+    for host_port, container_port in (ports or {}).items():
+        if not _HOST_PORT_RE.match(str(host_port)):
+            return f"Invalid host port: {host_port}"
+        if not _CONTAINER_PORT_RE.match(str(container_port)):
+            return f"Invalid container port: {container_port}"
+        host_start, host_end = _split_port_range(str(host_port).rpartition(":")[2])
+        start, end = _split_port_range(str(container_port).partition("/")[0])
+        if host_start > host_end or start > end:
+            return f"Invalid port range: {host_port}:{container_port}"
+        # Like docker run, a container range needs a host range as long
+        if end > start and host_end - host_start != end - start:
+            return f"Port ranges do not match: {host_port}:{container_port}"
+
+    for host_path, container_path in (volumes or {}).items():
+        if not host_path or not str(container_path).startswith("/"):
+            return f"Invalid volume mapping: {host_path}:{container_path}"
+
+    for key in environment or {}:
+        if not _ENV_NAME_RE.match(key):
+            return f"Invalid environment variable name: {key}"
+
+    return None
+
+
+_RUN_PREFIX = (DOCKER_BIN, "run")
+
+RUN_FLAGS: FlagSpec = (
+    ("detach", "-d", "bool"),
+    ("name", "--name", "value"),
+    ("network", "--network", "value"),
+    ("restart", "--restart", "value"),
+    ("user", "--user", "value"),
+    ("working_dir", "-w", "value"),
+    ("ports", "-p", "pair_dict"),
+    ("volumes", "-v", "pair_dict"),
+    ("environment", "-e", "kv_dict"),
+)
+
+
 class DockerRunCommand:
     
     
@@ -45,6 +156,7 @@ class DockerRunCommand:
         restart: Optional[str] = None,
         user: Optional[str] = None,
         working_dir: Optional[str] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -62,6 +174,7 @@ class DockerRunCommand:
                 restart: Restart policy (no, on-failure, always, unless-stopped)
                 user: User to run as
                 working_dir: Working directory in container
+                debug: Include raw docker output and command line in the result
                 user_roles: List of user roles for security validation
     
             Returns:
@@ -70,6 +183,10 @@ class DockerRunCommand:
         # Validate inputs
         if not image:
             return ErrorResult(message="Image is required", code="VALIDATION_ERROR")
+
+        error = _validate_run_params(ports, volumes, environment)
+        if error:
+            return ErrorResult(message=error, code="VALIDATION_ERROR")
     
         # Use unified security approach
         return await super().execute(
@@ -84,6 +201,7 @@ class DockerRunCommand:
             restart=restart,
             user=user,
             working_dir=working_dir,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -99,6 +217,7 @@ class DockerRunCommand:
         return await self._run_container(**kwargs)
     
     
+    @docker_errors("run")
     async def _run_container(
         self,
         image: str,
@@ -112,77 +231,158 @@ class DockerRunCommand:
         restart: Optional[str] = None,
         user: Optional[str] = None,
         working_dir: Optional[str] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Run Docker container."""
+        engine = get_engine_client()
+        container_id = None
+        if engine.available and detach:
+            # Talk to the daemon socket directly, no docker CLI fork
+            container_id = await self._run_container_api(
+                engine,
+                image,
+                name,
+                command,
+                ports,
+                volumes,
+                environment,
+                network,
+                restart,
+                user,
+                working_dir,
+            )
+            stdout = container_id or ""
+            command_line = "POST /containers/create"
+
+        # Attached runs, no daemon socket or image not present locally
+        # (docker run pulls it) go through the CLI
+        if container_id is None:
+            stdout, cmd = await self._run_container_cli(
+                image,
+                name,
+                command,
+                ports,
+                volumes,
+                environment,
+                network,
+                detach,
+                restart,
+                user,
+                working_dir,
+            )
+            container_id = stdout.strip()
+            command_line = shlex.join(cmd) if debug else None
+
+        response = {
+            "message": f"Successfully started container from image '{image}'",
+            "container_id": container_id,
+            "image": image,
+            "name": name,
+            "network": network,
+            "detach": detach,
+            "ports": ports,
+            "volumes": volumes,
+            "environment": environment,
+        }
+        if debug:
+            response["raw_output"] = stdout
+            response["command"] = command_line
+        return response
+
+    async def _run_container_api(
+        self,
+        engine: DockerEngineClient,
+        image: str,
+        name: Optional[str],
+        command: Optional[str],
+        ports: Optional[Dict[str, str]],
+        volumes: Optional[Dict[str, str]],
+        environment: Optional[Dict[str, str]],
+        network: Optional[str],
+        restart: Optional[str],
+        user: Optional[str],
+        working_dir: Optional[str],
+    ) -> Optional[str]:
+        """Create and start a detached container through the Docker Engine API.
+
+        Returns:
+            Container ID, or None if the image is not present locally
+        """
+        host_config: Dict[str, Any] = {}
+        body: Dict[str, Any] = {"Image": image, "HostConfig": host_config}
+
+        if command:
+            body["Cmd"] = [command]
+        if environment:
+            body["Env"] = [f"{key}={value}" for key, value in environment.items()]
+        if user:
+            body["User"] = user
+        if working_dir:
+            body["WorkingDir"] = working_dir
+        if ports:
+            bindings = _port_bindings(ports)
+            body["ExposedPorts"] = {port: {} for port in bindings}
+            host_config["PortBindings"] = bindings
+        if volumes:
+            host_config["Binds"] = [f"{h}:{c}" for h, c in volumes.items()]
+        if network:
+            host_config["NetworkMode"] = network
+        if restart:
+            policy, _, retries = restart.partition(":")
+            host_config["RestartPolicy"] = {"Name": policy}
+            if retries:
+                host_config["RestartPolicy"]["MaximumRetryCount"] = int(retries)
+
         try:
-            cmd = ["docker", "run"]
-    
-            # Add options
-            if detach:
-                cmd.append("-d")
-    
-            if name:
-                cmd.extend(["--name", name])
-    
-            if network:
-                cmd.extend(["--network", network])
-    
-            if restart:
-                cmd.extend(["--restart", restart])
-    
-            if user:
-                cmd.extend(["--user", user])
-    
-            if working_dir:
-                cmd.extend(["-w", working_dir])
-    
-            # Add port mappings
-            if ports:
-                for host_port, container_port in ports.items():
-                    cmd.extend(["-p", f"{host_port}:{container_port}"])
-    
-            # Add volume mappings
-            if volumes:
-                for host_path, container_path in volumes.items():
-                    cmd.extend(["-v", f"{host_path}:{container_path}"])
-    
-            # Add environment variables
-            if environment:
-                for key, value in environment.items():
-                    cmd.extend(["-e", f"{key}={value}"])
-    
-            # Add image
-            cmd.append(image)
-    
-            # Add command if provided
-            if command:
-                cmd.append(command)
-    
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-    
-            if result.returncode != 0:
-                raise CustomError(f"Failed to run Docker container: {result.stderr}")
-    
-            container_id = result.stdout.strip()
-    
-            return {
-                "message": f"Successfully started container from image '{image}'",
-                "container_id": container_id,
-                "image": image,
-                "name": name,
-                "network": network,
-                "detach": detach,
-                "ports": ports,
-                "volumes": volumes,
-                "environment": environment,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
-            }
-    
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Docker run command timed out: {str(e)}")
-        except CustomError as e:
-            raise CustomError(f"Docker run failed: {str(e)}")
+            created = await engine.request(
+                "POST",
+                "/containers/create",
+                {"name": name} if name else None,
+                body,
+            )
+        except DockerError as e:
+            if e.details.get("status") == 404:
+                return None
+            raise
+
+        container_id = created["Id"]
+        await engine.request(
+            "POST", "/containers/{}/start", segments=(container_id,)
+        )
+        return container_id
+
+    async def _run_container_cli(
+        self,
+        image: str,
+        name: Optional[str],
+        command: Optional[str],
+        ports: Optional[Dict[str, str]],
+        volumes: Optional[Dict[str, str]],
+        environment: Optional[Dict[str, str]],
+        network: Optional[str],
+        detach: bool,
+        restart: Optional[str],
+        user: Optional[str],
+        working_dir: Optional[str],
+    ) -> Tuple[str, List[str]]:
+        """Run a container through the docker CLI.
+
+        Returns:
+            Tuple of (docker stdout, command arguments)
+        """
+        cmd = [
+            *_RUN_PREFIX,
+            *build_flags(locals(), RUN_FLAGS),
+            image,
+            *((command,) if command else ()),
+        ]
+
+        returncode, stdout, stderr = await run_docker(cmd)
+
+        if returncode != 0:
+            raise CustomError(f"Failed to run Docker container: {stderr}")
+
+        return stdout, cmd
     
 """Docker run command implementation."""
@@ -6,17 +6,80 @@ Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-
-import subprocess
-
-from typing import Dict, Any, Optional, List
+import asyncio
+import json
+import shlex
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Dict, Any, Optional, List, Tuple
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    FlagSpec,
+    build_flags,
+    docker_errors,
+    stream_docker,
+)
+
+from ai_admin.docker import DockerEngineClient, get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+# Seconds a Docker Hub search result stays valid
+SEARCH_CACHE_TTL = 300.0
+
+# Maximum number of distinct searches kept in the result cache
+SEARCH_CACHE_SIZE = 256
+
+_SEARCH_PREFIX = (DOCKER_BIN, "search")
+
+SEARCH_FLAGS: FlagSpec = (
+    ("limit", "--limit", "value"),
+    ("filter_stars", "--filter=stars={}", "format"),
+    ("filter_official", "--filter=is-official=true", "bool"),
+    ("filter_automated", "--filter=is-automated=true", "bool"),
+)
+
+# ('docker search' table column, Go template field); the free-text
+# description comes last so a tab inside it cannot shift other columns
+_SEARCH_COLUMNS = (
+    ("NAME", "Name"),
+    ("STARS", "StarCount"),
+    ("OFFICIAL", "IsOfficial"),
+    ("AUTOMATED", "IsAutomated"),
+    ("DESCRIPTION", "Description"),
+)
+
+_SEARCH_FORMAT = "\t".join(f"{{{{.{field}}}}}" for _, field in _SEARCH_COLUMNS)
+_SEARCH_FORMAT_NO_DESCRIPTION = "\t".join(
+    f"{{{{.{field}}}}}" for _, field in _SEARCH_COLUMNS[:-1]
+)
+
+
+def _parse_search_line(line: bytes, columns: Tuple[str, ...]) -> Dict[str, str]:
+    """Convert one tab-separated docker search line to table column keys."""
+    fields = line.decode("utf-8").rstrip("\n").split("\t", len(columns) - 1)
+    return dict(zip(columns, fields))
+
+
+def _without_command(result: Dict[str, Any], debug: bool) -> Dict[str, Any]:
+    """Drop the command line from a search result unless debugging."""
+    if debug:
+        return result
+    return {key: value for key, value in result.items() if key != "command"}
+
+
+_SearchKey = Tuple[str, Optional[int], Optional[int], bool, bool, bool]
+
+# (expiry time, result) per search, least recently used first
+_search_cache: "OrderedDict[_SearchKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_search_locks: Dict[_SearchKey, asyncio.Lock] = {}
+
 
 class DockerSearchCliCommand:
     """Search Docker images using CLI command.
@@ -39,6 +102,8 @@ class DockerSearchCliCommand:
         filter_stars: Optional[int] = None,
         filter_official: bool = False,
         filter_automated: bool = False,
+        include_description: bool = True,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -50,6 +115,9 @@ class DockerSearchCliCommand:
             filter_stars: Minimum number of stars
             filter_official: Filter for official images only
             filter_automated: Filter for automated builds only
+            include_description: Return image descriptions (omitting them
+                shrinks the docker output)
+            debug: Include the docker command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -68,6 +136,8 @@ class DockerSearchCliCommand:
             filter_stars=filter_stars,
             filter_official=filter_official,
             filter_automated=filter_automated,
+            include_description=include_description,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -87,102 +157,245 @@ class DockerSearchCliCommand:
         filter_stars: Optional[int] = None,
         filter_official: bool = False,
         filter_automated: bool = False,
+        include_description: bool = True,
+        cache_ttl: float = SEARCH_CACHE_TTL,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Search Docker images using CLI."""
+        """Search Docker images using CLI.
+
+        Identical searches within cache_ttl seconds are served from memory;
+        concurrent identical searches share a single docker round-trip.
+        """
+        if not cache_ttl:
+            result = await self._search_images_uncached(
+                query,
+                limit,
+                filter_stars,
+                filter_official,
+                filter_automated,
+                include_description,
+            )
+            return _without_command(result, debug)
+
+        key = (
+            query,
+            limit,
+            filter_stars,
+            filter_official,
+            filter_automated,
+            include_description,
+        )
+        lock = _search_locks.setdefault(key, asyncio.Lock())
         try:
-            # Build Docker command
-            cmd = ["docker", "search"]
-
-            # Add options
-            if limit:
-                cmd.extend(["--limit", str(limit)])
-
-            if filter_stars:
-                cmd.extend(["--filter", f"stars={filter_stars}"])
-
-            if filter_official:
-                cmd.extend(["--filter", "is-official=true"])
-
-            if filter_automated:
-                cmd.extend(["--filter", "is-automated=true"])
-
-            # Add search query
-            cmd.append(query)
-
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode != 0:
-                raise CustomError(f"Failed to search Docker images: {result.stderr}")
-
-            # Parse output
-            images = []
-            lines = result.stdout.strip().split("\n")
-            if len(lines) > 1:
-                headers = lines[0].split()
-                for line in lines[1:]:
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= len(headers):
-                            image = dict(zip(headers, parts))
-                            images.append(image)
-
-            return {
-                "message": f"Found {len(images)} Docker images for query '{query}'",
-                "query": query,
-                "images": images,
-                "count": len(images),
-                "limit": limit,
-                "filter_stars": filter_stars,
-                "filter_official": filter_official,
-                "filter_automated": filter_automated,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
+            async with lock:
+                entry = _search_cache.get(key)
+                if entry is not None:
+                    if time.monotonic() < entry[0]:
+                        _search_cache.move_to_end(key)
+                        cached = {**entry[1], "cached": True}
+                        return _without_command(cached, debug)
+                    del _search_cache[key]
+
+                result = await self._search_images_uncached(*key)
+                _search_cache[key] = (time.monotonic() + cache_ttl, result)
+                if len(_search_cache) > SEARCH_CACHE_SIZE:
+                    _search_cache.popitem(last=False)
+        finally:
+            # Waiters still hold this lock; only drop it if nobody replaced it
+            if _search_locks.get(key) is lock:
+                del _search_locks[key]
+        return _without_command(result, debug)
+
+    @docker_errors("search CLI")
+    async def _search_images_uncached(
+        self,
+        query: str,
+        limit: Optional[int],
+        filter_stars: Optional[int],
+        filter_official: bool,
+        filter_automated: bool,
+        include_description: bool,
+    ) -> Dict[str, Any]:
+        """Run a docker search without consulting the cache."""
+        engine = get_engine_client()
+        if engine.available:
+            images = await self._search_images_api(
+                engine,
+                query,
+                limit,
+                filter_stars,
+                filter_official,
+                filter_automated,
+                include_description,
+            )
+            command = "GET /images/search"
+        else:
+            images, command = await self._search_images_cli(
+                query,
+                limit,
+                filter_stars,
+                filter_official,
+                filter_automated,
+                include_description,
+            )
+
+        return {
+            "message": f"Found {len(images)} Docker images for query '{query}'",
+            "query": query,
+            "images": images,
+            "count": len(images),
+            "limit": limit,
+            "filter_stars": filter_stars,
+            "filter_official": filter_official,
+            "filter_automated": filter_automated,
+            "include_description": include_description,
+            "command": command,
+            "cached": False,
+        }
+
+    async def _search_images_api(
+        self,
+        engine: DockerEngineClient,
+        query: str,
+        limit: Optional[int],
+        filter_stars: Optional[int],
+        filter_official: bool,
+        filter_automated: bool,
+        include_description: bool,
+    ) -> List[Dict[str, str]]:
+        """Search images through the Docker Engine API.
+
+        Results use the same keys as the 'docker search' table columns.
+        """
+        params = {"term": query}
+        if limit:
+            params["limit"] = str(limit)
+
+        filters: Dict[str, List[str]] = {}
+        if filter_stars:
+            filters["stars"] = [str(filter_stars)]
+        if filter_official:
+            filters["is-official"] = ["true"]
+        if filter_automated:
+            filters["is-automated"] = ["true"]
+        if filters:
+            params["filters"] = json.dumps(filters)
+
+        results = await engine.request("GET", "/images/search", params) or []
+        images = []
+        for item in results:
+            image = {
+                "NAME": item.get("name", ""),
+                "STARS": str(item.get("star_count", 0)),
+                "OFFICIAL": "[OK]" if item.get("is_official") else "",
+                "AUTOMATED": "[OK]" if item.get("is_automated") else "",
             }
+            if include_description:
+                image["DESCRIPTION"] = item.get("description", "")
+            images.append(image)
+        return images
+
+    async def _search_images_cli(
+        self,
+        query: str,
+        limit: Optional[int],
+        filter_stars: Optional[int],
+        filter_official: bool,
+        filter_automated: bool,
+        include_description: bool,
+    ) -> Tuple[List[Dict[str, str]], str]:
+        """Search images through the docker CLI.
+
+        Returns:
+            Tuple of (images, command line)
+        """
+        # Tab-separated fields, untruncated descriptions
+        if include_description:
+            template = _SEARCH_FORMAT
+            columns = tuple(column for column, _ in _SEARCH_COLUMNS)
+        else:
+            template = _SEARCH_FORMAT_NO_DESCRIPTION
+            columns = tuple(column for column, _ in _SEARCH_COLUMNS[:-1])
+
+        cmd = [
+            *_SEARCH_PREFIX,
+            *build_flags(locals(), SEARCH_FLAGS),
+            "--no-trunc",
+            "--format",
+            template,
+        ]
+
+        # Add search query
+        cmd.append(query)
+
+        # Results are parsed as docker prints them
+        returncode, images, stderr = await stream_docker(
+            cmd, partial(_parse_search_line, columns=columns)
+        )
+
+        if returncode != 0:
+            raise CustomError(f"Failed to search Docker images: {stderr}")
 
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Docker search CLI command timed out: {str(e)}")
-        except CustomError as e:
-            raise CustomError(f"Docker search CLI failed: {str(e)}")
+        return images, shlex.join(cmd)
+
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query for Docker images",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of results to return",
+            },
+            "filter_stars": {
+                "type": "integer",
+                "description": "Minimum number of stars",
+            },
+            "filter_official": {
+                "type": "boolean",
+                "description": "Filter for official images only",
+                "default": False,
+            },
+            "filter_automated": {
+                "type": "boolean",
+                "description": "Filter for automated builds only",
+                "default": False,
+            },
+            "include_description": {
+                "type": "boolean",
+                "description": "Return image descriptions",
+                "default": True,
+            },
+            "cache_ttl": {
+                "type": "number",
+                "description": (
+                    "Seconds to reuse a previous identical search "
+                    "(0 disables caching)"
+                ),
+                "default": 300,
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include the docker command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["query"],
+        "additionalProperties": False,
+    }
 
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Docker search CLI command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Search query for Docker images",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of results to return",
-                },
-                "filter_stars": {
-                    "type": "integer",
-                    "description": "Minimum number of stars",
-                },
-                "filter_official": {
-                    "type": "boolean",
-                    "description": "Filter for official images only",
-                    "default": False,
-                },
-                "filter_automated": {
-                    "type": "boolean",
-                    "description": "Filter for automated builds only",
-                    "default": False,
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["query"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
 
 
 """Module description."""
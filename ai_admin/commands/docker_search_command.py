@@ -1,4 +1,4 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker search command that combines CLI and API methods.
 
@@ -7,11 +7,14 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import asyncio
+import re
+import time
+from collections import OrderedDict
 
-import requests
+from typing import Dict, Any, Optional, List, Tuple
 
-from typing import Dict, Any, Optional, List
+import aiohttp
 
 from datetime import datetime
 
@@ -19,8 +22,35 @@ from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    DOCKER_HUB_API,
+    json_loads,
+    run_docker,
+)
+
+from ai_admin.commands.http_utils import get_http_session, read_body
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+# One row of the 'docker search' table; the description may contain spaces
+_DOCKER_SEARCH_RE = re.compile(
+    r"^(\S+)\s+(.*?)\s+(\d+)(?:\s+(\[OK\]))?(?:\s+(\[OK\]))?\s*$"
+)
+
+# Seconds Docker Hub repository details stay cached
+DETAILS_CACHE_TTL = 300.0
+
+# Maximum number of repositories kept in the details cache
+DETAILS_CACHE_SIZE = 1024
+
+_details_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _hub_repository(image_name: str) -> str:
+    """Get the Docker Hub repository path; official images live under library/."""
+    return image_name if "/" in image_name else f"library/{image_name}"
+
 
 class DockerSearchCommand:
     """Docker search command that combines CLI and API methods."""
@@ -136,7 +166,7 @@ class DockerSearchCommand:
     ) -> Dict[str, Any]:
         """Search using Docker CLI."""
         try:
-            cmd = ["docker", "search"]
+            cmd = [DOCKER_BIN, "search"]
 
             if limit:
                 cmd.extend(["--limit", str(limit)])
@@ -152,53 +182,97 @@ class DockerSearchCommand:
 
             cmd.append(query)
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            returncode, stdout, stderr = await run_docker(cmd)
 
-            if result.returncode != 0:
-                raise CustomError(f"CLI search failed: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"CLI search failed: {stderr}")
 
-            # Parse CLI output
+            # Parse CLI output; the header row locates the AUTOMATED column
             images = []
-            lines = result.stdout.strip().split("\n")
-            if len(lines) > 1:
-                headers = lines[0].split()
-                for line in lines[1:]:
-                    if line.strip():
-                        parts = line.split()
-                        if len(parts) >= len(headers):
-                            image = dict(zip(headers, parts))
-                            images.append(image)
+            lines = stdout.splitlines()
+            automated_at = lines[0].find("AUTOMATED") if lines else -1
+            for line in lines[1:]:
+                match = _DOCKER_SEARCH_RE.match(line)
+                if not match:
+                    continue
+                name, description, stars, official, automated = match.groups()
+                # A single [OK] under the AUTOMATED header is not OFFICIAL
+                if official and not automated and 0 <= automated_at <= match.start(4):
+                    official, automated = None, official
+                images.append(
+                    {
+                        "NAME": name,
+                        "DESCRIPTION": description,
+                        "STARS": stars,
+                        "OFFICIAL": official or "",
+                        "AUTOMATED": automated or "",
+                    }
+                )
 
             return {"images": images}
 
-        except CustomError as e:
+        except (CustomError, DockerError) as e:
             raise CustomError(f"CLI search failed: {str(e)}")
 
     async def _add_image_details(self, images: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Add detailed information to images."""
-        try:
-            detailed_images = []
-            for image in images:
-                image_name = image.get("NAME", "")
-                if image_name:
-                    # Get additional details from Docker Hub API
-                    try:
-                        api_url = f"https://hub.docker.com/v2/repositories/{image_name}"
-                        response = requests.get(api_url, timeout=10)
-                        if response.status_code == 200:
-                            api_data = response.json()
-                            image["description"] = api_data.get("description", "")
-                            image["star_count"] = api_data.get("star_count", 0)
-                            image["pull_count"] = api_data.get("pull_count", 0)
-                    except CustomError:
-                        pass  # Continue without API details
-
-                detailed_images.append(image)
-
-            return {"images": detailed_images}
+        """Add detailed information to images, fetching all of them concurrently.
 
-        except CustomError as e:
-            raise CustomError(f"Failed to add image details: {str(e)}")
+        Each repository is fetched once, even if several results refer to it
+        (e.g. 'nginx' and 'library/nginx').
+        """
+        named = [image for image in images if image.get("NAME")]
+        repositories = list(
+            dict.fromkeys(_hub_repository(image["NAME"]) for image in named)
+        )
+        fetched = await asyncio.gather(
+            *(self._get_image_details(repository) for repository in repositories),
+            return_exceptions=True,
+        )
+        details = dict(zip(repositories, fetched))
+
+        for image in named:
+            api_data = details[_hub_repository(image["NAME"])]
+            if isinstance(api_data, (aiohttp.ClientError, asyncio.TimeoutError)):
+                image["api_error"] = str(api_data) or type(api_data).__name__
+            elif isinstance(api_data, BaseException):
+                raise api_data
+            elif api_data:
+                image["description"] = api_data.get("description", "")
+                image["star_count"] = api_data.get("star_count", 0)
+                image["pull_count"] = api_data.get("pull_count", 0)
+
+        return {"images": images}
+
+    async def _get_image_details(self, image_name: str) -> Optional[Dict[str, Any]]:
+        """Get repository details from Docker Hub API.
+
+        Details are kept in a small LRU cache for DETAILS_CACHE_TTL seconds,
+        so repeated searches for popular images do not hit Docker Hub again.
+
+        Returns:
+            Repository data, or None if Docker Hub has no such repository
+        """
+        image_name = _hub_repository(image_name)
+
+        entry = _details_cache.get(image_name)
+        if entry is not None:
+            if time.monotonic() - entry[0] < DETAILS_CACHE_TTL:
+                _details_cache.move_to_end(image_name)
+                return entry[1]
+            del _details_cache[image_name]
+
+        api_url = f"{DOCKER_HUB_API}/repositories/{image_name}"
+        async with get_http_session().get(
+            api_url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status != 200:
+                return None
+            details = json_loads(await read_body(response))
+
+        _details_cache[image_name] = (time.monotonic(), details)
+        if len(_details_cache) > DETAILS_CACHE_SIZE:
+            _details_cache.popitem(last=False)
+        return details
 
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
@@ -7,14 +7,15 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
-
+import shlex
 from typing import Dict, Any, Optional, List
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import DOCKER_BIN, docker_errors, run_docker
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -31,6 +32,7 @@ class DockerStartCommand:
     async def execute(
         self,
         container_name: str,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -38,6 +40,7 @@ class DockerStartCommand:
 
         Args:
             container_name: Name or ID of the container to start
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -52,6 +55,7 @@ class DockerStartCommand:
         # Use unified security approach
         return await super().execute(
             container_name=container_name,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -64,33 +68,31 @@ class DockerStartCommand:
         """Execute Docker start command logic."""
         return await self._start_container(**kwargs)
 
+    @docker_errors("start")
     async def _start_container(
         self,
         container_name: str,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Start Docker container."""
-        try:
-            # Build Docker command
-            cmd = ["docker", "start", container_name]
-
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        # Build Docker command
+        cmd = [DOCKER_BIN, "start", container_name]
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to start Docker container: {result.stderr}")
+        # Execute command without blocking the event loop
+        returncode, stdout, stderr = await run_docker(cmd)
 
-            return {
-                "message": f"Successfully started container '{container_name}'",
-                "container_name": container_name,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
-            }
+        if returncode != 0:
+            raise CustomError(f"Failed to start Docker container: {stderr}")
 
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Docker start command timed out: {str(e)}")
-        except CustomError as e:
-            raise CustomError(f"Docker start failed: {str(e)}")
+        response = {
+            "message": f"Successfully started container '{container_name}'",
+            "container_name": container_name,
+        }
+        if debug:
+            response["raw_output"] = stdout
+            response["command"] = shlex.join(cmd)
+        return response
 
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
@@ -102,6 +104,11 @@ class DockerStartCommand:
                     "type": "string",
                     "description": "Name or ID of the container to start",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
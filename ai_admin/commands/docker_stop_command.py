@@ -7,7 +7,7 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import shlex
 
 from typing import Dict, Any, Optional, List
 
@@ -15,8 +15,23 @@ from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    FlagSpec,
+    build_flags,
+    docker_errors,
+    run_docker,
+    stop_timeout,
+)
+
+from ai_admin.docker import get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+_STOP_PREFIX = (DOCKER_BIN, "stop")
+
+STOP_FLAGS: FlagSpec = (("timeout", "-t", "value"),)
+
 
 class DockerStopCommand:
     """Stop Docker container."""
@@ -32,6 +47,7 @@ class DockerStopCommand:
         self,
         container_name: str,
         timeout: Optional[int] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -40,6 +56,7 @@ class DockerStopCommand:
         Args:
             container_name: Name or ID of the container to stop
             timeout: Timeout in seconds before killing the container
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -55,6 +72,7 @@ class DockerStopCommand:
         return await super().execute(
             container_name=container_name,
             timeout=timeout,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -67,39 +85,46 @@ class DockerStopCommand:
         """Execute Docker stop command logic."""
         return await self._stop_container(**kwargs)
 
+    @docker_errors("stop")
     async def _stop_container(
         self,
         container_name: str,
         timeout: Optional[int] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Stop Docker container."""
-        try:
-            # Build Docker command
-            cmd = ["docker", "stop"]
-
-            if timeout:
-                cmd.extend(["-t", str(timeout)])
-
-            cmd.append(container_name)
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-
-            if result.returncode != 0:
-                raise CustomError(f"Failed to stop Docker container: {result.stderr}")
-
-            return {
-                "message": f"Successfully stopped container '{container_name}'",
-                "container_name": container_name,
-                "timeout": timeout,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
-            }
-
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Docker stop command timed out: {str(e)}")
-        except CustomError as e:
-            raise CustomError(f"Docker stop failed: {str(e)}")
+        engine = get_engine_client()
+        if engine.available:
+            # Talk to the daemon socket directly, no docker CLI fork
+            params = {"t": str(timeout)} if timeout is not None else None
+            await engine.request(
+                "POST",
+                "/containers/{}/stop",
+                params,
+                segments=(container_name,),
+                timeout=stop_timeout(timeout),
+            )
+            stdout, command = "", f"POST /containers/{container_name}/stop"
+        else:
+            # -t 0 (kill at once) is a valid grace period, unlike a falsy flag
+            grace = {"timeout": None if timeout is None else str(timeout)}
+            cmd = [*_STOP_PREFIX, *build_flags(grace, STOP_FLAGS), container_name]
+            returncode, stdout, stderr = await run_docker(cmd, stop_timeout(timeout))
+
+            if returncode != 0:
+                raise CustomError(f"Failed to stop Docker container: {stderr}")
+            command = shlex.join(cmd)
+
+        response = {
+            "message": f"Successfully stopped container '{container_name}'",
+            "container_name": container_name,
+            "timeout": timeout,
+        }
+        if debug:
+            response["raw_output"] = stdout
+            response["command"] = command
+        return response
 
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
@@ -115,6 +140,11 @@ class DockerStopCommand:
                     "type": "integer",
                     "description": "Timeout in seconds before killing the container",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -1,4 +1,4 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker tag command for creating image tags.
 
@@ -7,14 +7,15 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
-
+import shlex
 from typing import Dict, Any, Optional, List
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import DOCKER_BIN, run_docker
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
 
@@ -36,6 +37,7 @@ class DockerTagCommand:
         self,
         source_image: str,
         target_image: str,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -44,6 +46,7 @@ class DockerTagCommand:
         Args:
             source_image: Source image name with tag (e.g., 'myapp:latest')
             target_image: Target image name with tag (e.g., 'username/myapp:v1.0.0')
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -60,6 +63,7 @@ class DockerTagCommand:
         return await super().execute(
             source_image=source_image,
             target_image=target_image,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -76,28 +80,31 @@ class DockerTagCommand:
         self,
         source_image: str,
         target_image: str,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Tag Docker image."""
         try:
             # Build Docker command
-            cmd = ["docker", "tag", source_image, target_image]
+            cmd = [DOCKER_BIN, "tag", source_image, target_image]
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = await run_docker(cmd, timeout=30)
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to tag Docker image: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Failed to tag Docker image: {stderr}")
 
-            return {
+            response = {
                 "message": f"Successfully tagged '{source_image}' as '{target_image}'",
                 "source_image": source_image,
                 "target_image": target_image,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except DockerError as e:
             raise CustomError(f"Docker tag command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Docker tag failed: {str(e)}")
@@ -116,6 +123,11 @@ class DockerTagCommand:
                     "type": "string",
                     "description": "Target image name with tag (e.g., 'username/myapp:v1.0.0')",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -0,0 +1,328 @@
+"""Docker utilities shared by Docker CLI commands.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+import asyncio
+import functools
+import os
+import shutil
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is an optional speedup
+    import json as _json
+
+from ai_admin.core.custom_exceptions import CustomError, DockerError
+
+# Absolute path of the docker CLI, resolved once instead of on every exec
+DOCKER_BIN = shutil.which("docker") or "docker"
+
+# Docker Hub REST API base URL
+DOCKER_HUB_API = "https://hub.docker.com/v2"
+
+# Seconds a cached docker read result stays valid
+DOCKER_CACHE_TTL = float(os.getenv("DOCKER_CACHE_TTL", "3"))
+
+# Seconds a positive local image lookup stays valid
+IMAGE_EXISTS_TTL = 60.0
+
+# Maximum number of docker read results kept in the cache
+DOCKER_CACHE_SIZE = 512
+
+# Maximum number of docker CLI processes running at once
+DOCKER_CONCURRENCY = int(os.getenv("DOCKER_CONCURRENCY", "8"))
+
+# Grace period in seconds the daemon applies to a stop when none is given
+DEFAULT_STOP_GRACE = 10
+
+# Seconds allowed on top of a stop grace period for the daemon to answer
+STOP_TIMEOUT_MARGIN = 60.0
+
+_docker_semaphore: Optional[asyncio.Semaphore] = None
+
+# (store time, value) per key, least recently used first
+_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+
+# (parameter name, CLI flag, kind) rows consumed by build_flags
+FlagSpec = Tuple[Tuple[str, str, str], ...]
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse docker JSON output, using orjson when it is installed.
+
+    Both orjson and json decode errors subclass ValueError, so callers
+    should catch ValueError.
+    """
+    return _json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON, using orjson when installed."""
+    if _json.__name__ == "orjson":
+        return _json.dumps(data)
+    return _json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def cache_get(key: Tuple[Any, ...], ttl: Optional[float] = None) -> Optional[Any]:
+    """Get a cached value if it has not expired.
+
+    Args:
+        key: Cache key, usually the docker command arguments
+        ttl: Time to live in seconds (defaults to DOCKER_CACHE_TTL)
+
+    Returns:
+        Cached value or None if missing or expired
+    """
+    entry = _CACHE.get(key)
+    if entry is None:
+        return None
+
+    stored_at, value = entry
+    if time.monotonic() - stored_at > (DOCKER_CACHE_TTL if ttl is None else ttl):
+        _CACHE.pop(key, None)
+        return None
+    _CACHE.move_to_end(key)
+    return value
+
+
+def cache_set(key: Tuple[Any, ...], value: Any) -> None:
+    """Store a value in the docker read cache.
+
+    Entries at the least recently used end that no TTL in use can still
+    serve are purged, and the cache is capped at DOCKER_CACHE_SIZE.
+    """
+    now = time.monotonic()
+    _CACHE[key] = (now, value)
+    _CACHE.move_to_end(key)
+
+    max_age = max(DOCKER_CACHE_TTL, IMAGE_EXISTS_TTL)
+    while _CACHE:
+        stored_at, _ = next(iter(_CACHE.values()))
+        if now - stored_at <= max_age and len(_CACHE) <= DOCKER_CACHE_SIZE:
+            break
+        _CACHE.popitem(last=False)
+
+
+def invalidate() -> None:
+    """Drop all cached docker read results after a state change."""
+    _CACHE.clear()
+
+
+def stop_timeout(grace: Optional[int]) -> float:
+    """Seconds to wait for a container stop with the given grace period."""
+    if grace is None:
+        grace = DEFAULT_STOP_GRACE
+    return grace + STOP_TIMEOUT_MARGIN
+
+
+def build_flags(values: Mapping[str, Any], spec: FlagSpec) -> List[str]:
+    """Build docker CLI flags from command parameters.
+
+    Rows whose parameter is missing or falsy are skipped. Supported kinds:
+    "bool" (bare flag), "value" (flag followed by the value), "format"
+    (flag used as a format string for the value), "kv_dict" (flag per
+    key=value item) and "pair_dict" (flag per key:value item).
+
+    Args:
+        values: Command parameters by name
+        spec: Flag table, usually a module constant
+
+    Returns:
+        Flag arguments in spec order
+    """
+    args: List[str] = []
+    for key, flag, kind in spec:
+        value = values.get(key)
+        if not value:
+            continue
+        if kind == "bool":
+            args.append(flag)
+        elif kind == "value":
+            args.extend((flag, str(value)))
+        elif kind == "format":
+            args.append(flag.format(value))
+        elif kind in ("kv_dict", "pair_dict"):
+            separator = "=" if kind == "kv_dict" else ":"
+            # One extend per mapping instead of one per item
+            args.extend(
+                chain.from_iterable(
+                    (flag, f"{item_key}{separator}{item_value}")
+                    for item_key, item_value in value.items()
+                )
+            )
+        else:
+            raise ValueError(f"Unknown flag kind: {kind}")
+    return args
+
+
+async def image_exists_cached(image: str, ttl: float = IMAGE_EXISTS_TTL) -> bool:
+    """Check whether an image is present locally, caching positive answers.
+
+    Args:
+        image: Full image reference (name:tag)
+        ttl: Time to live in seconds for a positive answer
+
+    Returns:
+        True if 'docker image inspect' finds the image
+    """
+    key = ("docker", "image", "inspect", image)
+    if cache_get(key, ttl):
+        return True
+
+    process = await asyncio.create_subprocess_exec(
+        DOCKER_BIN,
+        "image",
+        "inspect",
+        "--format",
+        "{{.Id}}",
+        image,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    await process.wait()
+
+    exists = process.returncode == 0
+    if exists:
+        cache_set(key, True)
+    return exists
+
+
+def docker_errors(operation: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a docker coroutine so failures surface as one CustomError.
+
+    CustomError and DockerError raised by the wrapped coroutine are
+    re-raised as CustomError("Docker <operation> failed: ..."), which the
+    unified command base turns into an ErrorResult.
+
+    Args:
+        operation: Operation name used in the error message
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except (CustomError, DockerError) as e:
+                raise CustomError(f"Docker {operation} failed: {e}")
+
+        return wrapper
+
+    return decorator
+
+
+def _get_docker_semaphore() -> asyncio.Semaphore:
+    """Get the process-wide semaphore bounding docker CLI processes."""
+    global _docker_semaphore
+    if _docker_semaphore is None:
+        _docker_semaphore = asyncio.Semaphore(DOCKER_CONCURRENCY)
+    return _docker_semaphore
+
+
+async def run_docker(
+    cmd: List[str], timeout: float = 60, capture_stdout: bool = True
+) -> Tuple[int, str, str]:
+    """Run a docker CLI command without blocking the event loop.
+
+    At most DOCKER_CONCURRENCY commands run at the same time; the rest
+    wait for a free slot.
+
+    Args:
+        cmd: Full command line, starting with the docker binary
+        timeout: Seconds to wait for the command to finish
+        capture_stdout: Pipe and decode stdout; when False it is discarded
+            and returned as an empty string
+
+    Returns:
+        Tuple of (return code, stdout, stderr)
+
+    Raises:
+        DockerError: If the command does not finish within timeout
+    """
+    async with _get_docker_semaphore():
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=(
+                asyncio.subprocess.PIPE
+                if capture_stdout
+                else asyncio.subprocess.DEVNULL
+            ),
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise DockerError(f"Command timed out after {timeout} seconds")
+
+    return (
+        process.returncode,
+        stdout.decode("utf-8") if capture_stdout else "",
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+async def stream_docker(
+    cmd: List[str],
+    parse_line: Callable[[bytes], Any],
+    timeout: float = 60,
+) -> Tuple[int, List[Any], str]:
+    """Run a docker CLI command, parsing stdout one line at a time.
+
+    Unlike run_docker the raw output is never held in memory as a whole;
+    each non-empty line is handed to parse_line as soon as it arrives.
+
+    Args:
+        cmd: Full command line, starting with the docker binary
+        parse_line: Callback turning one output line into a result, or None
+            to skip the line
+        timeout: Seconds to wait for the command to finish
+
+    Returns:
+        Tuple of (return code, parsed results, stderr)
+
+    Raises:
+        DockerError: If the command does not finish within timeout
+    """
+    results: List[Any] = []
+
+    async def _read_stdout() -> None:
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            if line.strip():
+                item = parse_line(line)
+                if item is not None:
+                    results.append(item)
+
+    async def _read_output() -> bytes:
+        # stderr is drained alongside stdout so a chatty child cannot
+        # block on a full stderr pipe while stdout is being read
+        _, stderr = await asyncio.gather(_read_stdout(), process.stderr.read())
+        await process.wait()
+        return stderr
+
+    async with _get_docker_semaphore():
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stderr = await asyncio.wait_for(_read_output(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise DockerError(f"Command timed out after {timeout} seconds")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    return process.returncode, results, stderr.decode("utf-8", errors="replace")
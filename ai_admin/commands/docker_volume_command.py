@@ -1,4 +1,4 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, DockerError
 
 """Docker volume command for managing volumes.
 
@@ -7,18 +7,65 @@ email: vasilyvz@gmail.com
 """
 
 
-import subprocess
+import asyncio
+import shlex
 
-import json
-
-from typing import Dict, Any, Optional, List
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple, Union
 
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.commands.docker_utils import (
+    DOCKER_BIN,
+    FlagSpec,
+    build_flags,
+    json_loads,
+    run_docker,
+)
+
+from ai_admin.docker import get_engine_client
+
 from ai_admin.security.docker_security_adapter import DockerSecurityAdapter
 
+_VOLUME_PREFIX = (DOCKER_BIN, "volume")
+
+VOLUME_CREATE_FLAGS: FlagSpec = (
+    ("driver", "--driver", "value"),
+    ("labels", "--label", "kv_dict"),
+)
+
+# Maximum number of volumes handled at once by bulk requests
+VOLUME_BULK_CONCURRENCY = 16
+
+# Past-tense verbs for bulk result messages, by action
+_BULK_VERBS = {"create": "Created", "remove": "Removed", "inspect": "Inspected"}
+
+VolumeResult = Tuple[Dict[str, Any], str, Union[str, List[str]]]
+
+
+def _volume_row(volume: Dict[str, Any]) -> Dict[str, str]:
+    """Convert an Engine API volume to a 'docker volume ls --format json' row.
+
+    Reference counts and sizes are not part of the list endpoint; the CLI
+    prints N/A for them as well.
+    """
+    labels = volume.get("Labels") or {}
+    cluster = volume.get("ClusterVolume") or {}
+    spec = cluster.get("Spec") or {}
+    return {
+        "Availability": spec.get("Availability") or "N/A",
+        "Driver": volume.get("Driver", ""),
+        "Group": spec.get("Group") or "N/A",
+        "Labels": ",".join(f"{key}={value}" for key, value in labels.items()),
+        "Links": "N/A",
+        "Mountpoint": volume.get("Mountpoint", ""),
+        "Name": volume.get("Name", ""),
+        "Scope": volume.get("Scope", ""),
+        "Size": "N/A",
+        "Status": "N/A",
+    }
+
 
 class DockerVolumeCommand:
     """Manage Docker volumes."""
@@ -34,36 +81,57 @@ class DockerVolumeCommand:
         self,
         action: str = "list",
         volume_name: Optional[str] = None,
+        volume_names: Optional[List[str]] = None,
+        volumes: Optional[List[Dict[str, Any]]] = None,
         driver: Optional[str] = None,
         labels: Optional[Dict[str, str]] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
         """Execute Docker volume command with unified security.
 
         Args:
-            action: Volume action (list, create, remove, inspect)
+            action: Volume action (list, create, bulk_create, remove, inspect)
             volume_name: Name of the volume
+            volume_names: Names of volumes to remove or inspect concurrently
+            volumes: Volume specs (name, driver, labels) for bulk_create
             driver: Volume driver
             labels: Volume labels
+            debug: Include raw docker output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
             Success result with volume information
         """
         # Validate inputs
-        if action in ["create", "remove", "inspect"] and not volume_name:
+        if action == "create" and not volume_name:
             return ErrorResult(
                 message="Volume name is required for this action",
                 code="VALIDATION_ERROR",
             )
+        if action in ["remove", "inspect"] and not (volume_name or volume_names):
+            return ErrorResult(
+                message="Volume name is required for this action",
+                code="VALIDATION_ERROR",
+            )
+        if action == "bulk_create" and not (
+            volumes and all(spec.get("name") for spec in volumes)
+        ):
+            return ErrorResult(
+                message="bulk_create requires volumes, each with a name",
+                code="VALIDATION_ERROR",
+            )
 
         # Use unified security approach
         return await super().execute(
             action=action,
             volume_name=volume_name,
+            volume_names=volume_names,
+            volumes=volumes,
             driver=driver,
             labels=labels,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -80,135 +148,247 @@ class DockerVolumeCommand:
         self,
         action: str = "list",
         volume_name: Optional[str] = None,
+        volume_names: Optional[List[str]] = None,
+        volumes: Optional[List[Dict[str, Any]]] = None,
         driver: Optional[str] = None,
         labels: Optional[Dict[str, str]] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Manage Docker volume."""
         try:
-            if action == "list":
-                return await self._list_volumes()
+            if volume_names and action in ("remove", "inspect"):
+                names = list(dict.fromkeys([volume_name, *volume_names]))
+                names = [name for name in names if name]
+                operation = (
+                    self._remove_volume if action == "remove" else self._inspect_volume
+                )
+                response, raw_output, command = await self._bulk_volume_action(
+                    action, operation, names
+                )
+            elif action == "bulk_create":
+                specs = {spec["name"]: spec for spec in volumes}
+
+                async def _create_one(name: str) -> VolumeResult:
+                    spec = specs[name]
+                    return await self._create_volume(
+                        name, spec.get("driver"), spec.get("labels")
+                    )
+
+                response, raw_output, command = await self._bulk_volume_action(
+                    "create", _create_one, list(specs)
+                )
+            elif action == "list":
+                response, raw_output, command = await self._list_volumes()
             elif action == "create":
-                return await self._create_volume(volume_name, driver, labels)
+                response, raw_output, command = await self._create_volume(
+                    volume_name, driver, labels
+                )
             elif action == "remove":
-                return await self._remove_volume(volume_name)
+                response, raw_output, command = await self._remove_volume(volume_name)
             elif action == "inspect":
-                return await self._inspect_volume(volume_name)
+                response, raw_output, command = await self._inspect_volume(
+                    volume_name
+                )
             else:
                 raise CustomError(f"Unknown volume action: {action}")
 
-        except CustomError as e:
+        except (CustomError, DockerError) as e:
             raise CustomError(f"Docker volume {action} failed: {str(e)}")
 
-    async def _list_volumes(self) -> Dict[str, Any]:
-        """List Docker volumes."""
-        try:
-            cmd = ["docker", "volume", "ls", "--format", "json"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if debug:
+            response["raw_output"] = raw_output
+            response["command"] = (
+                shlex.join(command) if isinstance(command, list) else command
+            )
+        return response
 
-            if result.returncode != 0:
-                raise CustomError(f"Failed to list volumes: {result.stderr}")
+    async def _bulk_volume_action(
+        self,
+        action: str,
+        operation: Callable[[str], Awaitable[VolumeResult]],
+        names: List[str],
+    ) -> VolumeResult:
+        """Run a single-volume operation for many volumes concurrently.
+
+        At most VOLUME_BULK_CONCURRENCY volumes are processed at a time.
+        Per-volume failures are reported in the result; an error is raised
+        only if every volume failed.
+        """
+        semaphore = asyncio.Semaphore(VOLUME_BULK_CONCURRENCY)
 
-            volumes = []
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    try:
-                        volume = json.loads(line)
-                        volumes.append(volume)
-                    except json.JSONDecodeError:
-                        continue
-
-            return {
-                "message": f"Found {len(volumes)} Docker volumes",
-                "action": "list",
-                "volumes": volumes,
-                "count": len(volumes),
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
+        async def _run_one(name: str) -> VolumeResult:
+            async with semaphore:
+                return await operation(name)
+
+        outcomes = await asyncio.gather(
+            *(_run_one(name) for name in names), return_exceptions=True
+        )
+
+        succeeded = {}
+        failed = {}
+        raw_output = []
+        commands = []
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, (CustomError, DockerError)):
+                failed[name] = str(outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                succeeded[name] = outcome[0]
+                raw_output.append(outcome[1])
+                commands.append(outcome[2])
+
+        if not succeeded:
+            raise CustomError(
+                "; ".join(f"{name}: {error}" for name, error in failed.items())
+            )
+
+        response = {
+            "message": (
+                f"{_BULK_VERBS[action]} {len(succeeded)} of {len(names)} volumes"
+            ),
+            "action": action,
+            "volume_names": names,
+            "status": "partial" if failed else "success",
+            "failed": failed,
+        }
+        if action == "create":
+            response["created"] = list(succeeded)
+        elif action == "remove":
+            response["removed"] = list(succeeded)
+        else:
+            response["volume_data"] = {
+                name: result["volume_data"] for name, result in succeeded.items()
             }
 
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Volume list command timed out: {str(e)}")
+        command = "\n".join(
+            shlex.join(cmd) if isinstance(cmd, list) else cmd for cmd in commands
+        )
+        return response, "".join(raw_output), command
+
+    async def _run_volume_cli(
+        self, args: List[str], action: str
+    ) -> Tuple[str, List[str]]:
+        """Run a 'docker volume' subcommand through the CLI.
+
+        Returns:
+            Tuple of (docker stdout, CLI arguments)
+        """
+        cmd = [*_VOLUME_PREFIX, *args]
+        returncode, stdout, stderr = await run_docker(cmd, timeout=30)
+
+        if returncode != 0:
+            raise CustomError(f"Failed to {action} volume: {stderr}")
+
+        return stdout, cmd
+
+    async def _list_volumes(self) -> VolumeResult:
+        """List Docker volumes."""
+        engine = get_engine_client()
+        if engine.available:
+            # Talk to the daemon socket directly, no docker CLI fork
+            payload = await engine.request("GET", "/volumes")
+            # Same rows as the CLI fallback below
+            volumes = [
+                _volume_row(volume)
+                for volume in (payload or {}).get("Volumes") or []
+            ]
+            stdout, command = "", "GET /volumes"
+        else:
+            stdout, command = await self._run_volume_cli(
+                ["ls", "--format", "json"], "list"
+            )
+            volumes = []
+            for line in stdout.splitlines():
+                if not line:
+                    continue
+                try:
+                    volumes.append(json_loads(line))
+                except ValueError:
+                    continue
+
+        response = {
+            "message": f"Found {len(volumes)} Docker volumes",
+            "action": "list",
+            "volumes": volumes,
+            "count": len(volumes),
+        }
+        return response, stdout, command
 
     async def _create_volume(
         self,
         volume_name: str,
         driver: Optional[str] = None,
         labels: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+    ) -> VolumeResult:
         """Create Docker volume."""
-        try:
-            cmd = ["docker", "volume", "create"]
-
+        engine = get_engine_client()
+        if engine.available:
+            body: Dict[str, Any] = {"Name": volume_name}
             if driver:
-                cmd.extend(["--driver", driver])
-
+                body["Driver"] = driver
             if labels:
-                for key, value in labels.items():
-                    cmd.extend(["--label", f"{key}={value}"])
-
-            cmd.append(volume_name)
-
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise CustomError(f"Failed to create volume: {result.stderr}")
-
-            return {
-                "message": f"Successfully created volume '{volume_name}'",
-                "action": "create",
-                "volume_name": volume_name,
-                "driver": driver,
-                "labels": labels,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
-            }
+                body["Labels"] = labels
+            await engine.request("POST", "/volumes/create", body=body)
+            stdout, command = "", "POST /volumes/create"
+        else:
+            stdout, command = await self._run_volume_cli(
+                ["create", *build_flags(locals(), VOLUME_CREATE_FLAGS), volume_name],
+                "create",
+            )
 
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Volume create command timed out: {str(e)}")
+        response = {
+            "message": f"Successfully created volume '{volume_name}'",
+            "action": "create",
+            "volume_name": volume_name,
+            "driver": driver,
+            "labels": labels,
+        }
+        return response, stdout, command
 
-    async def _remove_volume(self, volume_name: str) -> Dict[str, Any]:
+    async def _remove_volume(
+        self, volume_name: str
+    ) -> VolumeResult:
         """Remove Docker volume."""
-        try:
-            cmd = ["docker", "volume", "rm", volume_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise CustomError(f"Failed to remove volume: {result.stderr}")
-
-            return {
-                "message": f"Successfully removed volume '{volume_name}'",
-                "action": "remove",
-                "volume_name": volume_name,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
-            }
-
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Volume remove command timed out: {str(e)}")
+        engine = get_engine_client()
+        if engine.available:
+            await engine.request("DELETE", "/volumes/{}", segments=(volume_name,))
+            stdout, command = "", f"DELETE /volumes/{volume_name}"
+        else:
+            stdout, command = await self._run_volume_cli(["rm", volume_name], "remove")
+
+        response = {
+            "message": f"Successfully removed volume '{volume_name}'",
+            "action": "remove",
+            "volume_name": volume_name,
+        }
+        return response, stdout, command
 
-    async def _inspect_volume(self, volume_name: str) -> Dict[str, Any]:
+    async def _inspect_volume(
+        self, volume_name: str
+    ) -> VolumeResult:
         """Inspect Docker volume."""
-        try:
-            cmd = ["docker", "volume", "inspect", volume_name]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-            if result.returncode != 0:
-                raise CustomError(f"Failed to inspect volume: {result.stderr}")
-
-            volume_data = json.loads(result.stdout)
-
-            return {
-                "message": f"Inspected volume '{volume_name}'",
-                "action": "inspect",
-                "volume_name": volume_name,
-                "volume_data": volume_data,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
-            }
+        engine = get_engine_client()
+        if engine.available:
+            # 'docker volume inspect' prints a list, keep that shape
+            volume_data = [
+                await engine.request("GET", "/volumes/{}", segments=(volume_name,))
+            ]
+            stdout, command = "", f"GET /volumes/{volume_name}"
+        else:
+            stdout, command = await self._run_volume_cli(
+                ["inspect", volume_name], "inspect"
+            )
+            volume_data = json_loads(stdout)
 
-        except subprocess.TimeoutExpired as e:
-            raise CustomError(f"Volume inspect command timed out: {str(e)}")
+        response = {
+            "message": f"Inspected volume '{volume_name}'",
+            "action": "inspect",
+            "volume_name": volume_name,
+            "volume_data": volume_data,
+        }
+        return response, stdout, command
 
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
@@ -218,13 +398,40 @@ class DockerVolumeCommand:
             "properties": {
                 "action": {
                     "type": "string",
-                    "description": "Volume action (list, create, remove, inspect)",
+                    "description": (
+                        "Volume action (list, create, bulk_create, remove, inspect)"
+                    ),
                     "default": "list",
                 },
                 "volume_name": {
                     "type": "string",
                     "description": "Name of the volume",
                 },
+                "volume_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Names of volumes to remove or inspect concurrently "
+                        "(combined with volume_name)"
+                    ),
+                },
+                "volumes": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "driver": {"type": "string"},
+                            "labels": {
+                                "type": "object",
+                                "additionalProperties": {"type": "string"},
+                            },
+                        },
+                        "required": ["name"],
+                        "additionalProperties": False,
+                    },
+                    "description": "Volumes to create concurrently (bulk_create)",
+                },
                 "driver": {
                     "type": "string",
                     "description": "Volume driver",
@@ -234,6 +441,11 @@ class DockerVolumeCommand:
                     "additionalProperties": {"type": "string"},
                     "description": "Volume labels",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw docker output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -13,6 +13,10 @@ from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.task_queue.queue_manager import QueueManager
+
+from ai_admin.task_queue.task_queue import Task, TaskType
+
 from ai_admin.security.ftp_security_adapter import FtpSecurityAdapter
 
 
@@ -75,23 +79,10 @@ class FtpDeleteCommand:
         try:
             if use_queue:
                 # Use queue for FTP operations
-                from ai_admin.task_queue.task_queue_manager import (
-                    TaskQueueManager,
-                    Task,
-                    TaskType,
-                )
-
-                task_queue = TaskQueueManager()
-                task = Task(
-                    task_type=TaskType.FTP_DELETE,
-                    data={
-                        "remote_path": remote_path,
-                        "operation": "delete",
-                    },
-                    priority=1,
-                )
-
-                task_id = await task_queue.add_task(task)
+                task = self._build_task(remote_path)
+
+                queue_manager = QueueManager()
+                task_id = await queue_manager.add_task(task)
 
                 return {
                     "message": f"FTP delete task queued for '{remote_path}'",
@@ -112,6 +103,18 @@ class FtpDeleteCommand:
         except CustomError as e:
             raise CustomError(f"FTP delete failed: {str(e)}")
 
+    @staticmethod
+    def _build_task(remote_path: str) -> Task:
+        """Build the queue task for an FTP delete."""
+        return Task(
+            task_type=TaskType.FTP_DELETE,
+            params={
+                "remote_path": remote_path,
+                "operation": "delete",
+            },
+            priority=1,
+        )
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for FTP delete command parameters."""
@@ -13,6 +13,10 @@ from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
 
+from ai_admin.task_queue.queue_manager import QueueManager
+
+from ai_admin.task_queue.task_queue import Task, TaskType
+
 from ai_admin.security.ftp_security_adapter import FtpSecurityAdapter
 
 
@@ -87,26 +91,10 @@ class FtpDownloadCommand:
         try:
             if use_queue:
                 # Use queue for FTP operations
-                from ai_admin.task_queue.task_queue_manager import (
-                    TaskQueueManager,
-                    Task,
-                    TaskType,
-                )
-
-                task_queue = TaskQueueManager()
-                task = Task(
-                    task_type=TaskType.FTP_DOWNLOAD,
-                    data={
-                        "remote_path": remote_path,
-                        "local_path": local_path,
-                        "resume": resume,
-                        "overwrite": overwrite,
-                        "operation": "download",
-                    },
-                    priority=1,
-                )
-
-                task_id = await task_queue.add_task(task)
+                task = self._build_task(remote_path, local_path, resume, overwrite)
+
+                queue_manager = QueueManager()
+                task_id = await queue_manager.add_task(task)
 
                 return {
                     "message": f"FTP download task queued for '{remote_path}'",
@@ -133,6 +121,26 @@ class FtpDownloadCommand:
         except CustomError as e:
             raise CustomError(f"FTP download failed: {str(e)}")
 
+    @staticmethod
+    def _build_task(
+        remote_path: str,
+        local_path: Optional[str],
+        resume: bool,
+        overwrite: bool,
+    ) -> Task:
+        """Build the queue task for an FTP download."""
+        return Task(
+            task_type=TaskType.FTP_DOWNLOAD,
+            params={
+                "remote_path": remote_path,
+                "local_path": local_path,
+                "resume": resume,
+                "overwrite": overwrite,
+                "operation": "download",
+            },
+            priority=1,
+        )
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for FTP download command parameters."""
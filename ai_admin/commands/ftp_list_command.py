@@ -8,6 +8,8 @@ email: vasilyvz@gmail.com
 
 from typing import Dict, Any, Optional, List
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.task_queue.queue_manager import QueueManager
+from ai_admin.task_queue.task_queue import Task, TaskType
 from ai_admin.security.ftp_security_adapter import FtpSecurityAdapter
 
 class FtpListCommand(BaseUnifiedCommand):
@@ -63,19 +65,10 @@ class FtpListCommand(BaseUnifiedCommand):
         try:
             if use_queue:
                 # Use queue for FTP operations
-                from ai_admin.task_queue.task_queue_manager import TaskQueueManager, Task, TaskType
+                task = self._build_task(remote_path)
 
-                task_queue = TaskQueueManager()
-                task = Task(
-                    task_type=TaskType.FTP_LIST,
-                    data={
-                        "remote_path": remote_path,
-                        "operation": "list",
-                    },
-                    priority=1,
-                )
-
-                task_id = await task_queue.add_task(task)
+                queue_manager = QueueManager()
+                task_id = await queue_manager.add_task(task)
 
                 return {
                     "message": f"FTP list task queued for '{remote_path}'",
@@ -97,6 +90,18 @@ class FtpListCommand(BaseUnifiedCommand):
         except CustomError as e:
             raise CustomError(f"FTP list failed: {str(e)}")
 
+    @staticmethod
+    def _build_task(remote_path: str) -> Task:
+        """Build the queue task for an FTP listing."""
+        return Task(
+            task_type=TaskType.FTP_LIST,
+            params={
+                "remote_path": remote_path,
+                "operation": "list",
+            },
+            priority=1,
+        )
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for FTP list command parameters."""
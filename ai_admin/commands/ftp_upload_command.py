@@ -9,6 +9,8 @@ import os
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.task_queue.queue_manager import QueueManager
+from ai_admin.task_queue.task_queue import Task, TaskType
 from ai_admin.security.ftp_security_adapter import FtpSecurityAdapter
 from ai_admin.ftp.ftp_client import FTPClient
 
@@ -61,7 +63,9 @@ class FtpUploadCommand(BaseUnifiedCommand):
         if not local_path:
             return ErrorResult(message="Local path is required", code="VALIDATION_ERROR")
         
-        if not os.path.exists(local_path):
+        try:
+            os.stat(local_path)
+        except OSError:
             return ErrorResult(message=f"Local file not found: {local_path}", code="FILE_NOT_FOUND")
 
         # Upload/download operations MUST use queue
@@ -115,9 +119,6 @@ class FtpUploadCommand(BaseUnifiedCommand):
 
             if use_queue:
                 # Use queue for FTP operations
-                from ai_admin.task_queue.queue_manager import queue_manager
-                from ai_admin.task_queue.task_queue import Task, TaskType
-
                 # Set default remote path if not provided
                 if not remote_path:
                     remote_path = f"/{os.path.basename(local_path)}"
@@ -140,6 +141,9 @@ class FtpUploadCommand(BaseUnifiedCommand):
                     priority=1,
                 )
 
+                # Tasks already waiting run before this one
+                queue_manager = QueueManager()
+                queue_position = await queue_manager.get_pending_count()
                 task_id = await queue_manager.add_task(task)
 
                 return {
@@ -151,6 +155,7 @@ class FtpUploadCommand(BaseUnifiedCommand):
                     "use_queue": use_queue,
                     "task_id": task_id,
                     "status": "queued",
+                    "queue_position": queue_position,
                     "host": host,
                     "port": port,
                     "use_ftps": use_ftps,
@@ -196,68 +201,70 @@ class FtpUploadCommand(BaseUnifiedCommand):
         except Exception as e:
             raise CustomError(f"FTP upload failed: {str(e)}")
 
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "local_path": {
+                "type": "string",
+                "description": "Local file path to upload",
+            },
+            "remote_path": {
+                "type": "string",
+                "description": "Remote file path to save to",
+            },
+            "resume": {
+                "type": "boolean",
+                "description": "Resume interrupted upload",
+                "default": False,
+            },
+            "overwrite": {
+                "type": "boolean",
+                "description": "Overwrite existing remote file",
+                "default": False,
+            },
+            "use_queue": {
+                "type": "boolean",
+                "description": "Use queue for operations (ALWAYS True for upload)",
+                "default": True,
+            },
+            "host": {
+                "type": "string",
+                "description": "FTP server hostname",
+            },
+            "port": {
+                "type": "integer",
+                "description": "FTP server port",
+                "default": 21,
+            },
+            "username": {
+                "type": "string",
+                "description": "FTP username",
+            },
+            "password": {
+                "type": "string",
+                "description": "FTP password",
+            },
+            "use_ftps": {
+                "type": "boolean",
+                "description": "Use FTPS (FTP over SSL/TLS)",
+                "default": False,
+            },
+            "passive_mode": {
+                "type": "boolean",
+                "description": "Use passive mode",
+                "default": True,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["local_path"],
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for FTP upload command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "local_path": {
-                    "type": "string",
-                    "description": "Local file path to upload",
-                },
-                "remote_path": {
-                    "type": "string",
-                    "description": "Remote file path to save to",
-                },
-                "resume": {
-                    "type": "boolean",
-                    "description": "Resume interrupted upload",
-                    "default": False,
-                },
-                "overwrite": {
-                    "type": "boolean",
-                    "description": "Overwrite existing remote file",
-                    "default": False,
-                },
-                "use_queue": {
-                    "type": "boolean",
-                    "description": "Use queue for operations (ALWAYS True for upload)",
-                    "default": True,
-                },
-                "host": {
-                    "type": "string",
-                    "description": "FTP server hostname",
-                },
-                "port": {
-                    "type": "integer",
-                    "description": "FTP server port",
-                    "default": 21,
-                },
-                "username": {
-                    "type": "string",
-                    "description": "FTP username",
-                },
-                "password": {
-                    "type": "string",
-                    "description": "FTP password",
-                },
-                "use_ftps": {
-                    "type": "boolean",
-                    "description": "Use FTPS (FTP over SSL/TLS)",
-                    "default": False,
-                },
-                "passive_mode": {
-                    "type": "boolean",
-                    "description": "Use passive mode",
-                    "default": True,
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["local_path"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
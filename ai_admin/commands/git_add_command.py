@@ -1,16 +1,46 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, GitCommandError
 """Git add command for staging files.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
-from typing import Dict, Any, Optional, List
+import asyncio
+import os
+import shlex
+from typing import Dict, Any, Optional, List, Tuple
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult, CommandResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.git_utils import run_git, stage_files
 from ai_admin.security.git_security_adapter import GitSecurityAdapter
 
+# Seconds a plain 'git add <files>' waits for concurrent calls to join it
+GIT_ADD_COALESCE_WINDOW = 0.005
+
+# Path lists longer than this are passed on stdin instead of argv
+GIT_ADD_STDIN_THRESHOLD = 64
+
+# 'git add' outcome: (return code, stdout, stderr, git command)
+AddResult = Tuple[int, str, str, List[str]]
+
+# Batch being collected: one (future for the caller's result, paths) entry
+# per caller; the first caller runs the batch and has no future
+_pending_add: Optional[List[Tuple[Optional[asyncio.Future], List[str]]]] = None
+
+def _pathspec_args(paths: List[str]) -> Tuple[List[str], Optional[bytes]]:
+    """Build the 'git add' path arguments and stdin for a list of paths.
+
+    Long lists are written NUL-separated to stdin, so they never hit the
+    ARG_MAX limit of the command line.
+
+    Returns:
+        Tuple of (arguments, stdin data or None)
+    """
+    if len(paths) > GIT_ADD_STDIN_THRESHOLD:
+        data = b"\0".join(os.fsencode(path) for path in paths)
+        return ["--pathspec-from-file=-", "--pathspec-file-nul"], data
+    return ["--", *paths], None
+
 class GitAddCommand(BaseUnifiedCommand):
     """Add files to Git staging area.
 
@@ -41,6 +71,7 @@ class GitAddCommand(BaseUnifiedCommand):
             verbose: Verbose output
             dry_run: Dry run mode
             ignore_errors: Ignore errors
+            debug: Include raw git output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -88,6 +119,7 @@ class GitAddCommand(BaseUnifiedCommand):
         verbose: bool = False,
         dry_run: bool = False,
         ignore_errors: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Add files to Git staging area."""
@@ -111,19 +143,28 @@ class GitAddCommand(BaseUnifiedCommand):
             elif ignore_errors:
                 cmd.append("--ignore-errors")
 
-            # Add files
-            if files:
-                cmd.extend(files)
-            elif not all_files and not interactive and not patch:
-                cmd.append(".")
+            if files and len(cmd) == 2:
+                # Plain file list, share one git process and index write
+                # with concurrent callers
+                returncode, stdout, stderr, cmd = await self._add_coalesced(files)
+            else:
+                # Add files
+                input_data = None
+                if files:
+                    args, input_data = _pathspec_args(files)
+                    cmd.extend(args)
+                elif not all_files and not interactive and not patch:
+                    cmd.append(".")
 
-            # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+                # Execute command
+                returncode, stdout, stderr = await run_git(
+                    cmd, input_data=input_data
+                )
 
-            if result.returncode != 0 and not ignore_errors:
-                raise CustomError(f"Git add failed: {result.stderr}")
+            if returncode != 0 and not ignore_errors:
+                raise CustomError(f"Git add failed ({shlex.join(cmd)}): {stderr}")
 
-            return {
+            response = {
                 "message": f"Git add completed successfully",
                 "files": files,
                 "all_files": all_files,
@@ -133,66 +174,150 @@ class GitAddCommand(BaseUnifiedCommand):
                 "verbose": verbose,
                 "dry_run": dry_run,
                 "ignore_errors": ignore_errors,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except GitCommandError as e:
             raise CustomError(f"Git add command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Git add failed: {str(e)}")
 
+    @staticmethod
+    async def _add_coalesced(files: List[str]) -> AddResult:
+        """Stage files together with other calls arriving within the window.
+
+        The first caller waits GIT_ADD_COALESCE_WINDOW seconds, then stages
+        the union of all paths collected meanwhile with a single 'git add'.
+        Concurrent adds would otherwise serialize on .git/index.lock (or
+        fail on it). Every caller gets a result for its own paths only.
+
+        Returns:
+            Tuple of (return code, stdout, stderr, git command)
+        """
+        global _pending_add
+        if _pending_add is not None:
+            future = asyncio.get_running_loop().create_future()
+            _pending_add.append((future, files))
+            return await asyncio.shield(future)
+
+        batch: List[Tuple[Optional[asyncio.Future], List[str]]] = [(None, files)]
+        _pending_add = batch
+        try:
+            try:
+                await asyncio.sleep(GIT_ADD_COALESCE_WINDOW)
+            finally:
+                _pending_add = None
+
+            results = await GitAddCommand._add_batch([paths for _, paths in batch])
+        except asyncio.CancelledError:
+            for future, _ in batch[1:]:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future, _ in batch[1:]:
+                future.set_exception(e)
+                # Only waiters need the exception, don't warn when there are none
+                future.exception()
+            raise
+
+        for (future, _), result in zip(batch[1:], results[1:]):
+            future.set_result(result)
+        return results[0]
+
+    @staticmethod
+    async def _add_batch(path_lists: List[List[str]]) -> List[AddResult]:
+        """Stage the paths of several callers, returning one result each.
+
+        The union is staged first. 'git add' stages nothing when any
+        pathspec fails to match, so on failure every caller's paths are
+        staged again on their own; one caller's typo then does not fail
+        the others.
+        """
+        union = list(dict.fromkeys(path for paths in path_lists for path in paths))
+        returncode, stdout, stderr, _ = await GitAddCommand._add_paths(union)
+        if returncode != 0 and len(path_lists) > 1:
+            return [
+                await GitAddCommand._add_paths(list(dict.fromkeys(paths)))
+                for paths in path_lists
+            ]
+
+        results = []
+        for paths in path_lists:
+            args, _ = _pathspec_args(list(dict.fromkeys(paths)))
+            results.append((returncode, stdout, stderr, ["git", "add", *args]))
+        return results
+
+    @staticmethod
+    async def _add_paths(paths: List[str]) -> AddResult:
+        """Stage paths with a single 'git add', or in process with pygit2."""
+        args, input_data = _pathspec_args(paths)
+        cmd = ["git", "add", *args]
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, stage_files, paths):
+            return 0, "", "", cmd
+        return (*await run_git(cmd, input_data=input_data), cmd)
+
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "files": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of files to add",
+            },
+            "all_files": {
+                "type": "boolean",
+                "description": "Add all files",
+                "default": False,
+            },
+            "interactive": {
+                "type": "boolean",
+                "description": "Interactive mode",
+                "default": False,
+            },
+            "patch": {
+                "type": "boolean",
+                "description": "Patch mode",
+                "default": False,
+            },
+            "force": {
+                "type": "boolean",
+                "description": "Force adding",
+                "default": False,
+            },
+            "verbose": {
+                "type": "boolean",
+                "description": "Verbose output",
+                "default": False,
+            },
+            "dry_run": {
+                "type": "boolean",
+                "description": "Dry run mode",
+                "default": False,
+            },
+            "ignore_errors": {
+                "type": "boolean",
+                "description": "Ignore errors",
+                "default": False,
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw git output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Git add command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "files": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of files to add",
-                },
-                "all_files": {
-                    "type": "boolean",
-                    "description": "Add all files",
-                    "default": False,
-                },
-                "interactive": {
-                    "type": "boolean",
-                    "description": "Interactive mode",
-                    "default": False,
-                },
-                "patch": {
-                    "type": "boolean",
-                    "description": "Patch mode",
-                    "default": False,
-                },
-                "force": {
-                    "type": "boolean",
-                    "description": "Force adding",
-                    "default": False,
-                },
-                "verbose": {
-                    "type": "boolean",
-                    "description": "Verbose output",
-                    "default": False,
-                },
-                "dry_run": {
-                    "type": "boolean",
-                    "description": "Dry run mode",
-                    "default": False,
-                },
-                "ignore_errors": {
-                    "type": "boolean",
-                    "description": "Ignore errors",
-                    "default": False,
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
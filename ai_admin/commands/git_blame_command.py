@@ -1,14 +1,15 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, GitCommandError
 """Git blame command for showing file blame information.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.git_utils import run_git
 from ai_admin.security.git_security_adapter import GitSecurityAdapter
 
 class GitBlameCommand(BaseUnifiedCommand):
@@ -47,6 +48,7 @@ class GitBlameCommand(BaseUnifiedCommand):
         show_rev: bool = True,
         show_summary: bool = False,
         show_progress: bool = False,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -68,6 +70,7 @@ class GitBlameCommand(BaseUnifiedCommand):
             show_rev: Show revision numbers
             show_summary: Show summary
             show_progress: Show progress
+            debug: Include raw git output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -94,6 +97,7 @@ class GitBlameCommand(BaseUnifiedCommand):
             show_rev=show_rev,
             show_summary=show_summary,
             show_progress=show_progress,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -123,6 +127,7 @@ class GitBlameCommand(BaseUnifiedCommand):
         show_rev: bool = True,
         show_summary: bool = False,
         show_progress: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Show Git blame information for file."""
@@ -168,12 +173,12 @@ class GitBlameCommand(BaseUnifiedCommand):
                 cmd.extend(["-L", f"{start_line},+1"])
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            returncode, stdout, stderr = await run_git(cmd)
 
-            if result.returncode != 0:
-                raise CustomError(f"Git blame failed: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Git blame failed ({shlex.join(cmd)}): {stderr}")
 
-            return {
+            response = {
                 "message": f"Git blame completed for '{file_path}'",
                 "file_path": file_path,
                 "commit": commit,
@@ -190,99 +195,108 @@ class GitBlameCommand(BaseUnifiedCommand):
                 "show_rev": show_rev,
                 "show_summary": show_summary,
                 "show_progress": show_progress,
-                "blame_output": result.stdout,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
+                "blame_output": stdout,
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except GitCommandError as e:
             raise CustomError(f"Git blame command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Git blame failed: {str(e)}")
 
+    _SCHEMA: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "file_path": {
+                "type": "string",
+                "description": "Path to the file to blame",
+            },
+            "commit": {
+                "type": "string",
+                "description": "Specific commit to blame",
+            },
+            "start_line": {
+                "type": "integer",
+                "description": "Start line number",
+            },
+            "end_line": {
+                "type": "integer",
+                "description": "End line number",
+            },
+            "line_number": {
+                "type": "boolean",
+                "description": "Show line numbers",
+                "default": True,
+            },
+            "show_name": {
+                "type": "boolean",
+                "description": "Show author names",
+                "default": True,
+            },
+            "show_email": {
+                "type": "boolean",
+                "description": "Show author emails",
+                "default": True,
+            },
+            "show_date": {
+                "type": "boolean",
+                "description": "Show commit dates",
+                "default": True,
+            },
+            "show_time": {
+                "type": "boolean",
+                "description": "Show commit times",
+                "default": False,
+            },
+            "show_timezone": {
+                "type": "boolean",
+                "description": "Show timezones",
+                "default": False,
+            },
+            "show_filename": {
+                "type": "boolean",
+                "description": "Show filenames",
+                "default": False,
+            },
+            "show_linenumber": {
+                "type": "boolean",
+                "description": "Show line numbers",
+                "default": True,
+            },
+            "show_rev": {
+                "type": "boolean",
+                "description": "Show revision numbers",
+                "default": True,
+            },
+            "show_summary": {
+                "type": "boolean",
+                "description": "Show summary",
+                "default": False,
+            },
+            "show_progress": {
+                "type": "boolean",
+                "description": "Show progress",
+                "default": False,
+            },
+            "debug": {
+                "type": "boolean",
+                "description": "Include raw git output and command line",
+                "default": False,
+            },
+            "user_roles": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of user roles for security validation",
+            },
+        },
+        "required": ["file_path"],
+        "additionalProperties": False,
+    }
+
     @classmethod
     def get_schema(cls) -> Dict[str, Any]:
         """Get JSON schema for Git blame command parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "file_path": {
-                    "type": "string",
-                    "description": "Path to the file to blame",
-                },
-                "commit": {
-                    "type": "string",
-                    "description": "Specific commit to blame",
-                },
-                "start_line": {
-                    "type": "integer",
-                    "description": "Start line number",
-                },
-                "end_line": {
-                    "type": "integer",
-                    "description": "End line number",
-                },
-                "line_number": {
-                    "type": "boolean",
-                    "description": "Show line numbers",
-                    "default": True,
-                },
-                "show_name": {
-                    "type": "boolean",
-                    "description": "Show author names",
-                    "default": True,
-                },
-                "show_email": {
-                    "type": "boolean",
-                    "description": "Show author emails",
-                    "default": True,
-                },
-                "show_date": {
-                    "type": "boolean",
-                    "description": "Show commit dates",
-                    "default": True,
-                },
-                "show_time": {
-                    "type": "boolean",
-                    "description": "Show commit times",
-                    "default": False,
-                },
-                "show_timezone": {
-                    "type": "boolean",
-                    "description": "Show timezones",
-                    "default": False,
-                },
-                "show_filename": {
-                    "type": "boolean",
-                    "description": "Show filenames",
-                    "default": False,
-                },
-                "show_linenumber": {
-                    "type": "boolean",
-                    "description": "Show line numbers",
-                    "default": True,
-                },
-                "show_rev": {
-                    "type": "boolean",
-                    "description": "Show revision numbers",
-                    "default": True,
-                },
-                "show_summary": {
-                    "type": "boolean",
-                    "description": "Show summary",
-                    "default": False,
-                },
-                "show_progress": {
-                    "type": "boolean",
-                    "description": "Show progress",
-                    "default": False,
-                },
-                "user_roles": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of user roles for security validation",
-                },
-            },
-            "required": ["file_path"],
-            "additionalProperties": False,
-        }
+        return cls._SCHEMA
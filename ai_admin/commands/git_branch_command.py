@@ -1,16 +1,37 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, GitCommandError
 """Git branch command for managing branches.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
-from typing import Dict, Any, Optional, List
+import os
+import shlex
+from typing import Dict, Any, Optional, List, Tuple
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.git_utils import refs_state, run_git
 from ai_admin.security.git_security_adapter import GitSecurityAdapter
 
+# One tab-separated line per local branch: current marker, name, upstream
+# and ahead/behind state; git forbids tabs in ref names
+_BRANCH_LIST_FORMAT = (
+    "%(HEAD)%09%(refname:short)%09%(upstream:short)%09%(upstream:track)"
+)
+
+# Last branch listing per work tree, with the refs state it was built from
+_branch_list_cache: Dict[str, Tuple[Tuple[int, ...], Dict[str, Any]]] = {}
+
+def _listing(response: Dict[str, Any], debug: bool) -> Dict[str, Any]:
+    """Copy a cached listing, dropping git output unless debugging."""
+    if debug:
+        return dict(response)
+    return {
+        key: value
+        for key, value in response.items()
+        if key not in ("raw_output", "command")
+    }
+
 class GitBranchCommand(BaseUnifiedCommand):
     """Manage Git branches.
 
@@ -39,6 +60,7 @@ class GitBranchCommand(BaseUnifiedCommand):
         rename: bool = False,
         new_name: Optional[str] = None,
         set_upstream: Optional[str] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -53,6 +75,7 @@ class GitBranchCommand(BaseUnifiedCommand):
             rename: Rename branch
             new_name: New name for branch
             set_upstream: Set upstream branch
+            debug: Include raw git output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -68,6 +91,7 @@ class GitBranchCommand(BaseUnifiedCommand):
             rename=rename,
             new_name=new_name,
             set_upstream=set_upstream,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -91,37 +115,56 @@ class GitBranchCommand(BaseUnifiedCommand):
         else:
             raise CustomError(f"Unknown branch action: {action}")
 
-    async def _list_branches(self, **kwargs) -> Dict[str, Any]:
-        """List Git branches."""
-        try:
-            cmd = ["git", "branch", "--list"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    async def _list_branches(self, debug: bool = False, **kwargs) -> Dict[str, Any]:
+        """List Git branches.
+
+        The listing is reused while the refs state of the work tree is
+        unchanged, so repeated calls only cost a few stat calls.
+        """
+        work_tree = os.getcwd()
+        state = refs_state(work_tree)
+        cached = _branch_list_cache.get(work_tree)
+        if state is not None and cached is not None and cached[0] == state:
+            return _listing(cached[1], debug)
 
-            if result.returncode != 0:
-                raise CustomError(f"Git branch list failed: {result.stderr}")
+        try:
+            # Current branch and upstream tracking come with the same call
+            cmd = [
+                "git",
+                "for-each-ref",
+                f"--format={_BRANCH_LIST_FORMAT}",
+                "refs/heads",
+            ]
+            returncode, stdout, stderr = await run_git(cmd, timeout=30)
+
+            if returncode != 0:
+                raise CustomError(f"Git branch list failed: {stderr}")
 
             branches = []
-            for line in result.stdout.strip().split("\n"):
-                if line.strip():
-                    branch_info = line.strip()
-                    is_current = branch_info.startswith("*")
-                    branch_name = branch_info.lstrip("* ").strip()
-                    branches.append({
-                        "name": branch_name,
-                        "current": is_current,
-                        "raw": branch_info,
-                    })
-
-            return {
+            for line in stdout.splitlines():
+                head, branch_name, upstream, track = line.split("\t", 3)
+                is_current = head == "*"
+                branches.append({
+                    "name": branch_name,
+                    "current": is_current,
+                    "upstream": upstream or None,
+                    "track": track or None,
+                    "raw": f"* {branch_name}" if is_current else branch_name,
+                })
+
+            response = {
                 "message": f"Found {len(branches)} branches",
                 "action": "list",
                 "branches": branches,
                 "count": len(branches),
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
+                "raw_output": stdout,
+                "command": shlex.join(cmd),
             }
+            if state is not None:
+                _branch_list_cache[work_tree] = (state, response)
+            return _listing(response, debug)
 
-        except subprocess.TimeoutExpired as e:
+        except GitCommandError as e:
             raise CustomError(f"Git branch list command timed out: {str(e)}")
 
     async def _create_branch(
@@ -129,6 +172,7 @@ class GitBranchCommand(BaseUnifiedCommand):
         branch_name: str,
         start_point: Optional[str] = None,
         force: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Create Git branch."""
@@ -143,28 +187,31 @@ class GitBranchCommand(BaseUnifiedCommand):
             else:
                 cmd.append(branch_name)
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = await run_git(cmd, timeout=30)
 
-            if result.returncode != 0:
-                raise CustomError(f"Git branch create failed: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Git branch create failed: {stderr}")
 
-            return {
+            response = {
                 "message": f"Created branch '{branch_name}'",
                 "action": "create",
                 "branch_name": branch_name,
                 "start_point": start_point,
                 "force": force,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except GitCommandError as e:
             raise CustomError(f"Git branch create command timed out: {str(e)}")
 
     async def _delete_branch(
         self,
         branch_name: str,
         force: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Delete Git branch."""
@@ -176,21 +223,23 @@ class GitBranchCommand(BaseUnifiedCommand):
 
             cmd.extend(["--delete", branch_name])
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = await run_git(cmd, timeout=30)
 
-            if result.returncode != 0:
-                raise CustomError(f"Git branch delete failed: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Git branch delete failed: {stderr}")
 
-            return {
+            response = {
                 "message": f"Deleted branch '{branch_name}'",
                 "action": "delete",
                 "branch_name": branch_name,
                 "force": force,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except GitCommandError as e:
             raise CustomError(f"Git branch delete command timed out: {str(e)}")
 
     async def _rename_branch(
@@ -198,6 +247,7 @@ class GitBranchCommand(BaseUnifiedCommand):
         branch_name: str,
         new_name: str,
         force: bool = False,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Rename Git branch."""
@@ -209,22 +259,24 @@ class GitBranchCommand(BaseUnifiedCommand):
 
             cmd.extend(["--move", branch_name, new_name])
 
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            returncode, stdout, stderr = await run_git(cmd, timeout=30)
 
-            if result.returncode != 0:
-                raise CustomError(f"Git branch rename failed: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Git branch rename failed: {stderr}")
 
-            return {
+            response = {
                 "message": f"Renamed branch '{branch_name}' to '{new_name}'",
                 "action": "rename",
                 "branch_name": branch_name,
                 "new_name": new_name,
                 "force": force,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except GitCommandError as e:
             raise CustomError(f"Git branch rename command timed out: {str(e)}")
 
     @classmethod
@@ -270,6 +322,11 @@ class GitBranchCommand(BaseUnifiedCommand):
                     "type": "string",
                     "description": "Set upstream branch",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw git output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
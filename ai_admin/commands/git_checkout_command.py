@@ -1,14 +1,15 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, GitCommandError
 """Git checkout command for switching branches and commits.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
-import subprocess
+import shlex
 from typing import Dict, Any, Optional, List
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
 from ai_admin.commands.base_unified_command import BaseUnifiedCommand
+from ai_admin.commands.git_utils import run_git
 from ai_admin.security.git_security_adapter import GitSecurityAdapter
 
 class GitCheckoutCommand(BaseUnifiedCommand):
@@ -36,6 +37,7 @@ class GitCheckoutCommand(BaseUnifiedCommand):
         force: bool = False,
         files: Optional[List[str]] = None,
         repository_path: Optional[str] = None,
+        debug: bool = False,
         user_roles: Optional[List[str]] = None,
         **kwargs,
     ) -> SuccessResult:
@@ -47,6 +49,7 @@ class GitCheckoutCommand(BaseUnifiedCommand):
             force: Force checkout
             files: List of files to checkout
             repository_path: Path to repository
+            debug: Include raw git output and command line in the result
             user_roles: List of user roles for security validation
 
         Returns:
@@ -63,6 +66,7 @@ class GitCheckoutCommand(BaseUnifiedCommand):
             force=force,
             files=files,
             repository_path=repository_path,
+            debug=debug,
             user_roles=user_roles,
             **kwargs,
         )
@@ -82,6 +86,7 @@ class GitCheckoutCommand(BaseUnifiedCommand):
         force: bool = False,
         files: Optional[List[str]] = None,
         repository_path: Optional[str] = None,
+        debug: bool = False,
         **kwargs,
     ) -> Dict[str, Any]:
         """Checkout Git target."""
@@ -103,23 +108,25 @@ class GitCheckoutCommand(BaseUnifiedCommand):
                 cmd.extend(files)
 
             # Execute command
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            returncode, stdout, stderr = await run_git(cmd, cwd=repository_path)
 
-            if result.returncode != 0:
-                raise CustomError(f"Git checkout failed: {result.stderr}")
+            if returncode != 0:
+                raise CustomError(f"Git checkout failed: {stderr}")
 
-            return {
+            response = {
                 "message": f"Checked out '{target}'",
                 "target": target,
                 "create_branch": create_branch,
                 "force": force,
                 "files": files,
                 "repository_path": repository_path,
-                "raw_output": result.stdout,
-                "command": " ".join(cmd),
             }
+            if debug:
+                response["raw_output"] = stdout
+                response["command"] = shlex.join(cmd)
+            return response
 
-        except subprocess.TimeoutExpired as e:
+        except GitCommandError as e:
             raise CustomError(f"Git checkout command timed out: {str(e)}")
         except CustomError as e:
             raise CustomError(f"Git checkout failed: {str(e)}")
@@ -153,6 +160,11 @@ class GitCheckoutCommand(BaseUnifiedCommand):
                     "type": "string",
                     "description": "Path to repository",
                 },
+                "debug": {
+                    "type": "boolean",
+                    "description": "Include raw git output and command line",
+                    "default": False,
+                },
                 "user_roles": {
                     "type": "array",
                     "items": {"type": "string"},
@@ -1,15 +1,229 @@
-from ai_admin.core.custom_exceptions import CustomError
+from ai_admin.core.custom_exceptions import CustomError, GitCommandError
 """Git utilities for common Git operations.
 
 Author: Vasiliy Zdanovskiy
 email: vasilyvz@gmail.com
 """
 
+import asyncio
 import os
 import subprocess
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
-def load_config() -> Dict[str]:
+try:
+    import pygit2
+except ImportError:  # pygit2 is an optional speedup
+    pygit2 = None
+
+# Maximum number of git processes running at once in one directory
+GIT_CONCURRENCY = int(os.getenv("GIT_CONCURRENCY", "4"))
+
+_git_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+# Open pygit2 repositories by starting directory, reused across calls
+_REPO_CACHE: Dict[str, Any] = {}
+
+# libgit2 index objects must not be modified from two threads at once
+_index_lock = threading.Lock()
+
+def _get_git_semaphore(cwd: Optional[str]) -> asyncio.Semaphore:
+    """Get the semaphore bounding git processes started in cwd."""
+    key = os.path.abspath(cwd or os.getcwd())
+    semaphore = _git_semaphores.get(key)
+    if semaphore is None:
+        semaphore = _git_semaphores[key] = asyncio.Semaphore(GIT_CONCURRENCY)
+    return semaphore
+
+async def run_git(
+    cmd: List[str],
+    cwd: Optional[str] = None,
+    timeout: float = 60,
+    input_data: Optional[bytes] = None,
+) -> Tuple[int, str, str]:
+    """Run a git command without blocking the event loop.
+
+    At most GIT_CONCURRENCY commands run at the same time in one directory,
+    since they contend on the same .git/index.lock; the rest wait for a
+    free slot.
+
+    Args:
+        cmd: Full command line, starting with the git binary
+        cwd: Working directory for the command
+        timeout: Seconds to wait for the command to finish
+        input_data: Bytes written to the command's stdin
+
+    Returns:
+        Tuple of (return code, stdout, stderr)
+
+    Raises:
+        GitCommandError: If the command does not finish within timeout
+    """
+    async with _get_git_semaphore(cwd):
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if input_data is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(input_data), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise GitCommandError(f"Command timed out after {timeout} seconds")
+
+    return process.returncode, stdout.decode("utf-8"), stderr.decode("utf-8")
+
+def get_repository(path: Optional[str] = None) -> Optional[Any]:
+    """Get a cached pygit2 repository containing path.
+
+    Args:
+        path: Directory inside the work tree (defaults to the current one)
+
+    Returns:
+        Repository, or None if pygit2 is not installed or path is not
+        inside a non-bare repository
+    """
+    if pygit2 is None:
+        return None
+
+    start = os.path.abspath(path or os.getcwd())
+    repo = _REPO_CACHE.get(start)
+    if repo is None:
+        root = pygit2.discover_repository(start)
+        if root is None:
+            return None
+        repo = pygit2.Repository(root)
+        if repo.is_bare:
+            return None
+        _REPO_CACHE[start] = repo
+    return repo
+
+def stage_files(paths: List[str], cwd: Optional[str] = None) -> bool:
+    """Stage files through libgit2 without starting a git process.
+
+    Only existing, non-ignored regular files inside the work tree are
+    staged here. Anything else (globs, directories, deletions, ignored or
+    missing paths) needs git's own pathspec rules and error messages, so
+    False is returned without touching the index and the caller should
+    run 'git add' instead. The same goes for files with a 'filter'
+    attribute: libgit2 does not run external clean filters such as
+    git-lfs, and would stage the raw content.
+
+    Args:
+        paths: File paths, relative to cwd or absolute
+        cwd: Directory the paths are relative to (defaults to the current one)
+
+    Returns:
+        True if every path was staged, False if the git CLI must be used
+    """
+    repo = get_repository(cwd)
+    if repo is None:
+        return False
+
+    base = os.path.abspath(cwd or os.getcwd())
+    workdir = repo.workdir
+    relative = []
+    for path in paths:
+        full = os.path.join(base, path)
+        rel = os.path.relpath(full, workdir)
+        if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+            return False
+        if not os.path.isfile(full) or repo.path_is_ignored(rel):
+            return False
+        if repo.get_attr(rel, "filter"):
+            return False
+        relative.append(rel)
+
+    try:
+        with _index_lock:
+            index = repo.index
+            # Pick up changes written by git processes since the last call
+            index.read(False)
+            for rel in relative:
+                index.add(rel)
+            index.write()
+    except (pygit2.GitError, OSError):
+        return False
+    return True
+
+def find_git_dir(path: Optional[str] = None) -> Optional[str]:
+    """Find the git directory holding the refs of the work tree at path.
+
+    Walks up from path like git does, follows a '.git' file (worktrees,
+    submodules) and its commondir, without starting a git process.
+
+    Args:
+        path: Directory inside the work tree (defaults to the current one)
+
+    Returns:
+        Absolute path of the git directory, or None if none is found
+    """
+    current = os.path.abspath(path or os.getcwd())
+    while True:
+        git_dir = os.path.join(current, ".git")
+        if os.path.isfile(git_dir):
+            with open(git_dir, "r") as f:
+                content = f.read().strip()
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = os.path.join(current, content[len("gitdir:"):].strip())
+        if os.path.isdir(git_dir):
+            commondir = os.path.join(git_dir, "commondir")
+            if os.path.isfile(commondir):
+                with open(commondir, "r") as f:
+                    git_dir = os.path.join(git_dir, f.read().strip())
+            return os.path.normpath(git_dir)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+def refs_state(path: Optional[str] = None) -> Optional[Tuple[int, ...]]:
+    """Fingerprint branch refs of the repository at path with stat calls.
+
+    Collects modification times of HEAD, packed-refs, config and every
+    directory under refs/heads and refs/remotes. Git updates a ref by
+    renaming a new file into its directory, so any branch change alters
+    the result.
+
+    Args:
+        path: Directory inside the work tree (defaults to the current one)
+
+    Returns:
+        Tuple of modification times in nanoseconds, or None when the refs
+        cannot be located or were changed too recently to be trusted
+    """
+    if os.getenv("GIT_DIR"):
+        return None
+    git_dir = find_git_dir(path)
+    if git_dir is None:
+        return None
+
+    paths = [os.path.join(git_dir, name) for name in ("HEAD", "packed-refs", "config")]
+    for refs in ("heads", "remotes"):
+        for root, _dirs, _files in os.walk(os.path.join(git_dir, "refs", refs)):
+            paths.append(root)
+
+    state = []
+    for state_path in paths:
+        try:
+            state.append(os.stat(state_path).st_mtime_ns)
+        except FileNotFoundError:
+            state.append(0)
+
+    # Changes within the filesystem's timestamp granularity may not show
+    # up, so refs touched in the last two seconds are never trusted
+    if max(state) > time.time_ns() - 2_000_000_000:
+        return None
+    return tuple(state)
+
+def load_config() -> Dict[str, Any]:
     """Load configuration from config file."""
     try:
         config_path = os.path.join(os.path.dirname(__file__), "..", "config", "config.json")
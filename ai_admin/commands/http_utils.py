@@ -0,0 +1,76 @@
+"""HTTP utilities shared by commands that call remote APIs.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from typing import Optional
+
+import aiohttp
+
+# Total request timeout in seconds unless a call passes its own
+HTTP_TIMEOUT = 30
+
+# Largest response body read into memory by read_body
+HTTP_MAX_RESPONSE_BYTES = 1024 * 1024
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the process-wide HTTP session, creating it on first use.
+
+    All commands share one connection pool, so TCP and TLS handshakes to
+    the same host (e.g. hub.docker.com) are paid once, not per command.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        )
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session."""
+    global _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
+
+
+async def read_body(
+    response: aiohttp.ClientResponse, max_bytes: int = HTTP_MAX_RESPONSE_BYTES
+) -> bytes:
+    """Read a response body, refusing bodies larger than max_bytes.
+
+    Args:
+        response: Response whose body has not been read yet
+        max_bytes: Maximum accepted body size
+
+    Returns:
+        Response body
+
+    Raises:
+        aiohttp.ClientPayloadError: If the body exceeds max_bytes
+    """
+    too_large = aiohttp.ClientPayloadError(
+        f"Response from {response.url} is larger than {max_bytes} bytes"
+    )
+    if response.content_length is not None and response.content_length > max_bytes:
+        raise too_large
+
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        size += len(chunk)
+        if size > max_bytes:
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
@@ -30,6 +30,12 @@ from ai_admin.core.custom_exceptions.docker_errors import (
     DockerImageError,
     DockerNetworkError,
 )
+from ai_admin.core.custom_exceptions.git_errors import (
+    GitAuthenticationError,
+    GitCommandError,
+    GitError,
+    GitRepositoryError,
+)
 from ai_admin.core.custom_exceptions.kubernetes_errors import (
     K8sCertificateError,
     K8sConfigMapError,
@@ -0,0 +1,14 @@
+"""
+Docker Engine API access for AI Admin Server
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+from .engine_client import DockerEngineClient, api_path, get_engine_client
+
+__all__ = [
+    "DockerEngineClient",
+    "api_path",
+    "get_engine_client",
+]
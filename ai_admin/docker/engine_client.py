@@ -0,0 +1,292 @@
+"""
+Docker Engine API client talking to the daemon over its UNIX socket or
+a DOCKER_HOST tcp:// endpoint.
+
+Author: Vasiliy Zdanovskiy
+email: vasilyvz@gmail.com
+"""
+
+import asyncio
+import logging
+import os
+import ssl
+from typing import Any, Dict, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+import aiohttp
+
+from ai_admin.commands.docker_utils import json_dumps, json_loads
+from ai_admin.core.custom_exceptions import DockerConnectionError, DockerError
+
+logger = logging.getLogger(__name__)
+
+DOCKER_API_VERSION = "v1.43"
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+
+
+def _socket_path_from_env() -> Optional[str]:
+    """Resolve the daemon socket path, or None when DOCKER_HOST is not a socket."""
+    docker_host = os.getenv("DOCKER_HOST", "")
+    if not docker_host:
+        return DEFAULT_DOCKER_SOCKET
+    if docker_host.startswith("unix://"):
+        return docker_host[len("unix://"):]
+    return None
+
+
+def _context_from_env() -> str:
+    """Resolve the docker CLI context the way the CLI does.
+
+    DOCKER_HOST takes precedence over contexts; otherwise DOCKER_CONTEXT,
+    then currentContext from the CLI config file, are used.
+    """
+    if os.getenv("DOCKER_HOST"):
+        return "default"
+    context = os.getenv("DOCKER_CONTEXT")
+    if context:
+        return context
+
+    config_dir = os.getenv("DOCKER_CONFIG") or os.path.expanduser("~/.docker")
+    try:
+        with open(os.path.join(config_dir, "config.json"), "rb") as f:
+            return json_loads(f.read()).get("currentContext") or "default"
+    except (OSError, ValueError, AttributeError):
+        return "default"
+
+
+def _parse_api_version(version: str) -> Tuple[int, ...]:
+    """Turn an API version such as 'v1.43' or '1.43' into a comparable tuple."""
+    return tuple(int(part) for part in version.lstrip("v").split("."))
+
+
+def _tcp_host_from_env() -> Optional[str]:
+    """Resolve host:port from a tcp:// DOCKER_HOST, or None."""
+    docker_host = os.getenv("DOCKER_HOST", "")
+    if docker_host.startswith("tcp://"):
+        return docker_host[len("tcp://"):].rstrip("/")
+    return None
+
+
+def _tls_context_from_env() -> Optional[ssl.SSLContext]:
+    """Build the client TLS context the docker CLI would use, if any.
+
+    Follows the docker CLI conventions: TLS is enabled by DOCKER_TLS_VERIFY
+    and certificates are read from DOCKER_CERT_PATH (ca.pem, cert.pem,
+    key.pem), defaulting to ~/.docker.
+    """
+    if not os.getenv("DOCKER_TLS_VERIFY"):
+        return None
+
+    cert_path = os.getenv("DOCKER_CERT_PATH") or os.path.expanduser("~/.docker")
+    context = ssl.create_default_context(cafile=os.path.join(cert_path, "ca.pem"))
+    context.load_cert_chain(
+        os.path.join(cert_path, "cert.pem"), os.path.join(cert_path, "key.pem")
+    )
+    return context
+
+
+def api_path(template: str, *segments: str) -> str:
+    """Fill an API path template with percent-encoded segments.
+
+    Every segment is encoded with no safe characters, so a name cannot add
+    path levels or query parameters. Dot segments are rejected because
+    URL normalization would collapse them into a different endpoint.
+
+    Args:
+        template: API path with a '{}' placeholder per segment
+        *segments: Values for the placeholders
+
+    Returns:
+        API path ready to append to the version prefix
+
+    Raises:
+        DockerError: If a segment is empty, '.' or '..'
+    """
+    for segment in segments:
+        if segment in ("", ".", ".."):
+            raise DockerError(f"Invalid name for Docker API path: {segment!r}")
+    return template.format(*(quote(str(segment), safe="") for segment in segments))
+
+
+class DockerEngineClient:
+    """Docker Engine API client sharing one keep-alive session.
+
+    Talks to the local daemon socket, or to a tcp:// DOCKER_HOST (with the
+    docker CLI's TLS settings) so remote daemons also reuse one pooled
+    connection instead of a docker CLI process per call. The API version
+    is negotiated with the daemon on first connect.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        api_version: str = DOCKER_API_VERSION,
+        timeout: int = 30,
+    ):
+        """
+        Initialize Docker Engine client.
+
+        Args:
+            socket_path: Daemon socket path (defaults to DOCKER_HOST or
+                /var/run/docker.sock)
+            api_version: Engine API version prefix
+            timeout: Request timeout in seconds
+        """
+        # An explicit socket overrides the CLI context like 'docker -H' does
+        self.context = "default" if socket_path else _context_from_env()
+        self.socket_path = socket_path or _socket_path_from_env()
+        self.tcp_host = None if self.socket_path else _tcp_host_from_env()
+        self.api_version = api_version
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._base_url = "http://docker"
+        self._version_negotiated = False
+
+    @property
+    def available(self) -> bool:
+        """Whether the Engine API can be used instead of the docker CLI.
+
+        Not when a non-default docker context is active: its endpoint
+        (rootless, remote) is only known to the CLI, and API and CLI calls
+        must reach the same daemon.
+        """
+        if self.context != "default":
+            return False
+        if self.socket_path:
+            return os.path.exists(self.socket_path)
+        return bool(self.tcp_host)
+
+    async def connect(self) -> None:
+        """Open the shared session to the daemon."""
+        if self._session is None or self._session.closed:
+            if self.socket_path:
+                connector = aiohttp.UnixConnector(path=self.socket_path)
+                self._base_url = "http://docker"
+            else:
+                try:
+                    tls_context = _tls_context_from_env()
+                except (OSError, ssl.SSLError) as e:
+                    raise DockerConnectionError(f"Docker TLS setup failed: {e}")
+                connector = aiohttp.TCPConnector(ssl=tls_context or False)
+                scheme = "https" if tls_context else "http"
+                self._base_url = f"{scheme}://{self.tcp_host}"
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            logger.info(f"Connected to Docker Engine at {self._base_url}")
+        if not self._version_negotiated:
+            await self._negotiate_version()
+
+    async def _negotiate_version(self) -> None:
+        """Settle on an API version the daemon supports.
+
+        Daemons reject versions above their ApiVersion, and recent ones also
+        below their MinAPIVersion, so the requested version is clamped into
+        the range reported by the unversioned GET /version.
+        """
+        try:
+            async with self._session.get(f"{self._base_url}/version") as response:
+                payload = await response.read()
+        except aiohttp.ClientError as e:
+            raise DockerConnectionError(f"Docker API version check failed: {e}")
+        except asyncio.TimeoutError:
+            raise DockerConnectionError(
+                f"Docker API version check timed out after {self.timeout}s"
+            )
+        if response.status >= 400:
+            raise DockerConnectionError(
+                f"Docker API version check failed ({response.status})"
+            )
+
+        info = json_loads(payload)
+        version = _parse_api_version(self.api_version)
+        if info.get("ApiVersion"):
+            version = min(version, _parse_api_version(info["ApiVersion"]))
+        if info.get("MinAPIVersion"):
+            version = max(version, _parse_api_version(info["MinAPIVersion"]))
+        self.api_version = "v" + ".".join(str(part) for part in version)
+        self._version_negotiated = True
+        logger.info(f"Using Docker Engine API {self.api_version}")
+
+    async def disconnect(self) -> None:
+        """Close the shared session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+            logger.info("Disconnected from Docker Engine")
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, str]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        segments: Sequence[str] = (),
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Make a request to the Docker Engine API.
+
+        Args:
+            method: HTTP method
+            path: API path without version prefix, with a '{}' placeholder
+                per segment (e.g. '/networks/{}/connect')
+            params: Query parameters
+            body: JSON request body
+            segments: Path segments substituted into path, usually
+                user-supplied names; each is percent-encoded as a whole
+            timeout: Seconds allowed for this request, for daemon calls
+                that legitimately outlast the client timeout
+
+        Returns:
+            Decoded JSON response, or None for empty responses
+
+        Raises:
+            DockerError: If a segment is empty, '.' or '..'
+            DockerConnectionError: If the daemon is unreachable or the
+                request times out
+        """
+        await self.connect()
+        url = f"{self._base_url}/{self.api_version}{api_path(path, *segments)}"
+        if timeout is None:
+            timeout = self.timeout
+
+        try:
+            data = headers = None
+            if body is not None:
+                data = json_dumps(body)
+                headers = {"Content-Type": "application/json"}
+            async with self._session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                payload = await response.read()
+                if response.status >= 400:
+                    raise DockerError(
+                        f"Docker API {method} {path} failed "
+                        f"({response.status}): {payload.decode(errors='replace')}",
+                        details={"status": response.status},
+                    )
+                return json_loads(payload) if payload else None
+        except aiohttp.ClientError as e:
+            raise DockerConnectionError(f"Docker API request failed: {e}")
+        except asyncio.TimeoutError:
+            raise DockerConnectionError(
+                f"Docker API {method} {path} timed out after {timeout}s"
+            )
+
+
+_engine_client: Optional[DockerEngineClient] = None
+
+
+def get_engine_client() -> DockerEngineClient:
+    """Get the process-wide Docker Engine client."""
+    global _engine_client
+    if _engine_client is None:
+        _engine_client = DockerEngineClient()
+    return _engine_client
@@ -14,6 +14,14 @@ from ftplib import FTP, FTP_TLS, error_perm, error_temp
 from contextlib import contextmanager
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Bytes requested from the data connection per read during downloads
+DOWNLOAD_BLOCK_SIZE = 64 * 1024
+
+# Local write buffer for downloads; one write() syscall per this many bytes
+DOWNLOAD_WRITE_BUFFER = 1024 * 1024
+
 class FTPClient:
     """Enhanced FTP client with active/passive modes and FTPS support."""
 
@@ -209,7 +217,10 @@ class FTPClient:
         if not self.connected or not self.ftp:
             raise ConnectionError("Not connected to FTP server")
 
-        if not os.path.exists(local_path):
+        # One stat gives both existence and the size for progress tracking
+        try:
+            file_size = os.stat(local_path).st_size
+        except OSError:
             raise FileNotFoundError(f"Local file not found: {local_path}")
 
         try:
@@ -224,8 +235,6 @@ class FTPClient:
             if remote_exists and not overwrite and not resume:
                 raise FileExistsError(f"Remote file exists and overwrite=False: {remote_path}")
 
-            # Get file size for progress tracking
-            file_size = os.path.getsize(local_path)
             uploaded_size = 0
 
             if resume and remote_exists:
@@ -309,15 +318,20 @@ class FTPClient:
             except:
                 raise FileNotFoundError(f"Remote file not found: {remote_path}")
 
-            # Check local file
-            local_exists = os.path.exists(local_path)
+            # Check local file, one stat for both existence and size
+            try:
+                local_size = os.stat(local_path).st_size
+                local_exists = True
+            except FileNotFoundError:
+                local_size = 0
+                local_exists = False
             downloaded_size = 0
 
             if local_exists and not overwrite and not resume:
                 raise FileExistsError(f"Local file exists and overwrite=False: {local_path}")
 
             if resume and local_exists:
-                downloaded_size = os.path.getsize(local_path)
+                downloaded_size = local_size
                 if downloaded_size >= remote_size:
                     logger.info(f"File already fully downloaded: {local_path}")
                     return {
@@ -329,25 +343,31 @@ class FTPClient:
                         "resumed": True
                     }
 
-            # Download file
+            # Download file. Received blocks are collected in a large write
+            # buffer, so the local file sees one write() per
+            # DOWNLOAD_WRITE_BUFFER bytes instead of one per network block.
             mode = "ab" if resume and downloaded_size > 0 else "wb"
-            with open(local_path, mode) as local_file:
+            with open(local_path, mode, buffering=DOWNLOAD_WRITE_BUFFER) as local_file:
+                rest = None
                 if resume and downloaded_size > 0:
                     logger.info(f"Resuming download from byte {downloaded_size}")
+                    # For resume, retrbinary sends the REST command
+                    rest = downloaded_size
 
                 def download_callback(data: bytes) -> None:
                     nonlocal downloaded_size
+                    local_file.write(data)
                     downloaded_size += len(data)
                     if progress_callback:
                         progress = (downloaded_size / remote_size) * 100
                         progress_callback(progress, downloaded_size, remote_size)
 
-                if resume and downloaded_size > 0:
-                    # For resume, we need to use REST command
-                    self.ftp.voidcmd(f"REST {downloaded_size}")
-                    self.ftp.retrbinary(f"RETR {remote_path}", local_file.write, callback=download_callback)
-                else:
-                    self.ftp.retrbinary(f"RETR {remote_path}", local_file.write, callback=download_callback)
+                self.ftp.retrbinary(
+                    f"RETR {remote_path}",
+                    download_callback,
+                    blocksize=DOWNLOAD_BLOCK_SIZE,
+                    rest=rest,
+                )
 
             logger.info(f"Successfully downloaded {remote_path} to {local_path}")
             return {
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import logging
 import sys
@@ -22,6 +23,10 @@ from mcp_proxy_adapter.core.config.simple_config_validator import (  # type: ign
 )
 from mcp_proxy_adapter.core.server_engine import ServerEngineFactory  # type: ignore[import-untyped]
 
+from ai_admin.commands.http_utils import close_http_session
+from ai_admin.core.custom_exceptions import DockerConnectionError
+from ai_admin.docker import get_engine_client
+
 
 def _apply_global_config(
     config_path: Path, simple_model: Any, app_config: Dict[str, Any]
@@ -72,6 +77,55 @@ def _load_validate_merge(cfg_path: Path) -> Tuple[Dict[str, Any], Any]:
     return app_config, model
 
 
+def _install_event_loop(name: str) -> None:
+    """Select the asyncio event loop implementation for the server process.
+
+    Args:
+        name: ``"asyncio"`` for the stdlib loop or ``"uvloop"``.
+
+    Returns:
+        None
+    """
+    if name != "uvloop":
+        return
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        logging.warning("uvloop is not installed, using the default asyncio loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logging.info("Using uvloop event loop")
+
+
+def _register_docker_engine_lifecycle(app: Any) -> None:
+    """Open the shared Docker Engine session at startup; on shutdown close it
+    together with the shared HTTP session.
+
+    Args:
+        app: FastAPI application instance.
+
+    Returns:
+        None
+    """
+
+    async def _open_engine() -> None:
+        engine = get_engine_client()
+        if not engine.available:
+            logging.info("Docker Engine API not reachable, docker commands use the CLI")
+            return
+        try:
+            await engine.connect()
+        except DockerConnectionError as e:
+            logging.warning(f"Docker Engine connection failed: {e}")
+
+    async def _close_engine() -> None:
+        await get_engine_client().disconnect()
+        await close_http_session()
+
+    app.add_event_handler("startup", _open_engine)
+    app.add_event_handler("shutdown", _close_engine)
+
+
 def main() -> None:
     """Parse CLI, build FastAPI app via adapter, run Hypercorn (ServerEngineFactory).
 
@@ -87,7 +141,14 @@ def main() -> None:
     parser.add_argument(
         "--port", type=int, help="Bind port (overrides config server.port)"
     )
+    parser.add_argument(
+        "--event-loop",
+        choices=("asyncio", "uvloop"),
+        default="asyncio",
+        help="Event loop implementation (uvloop must be installed separately)",
+    )
     args = parser.parse_args()
+    _install_event_loop(args.event_loop)
 
     cfg_path = Path(args.config).expanduser().resolve()
     if not cfg_path.is_file():
@@ -111,6 +172,7 @@ def main() -> None:
         app_config=app_config,
         config_path=str(cfg_path),
     )
+    _register_docker_engine_lifecycle(app)
 
     host = str(app_config.get("server", {}).get("host", "127.0.0.1"))
     port = int(app_config.get("server", {}).get("port", 8060))
@@ -692,6 +692,14 @@ class QueueManager:
         filtered_tasks = [task for task in tasks if task.status == status]
         return [task.to_dict() for task in filtered_tasks]
 
+    async def get_pending_count(self) -> int:
+        """Get number of tasks waiting to start.
+
+        Returns:
+            Number of pending tasks
+        """
+        return await self.task_queue.pending_count()
+
     async def get_queue_stats(self) -> Dict[str, Any]:
         """Get queue statistics.
 
@@ -2,10 +2,15 @@
 
 from ai_admin.core.custom_exceptions import CustomError, NetworkError
 import asyncio
+import json
+import re
 
 from ..task import Task
 from ..task_error_code import TaskErrorCode
 
+# Classifies docker pull progress lines in a single pass
+_PULL_LINE_RE = re.compile(r"[Dd]igest: (?P<digest>\S+)|Pulled|Mounted")
+
 
 class DockerExecutor:
     """Universal task queue for managing any type of operations."""
@@ -330,7 +335,14 @@ class DockerExecutor:
             return
         task.update_progress(10, f"Starting pull of {full_image_name}")
         task.add_log(f"DEBUG: Task parameters: {params}")
-        cmd = ["docker", "pull", full_image_name]
+        # Quiet pulls skip per-layer progress; digest comes from image inspect
+        quiet = params.get("quiet")
+        if quiet is None:
+            quiet = True
+        cmd = ["docker", "pull"]
+        if quiet:
+            cmd.append("--quiet")
+        cmd.append(full_image_name)
         task.command = " ".join(cmd)
         logger.info(f"Executing command: {' '.join(cmd)}")
         task.add_log(f"DEBUG: Executing command: {' '.join(cmd)}")
@@ -339,23 +351,36 @@ class DockerExecutor:
                 *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
             )
             task.update_progress(25, "Downloading layers...")
-            stdout, stderr = await process.communicate()
+            # Classify progress lines as they arrive instead of buffering
+            # the whole pull log; stderr is drained concurrently
+            stderr_reader = asyncio.create_task(process.stderr.read())
+            digest = None
+            size_info = []
+            async for raw_line in process.stdout:
+                if quiet:
+                    continue
+                line = raw_line.decode("utf-8", errors="replace").strip()
+                match = _PULL_LINE_RE.search(line)
+                if match is None:
+                    continue
+                if match["digest"]:
+                    digest = match["digest"]
+                else:
+                    size_info.append(line)
+                    task.add_log(f"DEBUG: {line}")
+            stderr = await stderr_reader
+            await process.wait()
             logger.info(f"Process completed with return code: {process.returncode}")
             task.add_log(
                 f"DEBUG: Process completed with return code: {process.returncode}"
             )
             if process.returncode == 0:
                 task.update_progress(90, "Finalizing pull...")
-                output_lines = stdout.decode("utf-8").splitlines()
-                digest = None
-                size_info = []
-                for line in output_lines:
-                    if "digest:" in line:
-                        digest = line.split("digest: ")[-1].strip()
-                    elif "Pulled" in line or "Mounted" in line:
-                        size_info.append(line.strip())
+                if quiet:
+                    digest, size_info = await self._inspect_pulled_image(
+                        full_image_name
+                    )
                 logger.info(f"Pull completed successfully: {digest}")
-                task.add_log(f"DEBUG: STDOUT: {stdout.decode('utf-8')}")
                 security_adapter.audit_docker_operation(
                     DockerOperation.PULL, user_roles, operation_params, "executed"
                 )
@@ -412,6 +437,28 @@ class DockerExecutor:
             )
             task.fail(error_msg, TaskErrorCode.DOCKER_PULL_FAILED, {"error": str(e)})
 
+    async def _inspect_pulled_image(self, full_image_name: str) -> tuple:
+        """Read digest and size of a local image via docker image inspect."""
+        process = await asyncio.create_subprocess_exec(
+            "docker",
+            "image",
+            "inspect",
+            "--format",
+            "{{json .}}",
+            full_image_name,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await process.communicate()
+        if process.returncode != 0:
+            return None, []
+        info = json.loads(stdout)
+        repo_digests = info.get("RepoDigests") or []
+        digest = repo_digests[0].split("@", 1)[-1] if repo_digests else None
+        layers = (info.get("RootFS") or {}).get("Layers") or []
+        size_info = [f"Size: {info.get('Size', 0)} bytes, {len(layers)} layers"]
+        return digest, size_info
+
     async def _execute_docker_network_task(self, task: Task) -> None:
         """Execute Docker Network task."""
         import logging
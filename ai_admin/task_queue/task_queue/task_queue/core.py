@@ -87,6 +87,14 @@ class TaskQueueCore:
         """
         return [task for task in self._tasks.values() if task.status == status]
 
+    async def pending_count(self) -> int:
+        """Get number of tasks waiting to start.
+
+        Returns:
+            Length of the pending queue, without scanning all tasks
+        """
+        return len(self._pending_queue)
+
     async def get_tasks_by_type(self, task_type: TaskType) -> List[Task]:
         """Get tasks by type.
 
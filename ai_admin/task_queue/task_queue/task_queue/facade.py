@@ -39,6 +39,9 @@ class TaskQueue:
     async def get_tasks_by_status(self, status):
         return self.taskQueueCore.get_tasks_by_status(status)
 
+    async def pending_count(self):
+        return await self.taskQueueCore.pending_count()
+
     async def get_tasks_by_type(self, task_type):
         return self.taskQueueCore.get_tasks_by_type(task_type)
 
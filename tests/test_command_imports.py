@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Import smoke tests for commands.
+
+This module checks that command modules resolve their module-level
+imports, so a wrong import fails here instead of at server start.
+"""
+
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "ai_admin.commands.docker_pull_command",
+        "ai_admin.commands.ftp_delete_command",
+        "ai_admin.commands.ftp_download_command",
+        "ai_admin.commands.ftp_list_command",
+        "ai_admin.commands.ftp_upload_command",
+    ],
+)
+def test_command_module_imports(module_name):
+    """Test the command module can be imported."""
+    module = importlib.import_module(module_name)
+    assert module.QueueManager is not None
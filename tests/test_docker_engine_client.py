@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the Docker Engine API client.
+
+This module contains unit tests for building Engine API paths from
+user-supplied names and for honouring the docker CLI context.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from ai_admin.core.custom_exceptions import DockerConnectionError, DockerError
+from ai_admin.docker.engine_client import DockerEngineClient, api_path
+
+
+class TestApiPath:
+    """Test cases for api_path."""
+
+    def test_plain_name(self):
+        """Test a plain name is substituted unchanged."""
+        path = api_path("/networks/{}/connect", "backend")
+        assert path == "/networks/backend/connect"
+
+    def test_separators_are_encoded(self):
+        """Test slashes and query characters cannot leave the segment."""
+        assert api_path("/networks/{}", "../containers/foo") == (
+            "/networks/..%2Fcontainers%2Ffoo"
+        )
+        assert api_path("/containers/{}", "web?force=1") == (
+            "/containers/web%3Fforce%3D1"
+        )
+
+    @pytest.mark.parametrize("segment", ["", ".", ".."])
+    def test_dot_segments_rejected(self, segment):
+        """Test segments that URL normalization would collapse are refused."""
+        with pytest.raises(DockerError):
+            api_path("/volumes/{}", segment)
+
+
+class TestDockerContext:
+    """Test cases for choosing between the Engine API and the CLI."""
+
+    def test_non_default_context_uses_cli(self, monkeypatch, tmp_path):
+        """Test an active CLI context disables the Engine API."""
+        monkeypatch.delenv("DOCKER_HOST", raising=False)
+        monkeypatch.setenv("DOCKER_CONFIG", str(tmp_path))
+        (tmp_path / "config.json").write_text('{"currentContext": "rootless"}')
+
+        assert DockerEngineClient().available is False
+
+    def test_docker_host_overrides_context(self, monkeypatch):
+        """Test DOCKER_HOST wins over DOCKER_CONTEXT like in the CLI."""
+        monkeypatch.setenv("DOCKER_HOST", "tcp://127.0.0.1:2375")
+        monkeypatch.setenv("DOCKER_CONTEXT", "remote")
+
+        assert DockerEngineClient().available is True
+
+
+class TestRequestTimeout:
+    """Test cases for request timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_connection_error(self):
+        """Test a timed out request surfaces as a Docker error."""
+        client = DockerEngineClient(socket_path="/var/run/docker.sock")
+        client._session = Mock(closed=False)
+        client._session.request = Mock(side_effect=asyncio.TimeoutError)
+        client._version_negotiated = True
+
+        with pytest.raises(DockerConnectionError, match="timed out after 70s"):
+            await client.request(
+                "POST", "/containers/{}/stop", segments=("web",), timeout=70
+            )
@@ -10,10 +10,12 @@ This module contains unit tests for the new Docker image commands:
 
 import pytest
 import asyncio
+import aiohttp
 from unittest.mock import Mock, patch, AsyncMock
 from typing import Dict, Any
 
 from ai_admin.commands.docker_hub_images_command import DockerHubImagesCommand
+from ai_admin.commands.docker_utils import DOCKER_HUB_API
 from ai_admin.commands.docker_hub_image_info_command import DockerHubImageInfoCommand
 from ai_admin.commands.docker_images_compare_command import DockerImagesCompareCommand
 from mcp_proxy_adapter.commands.result import SuccessResult, ErrorResult
@@ -30,82 +32,90 @@ class TestDockerHubImagesCommand:
     @pytest.mark.asyncio
     async def test_execute_search_query(self, command):
         """Test executing search query."""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "count": 1,
-                "results": [{
-                    "repo_name": "library/nginx",
-                    "name": "nginx",
-                    "short_description": "Official nginx image",
-                    "is_official": True,
-                    "star_count": 15000,
-                    "pull_count": 1000000,
-                    "last_updated": "2024-01-01T12:00:00Z"
-                }]
-            }
-            mock_response.url = "https://hub.docker.com/v2/search/repositories/"
-            mock_get.return_value = mock_response
-            
+        page = {
+            "count": 1,
+            "results": [{
+                "name": "nginx",
+                "namespace": "library",
+                "description": "Official nginx image",
+                "is_official": True,
+                "star_count": 15000,
+                "pull_count": 1000000,
+                "last_updated": "2024-01-01T12:00:00Z"
+            }]
+        }
+        with patch.object(
+            DockerHubImagesCommand, "_fetch_page", AsyncMock(return_value=page)
+        ) as mock_fetch:
             result = await command.execute(query="nginx", limit=5)
-            
+
             assert isinstance(result, SuccessResult)
-            assert result.data["status"] == "success"
             assert result.data["query"] == "nginx"
-            assert result.data["results_count"] == 1
-            assert len(result.data["results"]) == 1
-            assert result.data["results"][0]["name"] == "library/nginx"
-    
+            assert result.data["count"] == 1
+            assert result.data["images"][0]["name"] == "nginx"
+            api_url, params, page_number = mock_fetch.call_args.args
+            assert api_url.endswith("/search/repositories/")
+            assert params["q"] == "nginx"
+            assert page_number == 1
+
     @pytest.mark.asyncio
     async def test_execute_with_username(self, command):
         """Test executing with username parameter."""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "count": 2,
-                "results": [
-                    {"repo_name": "library/nginx", "name": "nginx"},
-                    {"repo_name": "library/ubuntu", "name": "ubuntu"}
-                ]
-            }
-            mock_response.url = "https://hub.docker.com/v2/repositories/library/"
-            mock_get.return_value = mock_response
-            
+        page = {
+            "count": 2,
+            "results": [
+                {"name": "nginx", "namespace": "library"},
+                {"name": "ubuntu", "namespace": "library"}
+            ]
+        }
+        with patch.object(
+            DockerHubImagesCommand, "_fetch_page", AsyncMock(return_value=page)
+        ) as mock_fetch:
             result = await command.execute(username="library", limit=10)
-            
+
             assert isinstance(result, SuccessResult)
             assert result.data["username"] == "library"
-            assert result.data["results_count"] == 2
-    
+            assert result.data["count"] == 2
+            assert mock_fetch.call_args.args[0].endswith("/repositories/library/")
+
     @pytest.mark.asyncio
     async def test_execute_api_error(self, command):
         """Test handling API errors."""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_response.text = "Not found"
-            mock_response.url = "https://hub.docker.com/v2/search/repositories/"
-            mock_get.return_value = mock_response
-            
+        error = aiohttp.ClientResponseError(
+            request_info=Mock(real_url=f"{DOCKER_HUB_API}/search/repositories/"),
+            history=(),
+            status=404,
+            message="Not Found",
+        )
+        with patch.object(
+            DockerHubImagesCommand, "_fetch_page", AsyncMock(side_effect=error)
+        ):
             result = await command.execute(query="nonexistent")
-            
+
             assert isinstance(result, ErrorResult)
-            assert result.code == "HUB_IMAGES_ERROR"
             assert "404" in result.message
-    
+
     @pytest.mark.asyncio
     async def test_execute_network_error(self, command):
         """Test handling network errors."""
-        with patch('requests.get') as mock_get:
-            mock_get.side_effect = Exception("Network error")
-            
+        error = aiohttp.ClientConnectionError("Network error")
+        with patch.object(
+            DockerHubImagesCommand, "_fetch_page", AsyncMock(side_effect=error)
+        ):
             result = await command.execute(query="nginx")
-            
+
             assert isinstance(result, ErrorResult)
-            assert result.code == "INTERNAL_ERROR"
-    
+            assert "Network error" in result.message
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_zero_limit(self, command):
+        """Test a limit below 1 is refused before Docker Hub is queried."""
+        with patch.object(DockerHubImagesCommand, "_fetch_page") as mock_fetch:
+            result = await command.execute(query="nginx", limit=0)
+
+            assert isinstance(result, ErrorResult)
+            mock_fetch.assert_not_called()
+
     def test_get_schema(self, command):
         """Test schema generation."""
         schema = command.get_schema()
@@ -376,30 +386,23 @@ class TestIntegration:
         hub_images_cmd = DockerHubImagesCommand()
         info_cmd = DockerHubImageInfoCommand()
         
-        with patch('requests.get') as mock_get:
-            # Mock search response
-            search_response = Mock()
-            search_response.status_code = 200
-            search_response.json.return_value = {
-                "count": 1,
-                "results": [{
-                    "repo_name": "library/nginx",
-                    "name": "nginx",
-                    "short_description": "Official nginx image"
-                }]
-            }
-            search_response.url = "https://hub.docker.com/v2/search/repositories/"
-            
+        search_page = {
+            "count": 1,
+            "results": [{
+                "name": "nginx",
+                "namespace": "library",
+                "description": "Official nginx image"
+            }]
+        }
+        with patch.object(
+            DockerHubImagesCommand, "_fetch_page", AsyncMock(return_value=search_page)
+        ), patch('requests.get') as mock_get:
             # Mock info response
             info_response = Mock()
             info_response.status_code = 200
-            info_response.json.return_value = {
-                "name": "nginx",
-                "full_name": "library/nginx"
-            }
-            
-            mock_get.side_effect = [search_response, info_response]
-            
+            info_response.content = b'{"name": "nginx", "namespace": "library"}'
+            mock_get.return_value = info_response
+
             # Search for images
             search_result = await hub_images_cmd.execute(query="nginx", limit=1)
             assert isinstance(search_result, SuccessResult)
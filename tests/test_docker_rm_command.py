@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the docker_rm command.
+
+This module contains unit tests for removing several containers through
+the Docker Engine API when some of them fail.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from ai_admin.commands.docker_rm_command import DockerRmCommand
+from ai_admin.core.custom_exceptions import CustomError, DockerError
+
+
+def _engine(failing):
+    """Create an engine mock whose DELETE fails for the given names."""
+    engine = Mock()
+    engine.available = True
+
+    async def request(method, path, params=None, body=None, segments=()):
+        if segments[0] in failing:
+            raise DockerError(f"No such container: {segments[0]}")
+
+    engine.request = AsyncMock(side_effect=request)
+    return engine
+
+
+class TestDockerRmCommand:
+    """Test cases for DockerRmCommand."""
+
+    @pytest.fixture
+    def command(self):
+        """Create command instance."""
+        return DockerRmCommand()
+
+    @pytest.mark.asyncio
+    async def test_partial_removal_reported(self, command):
+        """Test removed and failed containers are both reported."""
+        with patch(
+            "ai_admin.commands.docker_rm_command.get_engine_client",
+            return_value=_engine({"missing"}),
+        ):
+            result = await command._remove_container(
+                container_name=["web", "missing", "db"]
+            )
+
+        assert result["status"] == "partial"
+        assert result["removed"] == ["web", "db"]
+        assert list(result["failed"]) == ["missing"]
+
+    @pytest.mark.asyncio
+    async def test_all_failed_raises(self, command):
+        """Test an error is raised when no container was removed."""
+        with patch(
+            "ai_admin.commands.docker_rm_command.get_engine_client",
+            return_value=_engine({"web"}),
+        ):
+            with pytest.raises(CustomError):
+                await command._remove_container(container_name="web")
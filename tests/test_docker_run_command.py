@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for the docker_run command.
+
+This module contains unit tests for turning -p port mappings into
+Docker Engine API port bindings.
+"""
+
+from ai_admin.commands.docker_run_command import (
+    _port_bindings,
+    _validate_run_params,
+)
+
+
+class TestPortBindings:
+    """Test cases for _port_bindings."""
+
+    def test_plain_port(self):
+        """Test a plain mapping binds on all interfaces over tcp."""
+        assert _port_bindings({"8080": "80"}) == {
+            "80/tcp": [{"HostIp": "", "HostPort": "8080"}]
+        }
+
+    def test_host_ip_is_split_out(self):
+        """Test the host IP goes to HostIp instead of HostPort."""
+        assert _port_bindings({"127.0.0.1:8080": "80/udp"}) == {
+            "80/udp": [{"HostIp": "127.0.0.1", "HostPort": "8080"}]
+        }
+        assert _port_bindings({"[::1]:8080": "80"}) == {
+            "80/tcp": [{"HostIp": "::1", "HostPort": "8080"}]
+        }
+
+    def test_ranges_are_expanded(self):
+        """Test equal-length ranges bind port by port."""
+        assert _port_bindings({"8000-8001": "9000-9001"}) == {
+            "9000/tcp": [{"HostIp": "", "HostPort": "8000"}],
+            "9001/tcp": [{"HostIp": "", "HostPort": "8001"}],
+        }
+
+    def test_host_range_for_single_port(self):
+        """Test a host range for one container port is left to the daemon."""
+        assert _port_bindings({"8000-8010": "80"}) == {
+            "80/tcp": [{"HostIp": "", "HostPort": "8000-8010"}]
+        }
+
+    def test_mismatched_ranges_rejected(self):
+        """Test a container range needs a host range of the same length."""
+        error = _validate_run_params({"8000": "9000-9001"}, None, None)
+        assert error.startswith("Port ranges do not match")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the git_add command.
+
+This module contains unit tests for coalescing concurrent 'git add'
+calls into one git process.
+"""
+
+import asyncio
+import shutil
+import subprocess
+
+import pytest
+
+from ai_admin.commands.git_add_command import GitAddCommand
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not found")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Create an empty repository with three untracked files."""
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_text(name)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _staged(repo):
+    """Return the paths staged in repo."""
+    result = subprocess.run(
+        ["git", "diff", "--cached", "--name-only"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestGitAddCoalescing:
+    """Test cases for GitAddCommand._add_coalesced."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_adds_share_one_batch(self, repo):
+        """Test concurrent callers are all staged and see their own paths."""
+        first, second = await asyncio.gather(
+            GitAddCommand._add_coalesced(["a"]),
+            GitAddCommand._add_coalesced(["b"]),
+        )
+
+        assert first[0] == 0 and second[0] == 0
+        assert first[3] == ["git", "add", "--", "a"]
+        assert second[3] == ["git", "add", "--", "b"]
+        assert _staged(repo) == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_bad_path_only_fails_its_caller(self, repo):
+        """Test a pathspec typo does not fail other callers in the batch."""
+        good, bad, other = await asyncio.gather(
+            GitAddCommand._add_coalesced(["a", "b"]),
+            GitAddCommand._add_coalesced(["nonexistent"]),
+            GitAddCommand._add_coalesced(["c"]),
+        )
+
+        assert good[0] == 0 and other[0] == 0
+        assert bad[0] != 0
+        assert "nonexistent" in bad[2]
+        assert "nonexistent" not in good[2] + other[2]
+        assert _staged(repo) == {"a", "b", "c"}